@@ -0,0 +1 @@
+from iglsynth.benchmark.generators import *
@@ -0,0 +1,170 @@
+"""
+iglsynth: generators.py
+
+License goes here...
+"""
+
+import time
+import numpy as np
+from collections import namedtuple
+from iglsynth.game.game import *
+
+
+GameData = namedtuple("GameData", ["num_vertices", "edges", "turn", "is_final"])
+GameData.__doc__ = """
+Raw data of a turn-based game graph.
+
+:param num_vertices: Number of vertices.
+:param edges: An ``(m, 2)`` integer array, whose rows are (source, target).
+:param turn: An integer array with ID of player (1 or 2) who plays at every vertex.
+:param is_final: A boolean array marking final vertices.
+"""
+
+
+def random_game(num_vertices: int, degree: int = 3, final_ratio: float = 0.05, seed: int = None) -> GameData:
+    """
+    Generates a game graph, in which every vertex has ``degree`` successors chosen uniformly at random. Turns are
+    chosen uniformly at random and every vertex is final with probability ``final_ratio``.
+
+    :param num_vertices: Number of vertices.
+    :param degree: Number of successors of every vertex.
+    :param final_ratio: Probability of a vertex to be final.
+    :param seed: Seed of random number generator.
+    """
+    assert num_vertices > 0, f"Required, num_vertices > 0. Received, num_vertices = {num_vertices}."
+    rng = np.random.RandomState(seed)
+    sources = np.repeat(np.arange(num_vertices), degree)
+    targets = rng.randint(0, num_vertices, size=len(sources))
+    turn = rng.randint(1, 3, size=num_vertices)
+    is_final = rng.random_sample(num_vertices) < final_ratio
+    return GameData(num_vertices, np.column_stack((sources, targets)), turn, is_final)
+
+
+def grid_game(num_vertices: int, final_ratio: float = 0.01, seed: int = None) -> GameData:
+    """
+    Generates a gridworld game on a square grid of about ``num_vertices`` cells. From every cell, the player who plays
+    at it may move to any of its 4 neighboring cells. Turns alternate as on a checkerboard, hence the players move
+    alternately. Every cell is final with probability ``final_ratio``.
+
+    :param num_vertices: Approximate number of vertices. The grid has ``floor(sqrt(num_vertices)) ** 2`` cells.
+    :param final_ratio: Probability of a cell to be final.
+    :param seed: Seed of random number generator.
+    """
+    assert num_vertices > 0, f"Required, num_vertices > 0. Received, num_vertices = {num_vertices}."
+    rng = np.random.RandomState(seed)
+    side = int(np.sqrt(num_vertices))
+    rows, cols = np.divmod(np.arange(side * side), side)
+
+    edges = []
+    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        valid = (rows + dr >= 0) & (rows + dr < side) & (cols + dc >= 0) & (cols + dc < side)
+        sources = np.flatnonzero(valid)
+        edges.append(np.column_stack((sources, sources + dr * side + dc)))
+
+    edges = np.concatenate(edges)
+    edges = edges[np.argsort(edges[:, 0], kind="stable")]
+    turn = 1 + (rows + cols) % 2
+    is_final = rng.random_sample(side * side) < final_ratio
+    return GameData(side * side, edges, turn, is_final)
+
+
+def layered_game(num_vertices: int, width: int = 100, degree: int = 3, seed: int = None) -> GameData:
+    """
+    Generates a game graph, whose vertices are arranged in layers of ``width`` vertices. Every vertex has ``degree``
+    successors chosen uniformly at random in the next layer. The vertices of last layer are final and have a
+    self-loop. Turns alternate between layers.
+
+    :param num_vertices: Approximate number of vertices. The graph has ``ceil(num_vertices / width)`` layers.
+    :param width: Number of vertices in a layer.
+    :param degree: Number of successors of every vertex.
+    :param seed: Seed of random number generator.
+    """
+    assert num_vertices > 0, f"Required, num_vertices > 0. Received, num_vertices = {num_vertices}."
+    rng = np.random.RandomState(seed)
+    width = min(width, num_vertices)
+    num_layers = -(-num_vertices // width)
+    n = num_layers * width
+    layer = np.arange(n) // width
+
+    inner = np.arange(n - width)
+    sources = np.repeat(inner, degree)
+    targets = (layer[sources] + 1) * width + rng.randint(0, width, size=len(sources))
+    last = np.arange(n - width, n)
+
+    edges = np.column_stack((np.concatenate((sources, last)), np.concatenate((targets, last))))
+    turn = 1 + layer % 2
+    is_final = layer == num_layers - 1
+    return GameData(n, edges, turn, is_final)
+
+
+def adversarial_game(num_vertices: int, seed: int = None) -> GameData:
+    """
+    Generates a worst-case game for naive attractor computation. The vertices form a chain ``n-1 -> ... -> 1 -> 0``
+    ending in the only final vertex 0. Every player 2 vertex additionally has an edge two steps down the chain.
+    Every vertex is won by player 1, but only one vertex is added to the attractor in every iteration. Hence, a
+    fixed-point computation, which recomputes the predecessors of complete winning region in every iteration,
+    takes quadratic time.
+
+    :param num_vertices: Number of vertices.
+    :param seed: Unused. The game is deterministic.
+    """
+    assert num_vertices > 0, f"Required, num_vertices > 0. Received, num_vertices = {num_vertices}."
+    vertices = np.arange(num_vertices)
+    turn = 1 + vertices % 2
+
+    chain = np.column_stack((vertices[1:], vertices[:-1]))
+    skip = vertices[(turn == 2) & (vertices >= 2)]
+    edges = np.concatenate((chain, np.column_stack((skip, skip - 2)), [[0, 0]]))
+    edges = edges[np.argsort(edges[:, 0], kind="stable")]
+
+    is_final = vertices == 0
+    return GameData(num_vertices, edges, turn, is_final)
+
+
+GENERATORS = {"random": random_game, "grid": grid_game, "layered": layered_game, "adversarial": adversarial_game}
+
+
+def generate(name: str, num_vertices: int, seed: int = None) -> GameData:
+    """
+    Generates a game graph using one of the :data:`GENERATORS`.
+
+    :param name: Name of generator.
+    :param num_vertices: (Approximate) number of vertices.
+    :param seed: Seed of random number generator.
+
+    :raises ValueError: If the generator name is invalid.
+    """
+    if name not in GENERATORS:
+        raise ValueError(f"Given generator: {name} is invalid. Generators must be in {list(GENERATORS.keys())}.")
+
+    return GENERATORS[name](num_vertices=num_vertices, seed=seed)
+
+
+def to_game(data: GameData, times: dict = None, backend: str = None) -> Game:
+    """
+    Constructs a turn-based :class:`Game <iglsynth.game.game.Game>` from given game data.
+
+    :param data: A :class:`GameData` object.
+    :param times: (Optional) A dictionary, in which the wall time (in seconds) of every construction step
+        (``add_vertices``, ``add_edges``, ``set_properties``) is recorded.
+    :param backend: (Optional) Backend of game graph. Default: :data:`Graph.DEFAULT_BACKEND`.
+    """
+    times = dict() if times is None else times
+
+    start = time.perf_counter()
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool")], eprops=[("act", "int")], backend=backend)
+    graph.add_vertices(num=data.num_vertices)
+    times["add_vertices"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph.add_edge_array(edges=data.edges)
+    times["add_edges"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph.vprop("turn")[:] = data.turn
+    graph.vprop("is_final")[:] = data.is_final
+    times["set_properties"] = time.perf_counter() - start
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    return game
@@ -0,0 +1,115 @@
+"""
+iglsynth: run.py
+
+License goes here...
+
+Times the construction of game graph and :class:`ZielonkaSolver <iglsynth.solver.zielonka.ZielonkaSolver>` on
+generated games, and writes the results as JSON. Usage::
+
+    python -m iglsynth.benchmark.run --generators random grid --sizes 1000 100000 --output results.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import time
+from typing import Iterable
+from iglsynth.benchmark.generators import *
+from iglsynth.solver.zielonka import ZielonkaSolver
+from iglsynth.version import __version__
+
+
+def benchmark(generator: str, num_vertices: int, seed: int = 0, method: str = "worklist", repeat: int = 1,
+              backend: str = None) -> dict:
+    """
+    Times the construction of a generated game and the solver run on it. Every step is timed ``repeat`` times, and
+    the minimum wall time (in seconds) is reported.
+
+    :param generator: Name of generator. See :data:`GENERATORS <iglsynth.benchmark.generators.GENERATORS>`.
+    :param num_vertices: (Approximate) number of vertices.
+    :param seed: Seed of generator.
+    :param method: Method of :class:`ZielonkaSolver <iglsynth.solver.zielonka.ZielonkaSolver>`.
+    :param repeat: Number of repetitions.
+    :param backend: (Optional) Backend of game graph. Default: :data:`Graph.DEFAULT_BACKEND`.
+
+    :return: A dictionary with size of game and timings of every step.
+    """
+    assert repeat > 0, f"Required, repeat > 0. Received, repeat = {repeat}."
+    data = generate(generator, num_vertices=num_vertices, seed=seed)
+    best = dict()
+    for _ in range(repeat):
+        times = dict()
+        game = to_game(data, times=times, backend=backend)
+
+        solver = ZielonkaSolver(game=game)
+        solver.configure(method=method)
+        start = time.perf_counter()
+        solver.run()
+        times["solve"] = time.perf_counter() - start
+
+        for step, value in times.items():
+            best[step] = min(best.get(step, value), value)
+
+    return {"generator": generator, "seed": seed, "method": method, "backend": game.graph.backend,
+            "num_vertices": data.num_vertices, "num_edges": len(data.edges), "num_win1": len(solver.win1),
+            "times": best}
+
+
+def _commit():
+    """ Returns the git commit of working directory, or None if it is not available. """
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(generators: Iterable[str], sizes: Iterable[int], seed: int = 0, method: str = "worklist",
+        repeat: int = 1, output: str = None, backend: str = None) -> dict:
+    """
+    Runs :func:`benchmark` for every combination of generator and size.
+
+    :param generators: Names of generators.
+    :param sizes: (Approximate) numbers of vertices.
+    :param seed: Seed of generators.
+    :param method: Method of :class:`ZielonkaSolver <iglsynth.solver.zielonka.ZielonkaSolver>`.
+    :param repeat: Number of repetitions of every benchmark.
+    :param output: (Optional) Name of JSON file to write the results to.
+    :param backend: (Optional) Backend of game graphs. Default: :data:`Graph.DEFAULT_BACKEND`.
+
+    :return: A dictionary with environment information and results of all benchmarks.
+    """
+    results = {"version": __version__, "commit": _commit(), "python": platform.python_version(),
+               "machine": platform.machine(), "benchmarks": []}
+
+    for generator in generators:
+        for size in sizes:
+            results["benchmarks"].append(benchmark(generator, size, seed=seed, method=method, repeat=repeat,
+                                                   backend=backend))
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return results
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark game graph construction and ZielonkaSolver.")
+    parser.add_argument("--generators", nargs="+", default=list(GENERATORS.keys()), choices=list(GENERATORS.keys()))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000, 100000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--method", default="worklist")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--backend", default=None, choices=list(Graph.BACKENDS))
+    parser.add_argument("--output", default=None, help="Name of JSON file. Default: print to stdout.")
+    args = parser.parse_args(args)
+
+    results = run(args.generators, args.sizes, seed=args.seed, method=args.method, repeat=args.repeat,
+                  output=args.output, backend=args.backend)
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
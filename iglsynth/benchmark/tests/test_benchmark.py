@@ -0,0 +1,49 @@
+import json
+import numpy as np
+import pytest
+from iglsynth.benchmark import *
+from iglsynth.benchmark.run import main
+from iglsynth.solver.zielonka import ZielonkaSolver
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+
+def test_generators():
+    for name in GENERATORS:
+        data = generate(name, num_vertices=1000, seed=0)
+        assert 0 < data.num_vertices <= 1000
+        assert len(data.turn) == len(data.is_final) == data.num_vertices
+        assert data.edges.shape[1] == 2
+        assert data.edges.min() >= 0 and data.edges.max() < data.num_vertices
+        assert set(np.unique(data.turn)) <= {1, 2}
+
+        # Every vertex has a successor.
+        assert len(np.unique(data.edges[:, 0])) == data.num_vertices
+
+        # Generators are deterministic for a given seed.
+        other = generate(name, num_vertices=1000, seed=0)
+        assert np.array_equal(data.edges, other.edges)
+        assert np.array_equal(data.is_final, other.is_final)
+
+    with pytest.raises(ValueError):
+        generate("unknown", num_vertices=10)
+
+
+def test_adversarial_game():
+    solver = ZielonkaSolver(game=to_game(adversarial_game(num_vertices=50)))
+    solver.configure(method="array")
+    solver.instrument()
+    solver.run()
+    assert solver.win1 == set(range(50))
+    assert solver.stats.num_iterations == 50
+
+
+def test_run(tmp_path):
+    filename = str(tmp_path / "results.json")
+    main(["--generators", "random", "layered", "--sizes", "100", "200", "--output", filename])
+
+    with open(filename) as f:
+        results = json.load(f)
+
+    assert len(results["benchmarks"]) == 4
+    for result in results["benchmarks"]:
+        assert set(result["times"].keys()) == {"add_vertices", "add_edges", "set_properties", "solve"}
@@ -6,6 +6,8 @@ License goes here...
 
 import abc
 from typing import Callable
+from iglsynth.util import storage
+from iglsynth.util.graph import Graph
 
 CONCURRENT = "Concurrent"
 TURN_BASED = "Turn-based"
@@ -26,6 +28,8 @@ class IGame(abc.ABC):
         self._model = None
         self._acc = None
         self._graph = None
+        self._states = None
+        self._init = None
 
     # ------------------------------------------------------------------------------------------------------------------
     # PROPERTIES
@@ -59,6 +63,22 @@ class IGame(abc.ABC):
         """ Returns the game graph. """
         return self._graph
 
+    @property
+    def states(self):
+        """
+        Returns the list of product states indexed by vertex id, if the game graph is constructed by :meth:`construct`.
+        Otherwise, returns None.
+        """
+        return self._states
+
+    @property
+    def init(self):
+        """
+        Returns an integer array of vertex ids of initial states, if the game graph is constructed by
+        :meth:`construct`. Otherwise, returns None.
+        """
+        return self._init
+
     # ------------------------------------------------------------------------------------------------------------------
     # PRIVATE FUNCTIONS (ABSTRACT)
     # ------------------------------------------------------------------------------------------------------------------
@@ -149,10 +169,47 @@ class IGame(abc.ABC):
     # PUBLIC FUNCTIONS (IMPLEMENTED)
     # ------------------------------------------------------------------------------------------------------------------
     def save(self, filename: str, save_graphs: bool = True):
-        pass
+        """
+        Saves the game to a binary file. See :mod:`iglsynth.util.storage`.
+
+        :param filename: Name of file.
+        :param save_graphs: Should the game graph be saved? If False, only the metadata of game is saved.
+            Default: True.
+        """
+        header = {"game": {"type": type(self).__name__, "kind": self.kind}}
+        arrays = dict()
+        if save_graphs and self.graph is not None:
+            header["graph"], arrays = self.graph._to_arrays()
+
+        storage.write(filename, header=header, arrays=arrays)
 
     def load(self, filename: str, load_graphs: bool = True):
-        pass
+        """
+        Loads a game saved by :meth:`save`. The arrays of game graph are memory-mapped while constructing the graph.
+
+        :param filename: Name of file.
+        :param load_graphs: Should the game graph be loaded? If False, only the metadata of game is loaded, and
+            :attr:`graph` is None. Default: True.
+
+        :raises ValueError: If the file does not contain a game of same type as this object.
+        """
+        header, _ = storage.read_header(filename)
+        saved = header.get("game", dict()).get("type")
+        if saved != type(self).__name__:
+            raise ValueError(f"File {filename} contains {'a ' + saved if saved else 'no game'}, "
+                             f"which cannot be loaded into {type(self).__name__}.")
+
+        if not load_graphs:
+            self._kind = header["game"]["kind"]
+            self._graph = None
+            return
+
+        header, arrays = storage.read(filename, mmap=True)
+        self._kind = header["game"]["kind"]
+        if "graph" in header:
+            self.define(graph=Graph._from_arrays(header["graph"], arrays))
+        else:
+            self._graph = None
 
 
 class Kripke(abc.ABC):
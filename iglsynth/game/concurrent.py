@@ -0,0 +1,46 @@
+"""
+iglsynth: concurrent.py
+
+License goes here...
+
+Joint actions of concurrent games. In a concurrent game, both players choose an action at every vertex
+simultaneously, and every edge of game graph is labeled by the joint action, which leads to its target. The joint
+action is stored in edge property ``joint`` of type ``int``, next to edge property ``act``, by packing the action id
+of player 1 into the upper 32 bits and the action id of player 2 into the lower 32 bits.
+"""
+
+import numpy as np
+
+# Number of bits of action id of player 2 in a joint action.
+ACTION_BITS = 32
+
+
+def pack_actions(a1, a2) -> np.ndarray:
+    """
+    Packs the action ids of player 1 and player 2 into joint actions.
+
+    :param a1: An integer or an array of action ids of player 1.
+    :param a2: An integer or an array of action ids of player 2.
+
+    :return: An ``int64`` array of joint actions.
+
+    :raises ValueError: If an action id is not in ``[0, 2 ** 31)``.
+    """
+    a1 = np.asarray(a1, dtype=np.int64)
+    a2 = np.asarray(a2, dtype=np.int64)
+    for name, actions in (("a1", a1), ("a2", a2)):
+        if actions.size > 0 and (actions.min() < 0 or actions.max() >= 2 ** (ACTION_BITS - 1)):
+            raise ValueError(f"Action ids {name} must be in [0, 2 ** {ACTION_BITS - 1}).")
+
+    return (a1 << ACTION_BITS) | a2
+
+
+def unpack_actions(joint):
+    """
+    Unpacks joint actions into the action ids of player 1 and player 2.
+
+    :param joint: An integer or an array of joint actions.
+    :return: A 2-tuple of ``int64`` arrays (a1, a2).
+    """
+    joint = np.asarray(joint, dtype=np.int64)
+    return joint >> ACTION_BITS, joint & ((1 << ACTION_BITS) - 1)
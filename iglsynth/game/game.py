@@ -4,10 +4,34 @@ iglsynth: game.py
 License goes here...
 """
 
+import sys
+import numpy as np
+from typing import Iterable
 from iglsynth.util.graph import *
 from iglsynth.game.bases import *
 
 
+class ValidationReport(dict):
+    """
+    Report of :meth:`Game.validate`. It is a dictionary {invariant: offending items}, where
+
+    * ``"properties"``: Names of required properties, which are missing or have wrong type.
+    * ``"dead_ends"``: Vertex ids of vertices without outgoing edges. (strict)
+    * ``"turn"``: Vertex ids of vertices, whose ``turn`` is neither 1 nor 2. Only for turn-based games. (strict)
+    * ``"duplicate_act"``: Edge indices of edges, whose ``act`` equals the ``act`` of another outgoing edge of same
+      vertex. (strict)
+    """
+
+    def __repr__(self):
+        counts = ", ".join(f"{name}={len(items)}" for name, items in self.items())
+        return f"ValidationReport(valid={self.is_valid}, {counts})"
+
+    @property
+    def is_valid(self) -> bool:
+        """ Returns True if no invariant is violated. """
+        return all(len(items) == 0 for items in self.values())
+
+
 class Game(IGame):
     """
     Represents a deterministic two-player game. The game may be concurrent or turn-based.
@@ -71,6 +95,8 @@ class Game(IGame):
         self._model = None
         self._acc = None
         self._graph = graph
+        self._states = None
+        self._init = None
 
     def define(self, graph: Graph = None, model: Kripke = None, p1: Player = None, p2: Player = None,
                rp: 'Distribution' = None, acc1: 'Acceptance' = None, acc2: 'Acceptance' = None):
@@ -128,13 +154,174 @@ class Game(IGame):
         else:
             raise AttributeError('Game cannot be defined using given parameters. See docs for acceptable definitions.')
 
-    def construct(self, model_product: Callable = None, game_product: Callable = None):
+    def construct(self, model_product: Callable = None, game_product: Callable = None, init: Iterable = tuple(),
+                  max_states: int = None, max_memory: int = None, chunk_size: int = 65536, backend: str = None):
         """
-        Yet to be implemented...
+        Constructs the game graph on-the-fly by forward exploration of product game from initial states. Only the
+        states reachable from initial states are materialized.
+
+        The product game is given by ``game_product(state)``, which returns a 3-tuple ``(turn, is_final, successors)``
+        for a product state, where ``successors`` is an iterable of 2-tuples ``(act, next_state)``. States may be any
+        hashable objects. Every state is assigned a dense integer id, which is its vertex id in game graph, in order of
+        discovery. See :attr:`states <iglsynth.game.bases.IGame.states>` and
+        :attr:`init <iglsynth.game.bases.IGame.init>`.
+
+        The states are explored in breadth-first order. The vertices, edges and their properties ``turn``, ``is_final``
+        and ``act`` are appended to game graph in bulk, once every ``chunk_size`` explored states.
 
-        :param model_product:
-        :param game_product:
-        :return:
+        :param model_product: Not supported. Constructing the model from player profiles is not implemented.
+        :type model_product: Callable
+
+        :param game_product: A function ``game_product(state) -> (turn, is_final, successors)``.
+        :type game_product: Callable
+
+        :param init: An iterable of initial states.
+        :type init: Iterable
+
+        :param max_states: (Optional) Maximum number of states to be materialized.
+        :type max_states: int
+
+        :param max_memory: (Optional) Maximum estimated memory (in bytes) of states and game graph.
+        :type max_memory: int
+
+        :param chunk_size: Number of states explored between two appends to game graph. Default: 65536.
+        :type chunk_size: int
+
+        :param backend: (Optional) Backend of game graph. Default: :data:`Graph.DEFAULT_BACKEND
+            <iglsynth.util.graph.Graph.DEFAULT_BACKEND>`.
+        :type backend: str
+
+        :raises NotImplementedError: If ``game_product`` is not given, or ``model_product`` is given.
+        :raises MemoryError: If the number of states or the estimated memory exceeds its limit. The game is not
+            changed.
         """
-        raise NotImplementedError("Feature yet to be implemented.")
+        if game_product is None or model_product is not None:
+            raise NotImplementedError("Presently only construction using 'game_product' is implemented.")
+
+        assert chunk_size > 0, f"Required, chunk_size > 0. Received, chunk_size = {chunk_size}."
+
+        graph = Graph(vprops=[("turn", "int"), ("is_final", "bool")], eprops=[("act", "int")], backend=backend)
+        ids = dict()
+        states = []
+
+        # Estimated memory: states and their hash-consing table, and vertex (turn, is_final) and edge (source,
+        #   target, act) arrays of game graph.
+        state_bytes = 0
+        num_edges = 0
+
+        def intern(state):
+            nonlocal state_bytes
+            vid = ids.get(state)
+            if vid is None:
+                vid = ids[state] = len(states)
+                states.append(state)
+                state_bytes += sys.getsizeof(state)
+                if max_states is not None and len(states) > max_states:
+                    raise MemoryError(f"Construction aborted: Number of states exceeds max_states = {max_states}.")
+
+            return vid
+
+        init = [intern(state) for state in init]
+
+        # States are explored in order of their ids. Hence, explored states are states[:explored].
+        explored = 0
+        while explored < len(states):
+            stop = min(explored + chunk_size, len(states))
+            turn, is_final, edges, act = [], [], [], []
+            for vid in range(explored, stop):
+                t, f, successors = game_product(states[vid])
+                turn.append(t)
+                is_final.append(f)
+                for a, state in successors:
+                    edges.append((vid, intern(state)))
+                    act.append(a)
+
+                if max_memory is not None:
+                    memory = sys.getsizeof(ids) + sys.getsizeof(states) + state_bytes + 9 * len(states) + \
+                             24 * (num_edges + len(edges))
+                    if memory > max_memory:
+                        raise MemoryError(f"Construction aborted: Estimated memory {memory} bytes exceeds "
+                                          f"max_memory = {max_memory} bytes.")
+
+            # Append the explored states, and the states discovered by them, to game graph.
+            if len(states) > graph.num_vertices:
+                graph.add_vertices(num=len(states) - graph.num_vertices)
+            graph.vprop("turn")[explored:stop] = turn
+            graph.vprop("is_final")[explored:stop] = is_final
+            if edges:
+                graph.add_edge_array(np.array(edges, dtype=np.int64), eprops={"act": act})
+
+            num_edges += len(edges)
+            explored = stop
+
+        if not self._validate_graph(graph):
+            raise AttributeError("Game could not be defined using constructed graph. Validation failed.")
+
+        self._define_by_graph(graph)
+        self._states = states
+        self._init = np.array(init, dtype=np.int64)
+
+    def validate(self, strict: bool = True) -> ValidationReport:
+        """
+        Validates the game graph. The required properties (see :meth:`define`) are always checked. In strict mode,
+        the structural invariants are also checked,
+
+        * every vertex has an outgoing edge,
+        * ``turn`` of every vertex is 1 or 2, if the game is turn-based,
+        * no two outgoing edges of a vertex have the same ``act``.
+
+        All invariants are checked by whole-array operations, e.g. the duplicate actions are found by sorting the
+        edges by (source, act).
+
+        :param strict: Should the structural invariants be checked? Default: True.
+        :type strict: bool
+
+        :return: A :class:`ValidationReport` with offending vertex ids and edge indices.
+
+        :raises ValueError: If the game graph is not defined.
+        """
+        graph = self.graph
+        if graph is None:
+            raise ValueError("Game graph is not defined.")
+
+        required = [("is_final", "bool", graph.has_vertex_property), ("act", "int", graph.has_edge_property)]
+        if self.kind == TURN_BASED:
+            required.append(("turn", "int", graph.has_vertex_property))
+
+        report = ValidationReport(properties=[name for name, of_type, has in required if not has(name, of_type)])
+        if not strict:
+            return report
+
+        # Arrays are indexed by vertex id. The vertices filtered out of a sub-graph are not checked.
+        n = graph.vertex_index_range
+        vertices = graph.vertex_mask()
+        edges = graph.edges_array()
+        sources, eids = edges[:, 0], edges[:, 2]
+
+        report["dead_ends"] = np.flatnonzero((np.bincount(sources, minlength=n)[:n] == 0) & vertices)
+
+        if self.kind == TURN_BASED and "turn" not in report["properties"]:
+            turn = graph.vprop("turn")[:n]
+            report["turn"] = np.flatnonzero((turn != 1) & (turn != 2) & vertices)
+
+        if "act" not in report["properties"]:
+            act = np.asarray(graph.eprop("act"))[eids].astype(np.int64)
+
+            # Sort edges by (source, act). If possible, (source, act) is packed into a single key, which is sorted
+            #   much faster than multiple keys.
+            low = int(act.min()) if len(act) > 0 else 0
+            span = int(act.max()) - low + 1 if len(act) > 0 else 1
+            if n * span < 2 ** 62:
+                order = np.argsort(sources * span + (act - low), kind="stable")
+            else:
+                order = np.lexsort((act, sources))
+
+            # Edges in a group of equal (source, act) with more than one edge are duplicates.
+            sources, act = sources[order], act[order]
+            same = (sources[1:] == sources[:-1]) & (act[1:] == act[:-1])
+            duplicate = np.zeros(len(order), dtype=bool)
+            duplicate[1:] |= same
+            duplicate[:-1] |= same
+            report["duplicate_act"] = np.sort(eids[order][duplicate])
 
+        return report
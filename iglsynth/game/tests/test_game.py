@@ -1,5 +1,8 @@
+import numpy as np
+import pytest
 from iglsynth.util.graph import *
 from iglsynth.game.game import *
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
 
 
 def test_game_basic():
@@ -16,3 +19,135 @@ def test_game_basic():
 
     print(game.kind)
     print(type(graph.is_final), graph.is_final)
+
+
+def test_game_save_load(tmp_path):
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool")], eprops=[("act", "int")])
+    graph.add_vertices(num=3)
+    graph.add_edges(edges=[(0, 1), (1, 2), (2, 0)])
+    graph.vprop("turn")[:] = [1, 2, 1]
+    graph.vprop("is_final")[2] = True
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    filename = str(tmp_path / "game.igl")
+    game.save(filename)
+
+    loaded = Game()
+    loaded.load(filename)
+    assert loaded.kind == TURN_BASED
+    assert loaded.graph.num_vertices == 3 and loaded.graph.num_edges == 3
+    assert loaded.graph.vprop("is_final").tolist() == [False, False, True]
+
+    # Only metadata is loaded.
+    loaded = Game()
+    loaded.load(filename, load_graphs=False)
+    assert loaded.kind == TURN_BASED and loaded.graph is None
+
+    # Game saved without graph.
+    game.save(filename, save_graphs=False)
+    loaded = Game()
+    loaded.load(filename)
+    assert loaded.kind == TURN_BASED and loaded.graph is None
+
+    # Files of other types cannot be loaded.
+    class OtherGame(Game):
+        pass
+
+    with pytest.raises(ValueError):
+        OtherGame().load(filename)
+
+    graph.save(filename)
+    with pytest.raises(ValueError):
+        Game().load(filename, load_graphs=False)
+
+
+def chase_product(size):
+    """
+    Product game of a robot (player 1) chasing a target (player 2) on a ring of given size. Robot moves by 0 or 1,
+    and target moves by 0 or 1 in the same direction. The robot wins when it catches the target.
+    """
+    def game_product(state):
+        robot, target, turn = state
+        if turn == 1:
+            successors = [(step, ((robot + step) % size, target, 2)) for step in (0, 1)]
+        else:
+            successors = [(step, (robot, (target + step) % size, 1)) for step in (0, 1)]
+
+        return turn, robot == target, successors
+
+    return game_product
+
+
+def test_game_construct():
+    game = Game(kind=TURN_BASED)
+    game.construct(game_product=chase_product(size=5), init=[(0, 2, 1)])
+
+    graph = game.graph
+    assert graph.num_vertices == len(game.states) == 50 and graph.num_edges == 100
+    assert game.init.tolist() == [0] and game.states[0] == (0, 2, 1)
+    for vid, (robot, target, turn) in enumerate(game.states):
+        assert graph.get_vertex_property("turn", vid) == turn
+        assert graph.get_vertex_property("is_final", vid) == (robot == target)
+
+    # Edges and their actions do not depend on chunk size.
+    chunked = Game(kind=TURN_BASED)
+    chunked.construct(game_product=chase_product(size=5), init=[(0, 2, 1)], chunk_size=3)
+    assert chunked.states == game.states
+    edges = {(game.states[u], game.states[v], graph.get_edge_property("act", e))
+             for e in graph.edges for u, v in [(e.source, e.target)]}
+    assert edges == {(chunked.states[e.source], chunked.states[e.target], chunked.graph.get_edge_property("act", e))
+                     for e in chunked.graph.edges}
+
+    # Initial states are hash-consed as well.
+    game.construct(game_product=chase_product(size=5), init=[(1, 1, 2), (0, 2, 1), (1, 1, 2)])
+    assert game.init.tolist() == [0, 1, 0] and game.graph.num_vertices == 50
+
+    # Construction is aborted when a limit is exceeded.
+    for limits in [{"max_states": 10}, {"max_memory": 1000}]:
+        aborted = Game(kind=TURN_BASED)
+        with pytest.raises(MemoryError):
+            aborted.construct(game_product=chase_product(size=50), init=[(0, 2, 1)], **limits)
+        assert aborted.graph is None and aborted.states is None
+
+    with pytest.raises(NotImplementedError):
+        aborted.construct()
+
+
+def test_game_validate():
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool")], eprops=[("act", "int")])
+    graph.add_vertices(num=4)
+    graph.add_edge_array(np.array([[0, 1], [0, 2], [1, 2], [2, 0], [0, 3]]), eprops={"act": [1, 2, 1, 1, 1]})
+    graph.vprop("turn")[:] = [1, 2, 3, 0]
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    report = game.validate()
+    assert not report.is_valid
+    assert report["properties"] == []
+    assert report["dead_ends"].tolist() == [3]
+    assert report["turn"].tolist() == [2, 3]
+    assert report["duplicate_act"].tolist() == sorted([graph.find_edge(0, 1).index, graph.find_edge(0, 3).index])
+
+    # Non-strict validation only checks properties.
+    assert game.validate(strict=False).is_valid
+
+    graph.add_edge_array(np.array([[3, 0]]), eprops={"act": [1]})
+    graph.vprop("turn")[:] = [1, 2, 1, 2]
+    graph.eprop("act")[graph.find_edge(0, 3).index] = 3
+    assert game.validate().is_valid
+
+    # Vertices filtered out of a sub-graph are not checked.
+    graph.add_edge_array(np.array([[2, 1], [3, 3]]), eprops={"act": [2, 2]})
+    graph.vprop("turn")[0] = 0
+    vmask = np.array([False, True, True, True])
+    sub = Game(kind=TURN_BASED)
+    sub.define(graph=SubGraph(graph=graph, vmask=vmask))
+    assert sub.validate().is_valid
+    vmask[1] = False
+    sub = Game(kind=TURN_BASED)
+    sub.define(graph=SubGraph(graph=graph, vmask=vmask))
+    assert sub.validate()["dead_ends"].tolist() == [2]
+
+    with pytest.raises(ValueError):
+        Game().validate()
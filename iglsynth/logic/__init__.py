@@ -0,0 +1 @@
+from iglsynth.logic.acceptance import *
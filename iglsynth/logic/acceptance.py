@@ -0,0 +1,290 @@
+"""
+iglsynth: acceptance.py
+
+License goes here...
+
+Acceptance conditions given by LTL formulas. Formulas are translated into automata using
+`spot <https://spot.lrde.epita.fr/>`_, and the automata are represented as :class:`Graph <iglsynth.util.graph.Graph>`.
+Translations are cached in memory and, optionally, on disk. See :class:`TranslationCache`.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+from typing import Dict, Iterable, Tuple
+from iglsynth.util import storage
+from iglsynth.util.graph import Graph
+from iglsynth.util.lazy import LazyModule
+
+# spot is imported on first use.
+spot = LazyModule("spot")
+
+# Options of spot.translate: State-based Buchi automaton.
+DEFAULT_OPTIONS = ("Buchi", "state")
+
+
+class Acceptance(object):
+    """
+    Represents an acceptance condition given by an LTL formula.
+
+    :param formula: An LTL formula in spot syntax, e.g. ``"G F a"``.
+    :type formula: str
+
+    :param options: (Optional) Options of ``spot.translate``. Default: :data:`DEFAULT_OPTIONS`.
+    :type options: Iterable[str]
+    """
+
+    def __init__(self, formula: str, options: Iterable[str] = None):
+        self._formula = formula
+        self._options = tuple(DEFAULT_OPTIONS if options is None else options)
+
+    def __repr__(self):
+        return f"Acceptance(formula={self._formula!r}, options={self._options})"
+
+    @property
+    def formula(self):
+        """ Returns the LTL formula. """
+        return self._formula
+
+    @property
+    def options(self):
+        """ Returns the options of translation. """
+        return self._options
+
+    def automaton(self, cache: 'TranslationCache' = None) -> Graph:
+        """
+        Returns the automaton of formula. See :func:`translate`.
+
+        :param cache: (Optional) A :class:`TranslationCache`. Default: :data:`CACHE`.
+        """
+        return translate(self._formula, options=self._options, cache=cache)
+
+
+class TranslationCache(object):
+    """
+    A least-recently-used cache of translated automata, keyed by the normalized formula and options of translation.
+    The automata are stored as the arrays of :mod:`iglsynth.util.storage` format, hence every lookup returns a new
+    :class:`Graph <iglsynth.util.graph.Graph>`. The arrays are copied when an automaton is added and when it is
+    returned, so that changes to the given graph or to a returned graph never affect the cache.
+
+    When ``directory`` is given, the automata are also saved to files in it, which are shared by all processes using
+    the same directory. Files are written atomically, hence concurrent processes never read a partial file.
+
+    :param maxsize: Maximum number of automata kept in memory.
+    :type maxsize: int (> 0)
+
+    :param directory: (Optional) Directory of cache files. It is created, if it does not exist.
+    :type directory: str
+    """
+
+    def __init__(self, maxsize: int = 128, directory: str = None):
+        assert maxsize > 0, f"Required, maxsize > 0. Received, maxsize = {maxsize}."
+        self._maxsize = maxsize
+        self._directory = directory
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"TranslationCache(size={len(self)}, maxsize={self._maxsize}, directory={self._directory!r})"
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple[str, Tuple[str, ...]]):
+        return key in self._entries or (self._directory is not None and os.path.exists(self._filename(key)))
+
+    @property
+    def directory(self):
+        """ Returns the directory of cache files, or None if automata are cached only in memory. """
+        return self._directory
+
+    def _filename(self, key: Tuple[str, Tuple[str, ...]]) -> str:
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return os.path.join(self._directory, f"{digest}.igl")
+
+    def get(self, key: Tuple[str, Tuple[str, ...]]) -> Graph:
+        """
+        Returns the automaton cached for given key, or None if there is no such automaton.
+
+        :param key: A 2-tuple of (normalized formula, options).
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            header, arrays = self._entries[key]
+            return Graph._from_arrays(header, _copy(arrays))
+
+        if self._directory is not None and os.path.exists(self._filename(key)):
+            header, arrays = storage.read(self._filename(key), mmap=False)
+            self._insert(key, header["graph"], arrays)
+            self.hits += 1
+            return Graph._from_arrays(header["graph"], _copy(arrays))
+
+        self.misses += 1
+        return None
+
+    def put(self, key: Tuple[str, Tuple[str, ...]], graph: Graph):
+        """
+        Adds an automaton to cache.
+
+        :param key: A 2-tuple of (normalized formula, options).
+        :param graph: A :class:`Graph <iglsynth.util.graph.Graph>` representing the automaton.
+        """
+        header, arrays = graph._to_arrays()
+        arrays = _copy(arrays)
+        self._insert(key, header, arrays)
+
+        if self._directory is not None:
+            fd, temp = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            os.close(fd)
+            try:
+                storage.write(temp, header={"graph": header, "key": list(key)}, arrays=arrays)
+                os.replace(temp, self._filename(key))
+            finally:
+                if os.path.exists(temp):
+                    os.remove(temp)
+
+    def _insert(self, key, header: dict, arrays: Dict[str, np.ndarray]):
+        self._entries[key] = (header, arrays)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """ Removes all automata from memory. Cache files are not removed. """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _copy(arrays: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """ Returns a copy of arrays. The arrays of a graph may be views of its storage, and vice versa. """
+    return {name: np.array(array, copy=True) for name, array in arrays.items()}
+
+
+# Default cache used by :func:`translate`.
+CACHE = TranslationCache()
+
+
+def normalize(formula: str) -> str:
+    """
+    Returns the normalized string of an LTL formula, as printed by spot. Equal formulas written differently, e.g.
+    with different spaces or parentheses, have the same normalized string.
+
+    :param formula: An LTL formula in spot syntax.
+    """
+    return str(spot.formula(formula))
+
+
+def translate(formula: str, options: Iterable[str] = DEFAULT_OPTIONS, cache: TranslationCache = None) -> Graph:
+    """
+    Translates an LTL formula into an automaton using ``spot.translate``. The translation is looked up in cache first,
+    and is added to cache after translation.
+
+    The automaton is returned as a :class:`Graph <iglsynth.util.graph.Graph>`. See :func:`from_hoa`.
+
+    :param formula: An LTL formula in spot syntax.
+    :param options: Options of ``spot.translate``. Default: :data:`DEFAULT_OPTIONS`.
+    :param cache: (Optional) A :class:`TranslationCache`. Default: :data:`CACHE`.
+
+    :return: A :class:`Graph <iglsynth.util.graph.Graph>` object.
+    """
+    cache = CACHE if cache is None else cache
+    key = (normalize(formula), tuple(options))
+
+    graph = cache.get(key)
+    if graph is None:
+        graph = from_hoa(spot.translate(key[0], *key[1]).to_str("hoa"))
+        cache.put(key, graph)
+
+    return graph
+
+
+def from_hoa(text: str, backend: str = None) -> Graph:
+    """
+    Constructs a graph from an automaton in `HOA format <http://adl.github.io/hoaf/>`_ with explicit labels, as
+    printed by spot. The body of automaton is parsed by vectorized string operations, and the edges are added in bulk.
+
+    The graph has,
+
+    * vertex property ``is_final`` (bool): Whether the state is in an acceptance set (state-based acceptance).
+    * edge property ``acc`` (int): Bitmask of acceptance sets of the edge (transition-based acceptance).
+    * edge property ``label`` (int): Index of label of edge in graph property ``labels``.
+    * graph properties ``init`` (int), ``ap`` (list of atomic proposition names), ``labels`` (list of edge labels,
+      in which atomic propositions are referred to by their index in ``ap``), ``acc_name`` (str) and
+      ``acceptance`` (str).
+
+    :param text: An automaton in HOA format.
+    :param backend: (Optional) Backend of graph. Default: :data:`Graph.DEFAULT_BACKEND
+        <iglsynth.util.graph.Graph.DEFAULT_BACKEND>`.
+
+    :return: A :class:`Graph <iglsynth.util.graph.Graph>` object.
+
+    :raises ValueError: If the text is not an automaton in HOA format.
+    """
+    if "--BODY--" not in text or "--END--" not in text:
+        raise ValueError("Given text is not an automaton in HOA format.")
+
+    head, body = text.split("--BODY--", 1)
+    body = body.split("--END--", 1)[0]
+
+    # Header: one item per line, e.g. 'States: 2' or 'AP: 2 "a" "b"'.
+    header = dict()
+    for line in head.strip().splitlines():
+        name, _, value = line.partition(":")
+        header.setdefault(name.strip(), value.strip())
+
+    num_states = int(header.get("States", 0))
+    ap = [name.strip('"') for name in header.get("AP", "0").split()[1:]]
+
+    num_sets = int(header.get("Acceptance", "0").split()[0])
+    lines = np.array([line.strip() for line in body.strip().splitlines()], dtype=str)
+
+    # State lines: 'State: <id> ["name"] [{<acc>...}]'. Edge lines: '[<label>] <target> [{<acc>...}]'.
+    is_state = np.char.startswith(lines, "State:")
+    is_edge = np.char.startswith(lines, "[")
+    if not np.all(is_state | is_edge):
+        raise ValueError("Only automata with explicit labels are supported.")
+
+    states = np.char.strip(np.char.partition(lines[is_state], ":")[:, 2])
+    state_ids = np.char.partition(states, " ")[:, 0].astype(np.int64)
+    state_acc = _acceptance_sets(states, num_sets)
+
+    edges = np.char.partition(lines[is_edge], "]")
+    labels, inverse = np.unique(np.char.lstrip(edges[:, 0], "["), return_inverse=True)
+    rest = np.char.strip(edges[:, 2])
+    targets = np.char.partition(rest, " ")[:, 0].astype(np.int64)
+    sources = state_ids[np.cumsum(is_state)[is_edge] - 1]
+
+    graph = Graph(vprops=[("is_final", "bool")], eprops=[("acc", "int"), ("label", "int")],
+                  gprops=[("init", "int"), ("ap", "object"), ("labels", "object"), ("acc_name", "string"),
+                          ("acceptance", "string")], backend=backend)
+    if num_states > 0:
+        graph.add_vertices(num=num_states)
+    graph.vprop("is_final")[state_ids] = state_acc != 0
+    graph.add_edge_array(np.column_stack((sources, targets)),
+                         eprops={"acc": _acceptance_sets(rest, num_sets), "label": inverse.reshape(-1)})
+
+    graph.set_graph_property("init", int(header.get("Start", "0").split("&")[0]))
+    graph.set_graph_property("ap", ap)
+    graph.set_graph_property("labels", labels.tolist())
+    graph.set_graph_property("acc_name", header.get("acc-name", ""))
+    graph.set_graph_property("acceptance", header.get("Acceptance", ""))
+    return graph
+
+
+def _acceptance_sets(items: np.ndarray, num_sets: int) -> np.ndarray:
+    """ Returns the bitmask of acceptance sets '{i j ...}' at the end of every item, or 0 if there is none. """
+    sets = np.char.add(np.char.add(" ", np.char.rstrip(np.char.partition(items, "{")[:, 2], "}")), " ")
+    mask = np.zeros(len(items), dtype=np.int64)
+    for j in range(num_sets):
+        mask[np.char.find(sets, f" {j} ") >= 0] |= 1 << j
+
+    return mask
@@ -0,0 +1,98 @@
+import pytest
+from iglsynth.logic.acceptance import *
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+HOA = """HOA: v1
+name: "G(a -> F b)"
+States: 2
+Start: 0
+AP: 2 "a" "b"
+acc-name: Buchi
+Acceptance: 1 Inf(0)
+properties: trans-labels explicit-labels state-acc complete
+properties: deterministic stutter-invariant
+--BODY--
+State: 0 {0}
+[!0 | 1] 0
+[0&!1] 1
+State: 1
+[1] 0
+[!1] 1
+--END--
+"""
+
+
+def automaton_edges(graph):
+    labels = graph.get_graph_property("labels")
+    return {(u, v, labels[graph.eprop("label")[eid]], int(graph.eprop("acc")[eid]))
+            for u, v, eid in graph.edges_array().tolist()}
+
+
+def test_from_hoa():
+    graph = from_hoa(HOA)
+    assert graph.num_vertices == 2 and graph.num_edges == 4
+    assert graph.vprop("is_final").tolist() == [True, False]
+    assert automaton_edges(graph) == {(0, 0, "!0 | 1", 0), (0, 1, "0&!1", 0), (1, 0, "1", 0), (1, 1, "!1", 0)}
+    assert graph.get_graph_property("init") == 0
+    assert graph.get_graph_property("ap") == ["a", "b"]
+    assert graph.get_graph_property("acc_name") == "Buchi"
+
+    # Transition-based acceptance
+    graph = from_hoa(HOA.replace("State: 0 {0}", "State: 0").replace("[1] 0", "[1] 0 {0}"))
+    assert graph.vprop("is_final").tolist() == [False, False]
+    assert (1, 0, "1", 1) in automaton_edges(graph)
+
+    with pytest.raises(ValueError):
+        from_hoa("not an automaton")
+
+
+def test_translation_cache(tmp_path):
+    graph = from_hoa(HOA)
+    cache = TranslationCache(maxsize=2, directory=str(tmp_path))
+    keys = [(f"G(a -> F b{i})", DEFAULT_OPTIONS) for i in range(3)]
+    assert cache.get(keys[0]) is None and cache.misses == 1
+
+    for key in keys:
+        cache.put(key, graph)
+
+    # Least recently used automaton is evicted from memory, but is still on disk.
+    assert len(cache) == 2
+    cached = cache.get(keys[0])
+    assert cache.hits == 1 and len(cache) == 2
+    assert automaton_edges(cached) == automaton_edges(graph)
+    assert cached.vprop("is_final").tolist() == [True, False]
+    assert cached.get_graph_property("ap") == ["a", "b"]
+
+    # Every lookup returns a new graph.
+    assert cache.get(keys[0]) is not cached
+
+    # Changes to the graph added to cache, or to a graph returned by cache, do not affect the cache.
+    for key in (keys[2], keys[0]):
+        graph.vprop("is_final")[0] = False
+        assert cache.get(key).vprop("is_final").tolist() == [True, False]
+        graph.vprop("is_final")[0] = True
+
+        cached = cache.get(key)
+        cached.vprop("is_final")[:] = [False, True]
+        cached.eprop("acc")[:] = 1
+        assert cache.get(key).vprop("is_final").tolist() == [True, False]
+        assert automaton_edges(cache.get(key)) == automaton_edges(graph)
+
+    # Cache files are shared by caches using same directory.
+    other = TranslationCache(directory=str(tmp_path))
+    assert all(key in other for key in keys)
+    assert (keys[0][0], ("parity", )) not in other
+    assert not any(name.endswith(".tmp") for name in os.listdir(str(tmp_path)))
+
+
+def test_translate():
+    pytest.importorskip("spot")
+    cache = TranslationCache()
+    acc = Acceptance("G(a -> F b)")
+    graph = acc.automaton(cache=cache)
+    assert graph.num_vertices > 0 and graph.has_vertex_property("is_final", of_type="bool")
+    assert set(graph.get_graph_property("ap")) == {"a", "b"}
+
+    # Equal formulas are translated once.
+    translate("G (a->(F b))", cache=cache)
+    assert cache.misses == 1 and cache.hits == 1
@@ -1 +1,7 @@
-from iglsynth.solver.zielonka import *
\ No newline at end of file
+from iglsynth.solver.zielonka import *
+from iglsynth.solver.parity import *
+from iglsynth.solver.safety import *
+from iglsynth.solver.buchi import *
+from iglsynth.solver.stats import *
+from iglsynth.solver.concurrent import *
+from iglsynth.solver.quotient import *
@@ -0,0 +1,300 @@
+"""
+iglsynth: attractor.py
+
+License goes here...
+"""
+
+import numpy as np
+from iglsynth.solver.stats import SolverStats
+from iglsynth.util.frozen import FrozenGraph
+from iglsynth.util.graph import *
+
+
+class Arena(object):
+    """
+    Represents a turn-based game graph as flat NumPy arrays. The forward adjacency is stored in CSR form, i.e. the
+    successors of vertex ``v`` are ``fwd_indices[fwd_indptr[v]:fwd_indptr[v + 1]]``. The reverse adjacency is stored
+    in CSC form, i.e. the predecessors of ``v`` are ``rev_indices[rev_indptr[v]:rev_indptr[v + 1]]``.
+
+    :param num_vertices: Number of vertices in arena.
+    :type num_vertices: int
+
+    :param edges: An ``(m, 3)`` integer array, whose rows are (source, target, edge index).
+    :type edges: numpy.ndarray
+
+    :param turn: An integer array of length ``num_vertices`` with ID of player who plays at a vertex.
+    :type turn: numpy.ndarray
+
+    :param is_final: A boolean array of length ``num_vertices`` marking final vertices.
+    :type is_final: numpy.ndarray
+
+    :param priority: (Optional) An integer array of length ``num_vertices`` with priority of every vertex.
+    :type priority: numpy.ndarray
+
+    :param mask: (Optional) A boolean array of length ``num_vertices`` marking the vertices in arena. The vertex ids
+        outside the mask are not part of the game, e.g. the vertices filtered out of a sub-graph, and must not be
+        incident to any edge. Default: All vertex ids are in arena.
+    :type mask: numpy.ndarray
+    """
+
+    def __init__(self, num_vertices: int, edges: np.ndarray, turn: np.ndarray, is_final: np.ndarray,
+                 priority: np.ndarray = None, mask: np.ndarray = None):
+        self.num_vertices = num_vertices
+        self.mask = None if mask is None else np.asarray(mask, dtype=bool)
+        self.turn = np.asarray(turn, dtype=np.int64)
+        self.is_final = np.asarray(is_final, dtype=bool)
+        self.priority = None if priority is None else np.asarray(priority, dtype=np.int64)
+
+        sources = edges[:, 0]
+        targets = edges[:, 1]
+        eids = edges[:, 2]
+
+        # Forward adjacency (CSR): edges sorted by source
+        self.fwd_indptr, order = _compress(sources, num_vertices)
+        self.fwd_indices = targets[order]
+        self.fwd_eids = eids[order]
+
+        # Reverse adjacency (CSC): edges sorted by target
+        self.rev_indptr, order = _compress(targets, num_vertices)
+        self.rev_indices = sources[order]
+        self.rev_eids = eids[order]
+
+        self.out_degree = np.diff(self.fwd_indptr)
+
+        # Scratch buffer of attractor counters shared by all attractor computations on this arena.
+        #   A negative value marks an uninitialized counter.
+        self._count = np.full(num_vertices, -1, dtype=np.int64)
+
+    def __repr__(self):
+        return f"Arena(|V|={self.num_vertices}, |E|={len(self.fwd_indices)})"
+
+    @classmethod
+    def from_graph(cls, graph: Graph):
+        """
+        Extracts the arena from a game graph with vertex properties ``turn`` and ``is_final``. If the graph has
+        a vertex property ``priority``, it is extracted as well.
+
+        The arena is indexed by vertex id of graph. For a :class:`SubGraph <iglsynth.util.graph.SubGraph>`, the
+        vertices filtered out are excluded by :attr:`mask`. The adjacency of a
+        :class:`FrozenGraph <iglsynth.util.frozen.FrozenGraph>` is reused without copying.
+
+        :param graph: A :class:`Graph <iglsynth.util.graph.Graph>` or
+            :class:`FrozenGraph <iglsynth.util.frozen.FrozenGraph>` object.
+        :return: An :class:`Arena` object.
+        """
+        if isinstance(graph, FrozenGraph):
+            return cls._from_frozen(graph)
+
+        edges = graph.edges_array()
+        turn = graph.vprop("turn")
+        is_final = graph.vprop("is_final")
+        priority = graph.vprop("priority") if graph.has_vertex_property("priority") else None
+        n = graph.vertex_index_range
+        mask = graph.vertex_mask() if graph.num_vertices < n else None
+        return cls(num_vertices=n, edges=edges, turn=turn, is_final=is_final, priority=priority, mask=mask)
+
+    @classmethod
+    def _from_frozen(cls, graph: FrozenGraph):
+        arena = cls.__new__(cls)
+        arena.num_vertices = graph.num_vertices
+        arena.mask = None
+        arena.turn = np.asarray(graph.vprop("turn"), dtype=np.int64)
+        arena.is_final = graph.vprop("is_final")
+        arena.priority = np.asarray(graph.vprop("priority"), dtype=np.int64) \
+            if graph.has_vertex_property("priority") else None
+
+        for name in ("fwd_indptr", "fwd_indices", "fwd_eids", "rev_indptr", "rev_indices", "rev_eids", "out_degree"):
+            setattr(arena, name, getattr(graph, name))
+
+        arena._count = np.full(graph.num_vertices, -1, dtype=np.int64)
+        return arena
+
+    def region(self) -> np.ndarray:
+        """ Returns a new boolean array of length ``num_vertices`` marking the vertices in arena. """
+        return np.ones(self.num_vertices, dtype=bool) if self.mask is None else self.mask.copy()
+
+    def predecessors(self, vertices: np.ndarray):
+        """
+        Returns the predecessors of all given vertices as a flat array, one entry per incoming edge.
+
+        :param vertices: An integer array of vertex ids.
+        """
+        return self.rev_indices[_expand(self.rev_indptr, vertices)[0]]
+
+    def successors(self, vertices: np.ndarray):
+        """
+        Returns the successors of all given vertices as a flat array, one entry per outgoing edge.
+
+        :param vertices: An integer array of vertex ids.
+        """
+        return self.fwd_indices[_expand(self.fwd_indptr, vertices)[0]]
+
+    def successor_in(self, vertices: np.ndarray, mask: np.ndarray):
+        """
+        Returns, for every given vertex, its first successor inside ``mask`` or -1 if there is no such successor.
+
+        :param vertices: An integer array of vertex ids.
+        :param mask: A boolean array of length ``num_vertices``.
+        """
+        pos, lengths = _expand(self.fwd_indptr, vertices)
+        owner = np.repeat(np.arange(len(vertices)), lengths)
+        inside = mask[self.fwd_indices[pos]]
+
+        succ = np.full(len(vertices), -1, dtype=np.int64)
+        idx, first = np.unique(owner[inside], return_index=True)
+        succ[idx] = self.fwd_indices[pos[inside][first]]
+        return succ
+
+    def degree_in(self, vertices: np.ndarray, mask: np.ndarray):
+        """
+        Returns, for every given vertex, the number of its outgoing edges that lead inside ``mask``.
+
+        :param vertices: An integer array of vertex ids.
+        :param mask: A boolean array of length ``num_vertices``.
+        """
+        pos, lengths = _expand(self.fwd_indptr, vertices)
+        inside = np.concatenate(([0], np.cumsum(mask[self.fwd_indices[pos]])))
+        ends = np.cumsum(lengths)
+        return inside[ends] - inside[ends - lengths]
+
+
+def _compress(keys: np.ndarray, num_vertices: int):
+    """ Returns (indptr, order) such that ``keys[order]`` is sorted and grouped by ``indptr``. """
+    indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=num_vertices), out=indptr[1:])
+    order = np.argsort(keys, kind="stable")
+    return indptr, order
+
+
+def _expand(indptr: np.ndarray, vertices: np.ndarray):
+    """
+    Returns the positions ``indptr[v]:indptr[v + 1]`` of all given vertices, concatenated, and the number of
+    positions contributed by every vertex.
+    """
+    starts = indptr[vertices]
+    lengths = indptr[vertices + 1] - starts
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum()), lengths
+
+
+def attractor(arena: Arena, target: np.ndarray, player: int = 1, mask: np.ndarray = None,
+              strategy: np.ndarray = None, stats: SolverStats = None, frontier: np.ndarray = None,
+              rank: np.ndarray = None):
+    """
+    Computes the attractor of ``target`` for given player by vectorized frontier expansion.
+
+    In every round, the predecessors of all vertices won in the previous round are collected at once. A vertex of
+    ``player`` is won as soon as it has a winning successor. A vertex of opponent keeps a counter of successors that
+    are not yet winning and is won when the counter drops to zero. Every vertex enters the frontier at most once,
+    hence every edge is scanned at most once.
+
+    When ``mask`` is given, the attractor is computed in the subgame induced by the vertices in ``mask``. No copy of
+    the arena is made: counters are initialized lazily to the number of successors inside ``mask``, in a scratch
+    buffer owned by arena, which is reset before returning.
+
+    :param arena: An :class:`Arena` object.
+    :param target: A boolean array of length ``arena.num_vertices``.
+    :param player: Player (1 or 2) for whom the attractor is computed.
+    :param mask: (Optional) A boolean array of length ``arena.num_vertices`` defining the subgame.
+    :param strategy: (Optional) An integer array of length ``arena.num_vertices``. For every vertex of ``player``
+        added to attractor, the successor through which it is attracted is recorded in this array.
+    :param stats: (Optional) A :class:`SolverStats <iglsynth.solver.stats.SolverStats>` object to record every round.
+    :param frontier: (Optional) An integer array of target vertices, whose predecessors are expanded in first round.
+        The predecessors inside ``mask`` of all other target vertices must be in target. Default: All target
+        vertices.
+    :param rank: (Optional) An integer array of length ``arena.num_vertices``. Every vertex added to attractor in
+        round ``r`` is given rank ``b + r``, where ``b`` is the maximum rank of target vertices. Hence, a vertex has
+        higher rank than the successor through which it is attracted, and than all its successors in ``mask``, if it
+        is a vertex of opponent.
+
+    :return: A boolean array marking the vertices in attractor.
+    """
+    opponent = 2 if player == 1 else 1
+    win = np.array(target, dtype=bool) if mask is None else target & mask
+    count = arena._count
+    touched = []
+
+    try:
+        frontier = np.flatnonzero(win) if frontier is None else np.asarray(frontier, dtype=np.int64)
+        level = int(rank[win].max()) if rank is not None and win.any() else 0
+        while frontier.size > 0:
+            pos, lengths = _expand(arena.rev_indptr, frontier)
+            pre = arena.rev_indices[pos]
+            if stats is not None:
+                stats.iteration(frontier=frontier.size, edges=pos.size)
+
+            keep = ~win[pre] if mask is None else mask[pre] & ~win[pre]
+            pre = pre[keep]
+            turn = arena.turn[pre]
+
+            # Player vertices are won through the first edge that reaches the frontier.
+            is_own = turn == player
+            own, first = np.unique(pre[is_own], return_index=True)
+            if strategy is not None:
+                strategy[own] = np.repeat(frontier, lengths)[keep][is_own][first]
+
+            # Opponent vertices are won when all their successors are won.
+            opp = pre[turn == opponent]
+            fresh = np.unique(opp[count[opp] < 0])
+            count[fresh] = arena.out_degree[fresh] if mask is None else arena.degree_in(fresh, mask)
+            touched.append(fresh)
+
+            np.subtract.at(count, opp, 1)
+            opp = np.unique(opp[count[opp] == 0])
+
+            frontier = np.concatenate((own, opp))
+            win[frontier] = True
+            if rank is not None:
+                level += 1
+                rank[frontier] = level
+
+    finally:
+        for fresh in touched:
+            count[fresh] = -1
+
+    return win
+
+
+def attractor_many(arena: Arena, targets: np.ndarray, player: int = 1, stats: SolverStats = None):
+    """
+    Computes the attractors of many targets at once for given player. Targets are packed as bits, i.e. bit ``j % 64``
+    of ``targets[v, j // 64]`` marks whether vertex ``v`` is in ``j``-th target.
+
+    The attractors are the least fixed-point of the bitwise equations: the bits of a vertex of ``player`` are the
+    bitwise OR over the bits of its successors, and the bits of a vertex of opponent are the bitwise AND over the
+    bits of its successors. Starting from targets, only the predecessors of vertices whose bits changed in the
+    previous round are re-evaluated.
+
+    :param arena: An :class:`Arena` object.
+    :param targets: A ``uint64`` array of shape ``(arena.num_vertices, num_words)``.
+    :param player: Player (1 or 2) for whom the attractors are computed.
+    :param stats: (Optional) A :class:`SolverStats <iglsynth.solver.stats.SolverStats>` object to record every round.
+
+    :return: A ``uint64`` array of same shape as ``targets`` marking the vertices in every attractor.
+    """
+    opponent = 2 if player == 1 else 1
+    win = np.array(targets, dtype=np.uint64)
+
+    frontier = np.flatnonzero(win.any(axis=1))
+    while frontier.size > 0:
+        pre = np.unique(arena.predecessors(frontier))
+        changed = []
+        if stats is not None:
+            stats.iteration(frontier=frontier.size, edges=arena.out_degree[pre].sum())
+
+        for p, reduce in ((player, np.bitwise_or), (opponent, np.bitwise_and)):
+            vertices = pre[arena.turn[pre] == p]
+            if vertices.size == 0:
+                continue
+
+            pos, lengths = _expand(arena.fwd_indptr, vertices)
+            bits = reduce.reduceat(win[arena.fwd_indices[pos]], np.cumsum(lengths) - lengths, axis=0)
+            bits |= win[vertices]
+
+            is_changed = (bits != win[vertices]).any(axis=1)
+            win[vertices[is_changed]] = bits[is_changed]
+            changed.append(vertices[is_changed])
+
+        frontier = np.concatenate(changed) if changed else np.empty(0, dtype=np.int64)
+
+    return win
@@ -0,0 +1,224 @@
+"""
+iglsynth: buchi.py
+
+License goes here...
+"""
+
+import numpy as np
+from iglsynth.solver.attractor import Arena, attractor, _expand
+from iglsynth.solver.stats import SolverStats
+from iglsynth.solver.solver import *
+from iglsynth.game import Game
+
+
+def buchi(arena: Arena, target: np.ndarray, player: int = 1, strategy: np.ndarray = None,
+          stats: SolverStats = None):
+    """
+    Computes the winning region of given player, who must visit ``target`` infinitely often.
+
+    In every iteration, the vertices from which player cannot reach ``target`` within the remaining game form a trap,
+    in which opponent wins. The attractor of opponent to this trap is removed from the game, until the trap is empty.
+    All attractors are computed in the shrinking game mask, using the counter buffer of arena.
+
+    The attractor of ``target`` is warm-started from previous iteration. Every attracted vertex has a rank, which is
+    higher than the rank of the successor through which it is attracted. As the game shrinks, a vertex stays
+    attracted unless it lost its support (see :func:`_unsupported`): a vertex of player, which has no remaining
+    successor of lower rank, or a vertex of opponent with a successor that lost its support. Only these vertices are
+    computed again, by expanding the attractor from their supported successors. Hence, an iteration takes time in the
+    number of edges around the removed and unsupported vertices, rather than in the size of game. When more than an
+    eighth of the game is removed or unsupported, the attractor is computed from scratch instead. In the worst case,
+    the complete computation still takes :math:`O(k \\cdot (|V| + |E|))` time for :math:`k` iterations.
+
+    :param arena: An :class:`Arena <iglsynth.solver.attractor.Arena>` object.
+    :param target: A boolean array of length ``arena.num_vertices``.
+    :param player: Player (1 or 2) with the Büchi objective.
+    :param strategy: (Optional) An integer array of length ``arena.num_vertices``. The winning strategies of both
+        players are recorded in this array as successor of every vertex.
+    :param stats: (Optional) A :class:`SolverStats <iglsynth.solver.stats.SolverStats>` object to record every
+        attractor round.
+
+    :return: A boolean array marking the winning region of ``player``.
+    """
+    opponent = 2 if player == 1 else 1
+    game = arena.region()
+    target = target & game
+
+    # Successor through which every vertex of player is attracted to target, and rank of every attracted vertex.
+    choice = np.full(arena.num_vertices, -1, dtype=np.int64)
+    rank = np.zeros(arena.num_vertices, dtype=np.int64)
+    attr = attractor(arena, target, player=player, mask=game, strategy=choice, stats=stats, rank=rank)
+
+    while True:
+        trap = game & ~attr
+        if not trap.any():
+            break
+
+        # Opponent stays in the trap, and attracts to it from rest of the game.
+        if strategy is not None:
+            stay = np.flatnonzero(trap & (arena.turn == opponent))
+            strategy[stay] = arena.successor_in(stay, trap)
+
+        removed = attractor(arena, trap, player=opponent, mask=game, strategy=strategy, stats=stats)
+        game &= ~removed
+
+        # Remaining game is inside the attractor. Only the vertices, which lost their support, are attracted again.
+        lost = _unsupported(arena, removed, game, target, choice, rank, player, limit=int(game.sum()) // 8,
+                            stats=stats)
+        if lost is None:
+            rank[:] = 0
+            attr = attractor(arena, target & game, player=player, mask=game, strategy=choice, stats=stats, rank=rank)
+            continue
+
+        frontier = arena.successors(np.flatnonzero(lost))
+        frontier = np.unique(frontier[game[frontier] & ~lost[frontier]])
+        attr = attractor(arena, game & ~lost, player=player, mask=game, strategy=choice, stats=stats,
+                         frontier=frontier, rank=rank)
+
+    # Player keeps moving towards target, and from target vertices, player moves anywhere in its winning region.
+    if strategy is not None:
+        own = np.flatnonzero(game & ~target & (arena.turn == player))
+        strategy[own] = choice[own]
+        visit = np.flatnonzero(target & game & (arena.turn == player))
+        strategy[visit] = arena.successor_in(visit, game)
+
+    return game
+
+
+def _unsupported(arena: Arena, removed: np.ndarray, game: np.ndarray, target: np.ndarray, choice: np.ndarray,
+                 rank: np.ndarray, player: int, limit: int = None, stats: SolverStats = None) -> np.ndarray:
+    """
+    Returns the vertices of attractor in ``game``, which lost their support because of removed vertices. A vertex of
+    player, whose chosen successor is removed or unsupported, moves to another successor of lower rank in game, if
+    there is one. Otherwise, it is unsupported. A vertex of opponent with an unsupported successor is unsupported.
+    Target vertices need no support. The vertices are found by a backward search from removed vertices.
+
+    :param removed: A boolean array marking the removed vertices.
+    :param game: A boolean array marking the remaining game, which is inside attractor.
+    :param choice: An integer array with the chosen successor of every attracted vertex of player. It is updated.
+    :param rank: An integer array with the rank of every attracted vertex. See :func:`attractor`.
+    :param limit: (Optional) Maximum number of unsupported vertices. If it is exceeded, the search is aborted.
+
+    :return: A boolean array marking the unsupported vertices, or None if the search was aborted.
+    """
+    frontier = np.flatnonzero(removed)
+    if limit is not None and len(frontier) > limit:
+        return None
+
+    gone = np.array(removed, dtype=bool)
+    lost = np.zeros(arena.num_vertices, dtype=bool)
+    num_lost = 0
+    while frontier.size > 0:
+        pos, _ = _expand(arena.rev_indptr, frontier)
+        pre = arena.rev_indices[pos]
+        pre = np.sort(pre[game[pre] & ~target[pre] & ~gone[pre]])
+        pre = pre[np.diff(pre, prepend=-1) != 0]
+        is_own = arena.turn[pre] == player
+        own = pre[is_own & gone[choice[pre]]]
+
+        # Vertices of player move to the first successor of lower rank, which is neither removed nor unsupported.
+        spos, lengths = _expand(arena.fwd_indptr, own)
+        succ = arena.fwd_indices[spos]
+        owner = np.repeat(np.arange(len(own)), lengths)
+        valid = np.flatnonzero(game[succ] & ~gone[succ] & (rank[succ] < rank[own][owner]))
+        first = valid[np.diff(owner[valid], prepend=-1) != 0]
+        idx = owner[first]
+        choice[own[idx]] = succ[first]
+        if stats is not None:
+            stats.iteration(frontier=frontier.size, edges=pos.size + spos.size)
+
+        supported = np.zeros(len(own), dtype=bool)
+        supported[idx] = True
+        frontier = np.concatenate((pre[~is_own], own[~supported]))
+        gone[frontier] = True
+        lost[frontier] = True
+        num_lost += len(frontier)
+        if limit is not None and num_lost > limit:
+            return None
+
+    return lost
+
+
+class BuchiSolver(Solver):
+    """
+    Solves a deterministic two-player turn-based Büchi game. A play is won by player 1 if it visits the vertices
+    marked by vertex property ``is_final`` infinitely often, otherwise it is won by player 2.
+
+    :param game: :class:`Game <iglsynth.game.game.Game>` object.
+    """
+    def __init__(self, game: Game):
+        super(BuchiSolver, self).__init__(game)
+
+        # Initialize internal variables
+        self._arena = None
+        self._win = None
+        self._compute_strategy = True
+
+    @property
+    def win1(self):
+        """ Returns the winning region of player 1. """
+        return set(np.flatnonzero(self._win == 1).tolist())
+
+    @property
+    def win2(self):
+        """ Returns the winning region of player 2. """
+        return set(np.flatnonzero(self._win == 2).tolist())
+
+    def _validate_game(self, game: IGame) -> bool:
+        if game.graph.has_vertex_property(name="is_final") and game.graph.has_vertex_property(name="turn"):
+            return True
+
+        return False
+
+    def configure(self, strategy=True):
+        """
+        Set configuration parameters for solver.
+
+        :param strategy: Should winning strategies of both players be computed? Default: True.
+        """
+        self._compute_strategy = strategy
+
+    def _solve(self, arena, choice):
+        """ Returns the winning region of player 1. """
+        return buchi(arena, arena.is_final, player=1, strategy=choice, stats=self._stats)
+
+    def run(self):
+        """
+        Runs the solver.
+        """
+        # Check if game graph is available.
+        if self.game.graph is not None:
+            if self._stats is not None:
+                self._stats.reset()
+
+            with self._phase("extraction"):
+                self._arena = arena = Arena.from_graph(self.game.graph)
+
+            with self._phase("attractor"):
+                choice = np.full(arena.num_vertices, -1, dtype=np.int64) if self._compute_strategy else None
+                self._win = np.where(self._solve(arena, choice), 1, 2).astype(np.int8)
+                if arena.mask is not None:
+                    self._win[~arena.mask] = 0
+
+            with self._phase("materialization"):
+                if self._compute_strategy:
+                    self._strategy1 = np.where((self._win == 1) & (arena.turn == 1), choice, -1)
+                    self._strategy2 = np.where((self._win == 2) & (arena.turn == 2), choice, -1)
+
+        # If not, then we will need to construct based on configuration of game.
+        else:
+            raise NotImplementedError("Presently only solver for a game defined by graph is implemented.")
+
+
+class CoBuchiSolver(BuchiSolver):
+    """
+    Solves a deterministic two-player turn-based co-Büchi game. A play is won by player 1 if it eventually visits only
+    the vertices marked by vertex property ``is_final``, otherwise it is won by player 2.
+
+    The game is solved as its dual: a Büchi game for player 2, who must visit the vertices not marked by ``is_final``
+    infinitely often.
+
+    :param game: :class:`Game <iglsynth.game.game.Game>` object.
+    """
+    def _solve(self, arena, choice):
+        """ Returns the winning region of player 1. """
+        return ~buchi(arena, ~arena.is_final, player=2, strategy=choice, stats=self._stats)
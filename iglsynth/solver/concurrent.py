@@ -0,0 +1,123 @@
+"""
+iglsynth: concurrent.py
+
+License goes here...
+"""
+
+import numpy as np
+from iglsynth.solver.attractor import _compress, _expand
+from iglsynth.solver.solver import *
+from iglsynth.game import Game, CONCURRENT
+from iglsynth.game.concurrent import unpack_actions
+
+
+class ConcurrentReachabilitySolver(Solver):
+    """
+    Solves a deterministic two-player concurrent reachability game. At every vertex, both players choose an action
+    simultaneously, and the play follows the edge labeled by the joint action (edge property ``joint``, see
+    :func:`pack_actions <iglsynth.game.concurrent.pack_actions>`). A play is won by player 1 if it visits a vertex
+    marked by vertex property ``is_final``.
+
+    A vertex is winning for player 1 if it is final, or if player 1 has an action ``a1``, such that all edges from the
+    vertex with action ``a1`` of player 1 lead to winning vertices, whichever action player 2 chooses.
+
+    The edges are grouped by (source, a1) by sorting. Every group keeps a counter of its edges, which do not yet lead
+    to winning vertices. In every round, the incoming edges of newly won vertices decrement the counters of their
+    groups, and the sources of groups, whose counter drops to zero, are won. Hence, every edge is scanned at most once.
+
+    :param game: :class:`Game <iglsynth.game.game.Game>` object of kind
+        :data:`CONCURRENT <iglsynth.game.bases.CONCURRENT>`.
+
+    .. note:: :attr:`strategy1` contains the chosen action id of player 1, instead of a successor. The strategy of
+        player 2 is not computed, as a spoiling strategy of player 2 depends on the action of player 1.
+    """
+    def __init__(self, game: Game):
+        super(ConcurrentReachabilitySolver, self).__init__(game)
+
+        # Initialize internal variables
+        self._win = None
+        self._compute_strategy = True
+
+    @property
+    def win1(self):
+        """ Returns the winning region of player 1. """
+        return set(np.flatnonzero(self._win).tolist())
+
+    @property
+    def win2(self):
+        """ Returns the winning region of player 2. """
+        return set(np.flatnonzero(~self._win).tolist())
+
+    def _validate_game(self, game: IGame) -> bool:
+        if game.kind == CONCURRENT and game.graph.has_vertex_property(name="is_final") and \
+                game.graph.has_edge_property(name="joint"):
+            return True
+
+        return False
+
+    def configure(self, strategy=True):
+        """
+        Set configuration parameters for solver.
+
+        :param strategy: Should winning strategy of player 1 be computed? Default: True.
+        """
+        self._compute_strategy = strategy
+
+    def run(self):
+        """
+        Runs the solver.
+        """
+        # Check if game graph is available.
+        if self.game.graph is not None:
+            if self._stats is not None:
+                self._stats.reset()
+
+            graph = self.game.graph
+            n = graph.num_vertices
+            with self._phase("extraction"):
+                edges = graph.edges_array()
+                sources, targets = edges[:, 0], edges[:, 1]
+                a1, _ = unpack_actions(np.asarray(graph.eprop("joint"))[edges[:, 2]])
+                is_final = np.array(graph.vprop("is_final")[:n], dtype=bool)
+
+                # Group edges by (source, a1). Both are non-negative, hence a1 fits below the bits of source.
+                order = np.argsort((sources << 31) | a1, kind="stable")
+                sources, targets, a1 = sources[order], targets[order], a1[order]
+                is_start = np.ones(len(order), dtype=bool)
+                is_start[1:] = (sources[1:] != sources[:-1]) | (a1[1:] != a1[:-1])
+                starts = np.flatnonzero(is_start)
+                group = np.cumsum(is_start) - 1
+                group_source, group_action = sources[starts], a1[starts]
+                count = np.diff(np.append(starts, len(order)))
+
+                # Reverse adjacency of edges (CSC): edges sorted by target
+                rev_indptr, rev_edges = _compress(targets, n)
+
+            with self._phase("attractor"):
+                win = is_final
+                choice = np.full(n, -1, dtype=np.int64)
+                frontier = np.flatnonzero(win)
+                while frontier.size > 0:
+                    pos, _ = _expand(rev_indptr, frontier)
+                    if self._stats is not None:
+                        self._stats.iteration(frontier=frontier.size, edges=pos.size)
+
+                    groups, decrement = np.unique(group[rev_edges[pos]], return_counts=True)
+                    count[groups] -= decrement
+                    done = groups[count[groups] == 0]
+
+                    # A source is won through the first of its groups, which is done.
+                    vertices, first = np.unique(group_source[done], return_index=True)
+                    new = ~win[vertices]
+                    frontier = vertices[new]
+                    choice[frontier] = group_action[done[first[new]]]
+                    win[frontier] = True
+
+                self._win = win
+
+            with self._phase("materialization"):
+                self._strategy1 = choice if self._compute_strategy else None
+
+        # If not, then we will need to construct based on configuration of game.
+        else:
+            raise NotImplementedError("Presently only solver for a game defined by graph is implemented.")
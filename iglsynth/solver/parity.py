@@ -0,0 +1,120 @@
+"""
+iglsynth: parity.py
+
+License goes here...
+"""
+
+import numpy as np
+from iglsynth.solver.attractor import Arena, attractor
+from iglsynth.solver.solver import *
+from iglsynth.game import Game
+
+
+class ParitySolver(Solver):
+    """
+    Implements Zielonka's recursive algorithm for deterministic two-player turn-based parity games.
+
+    Every vertex of game graph must have an integer vertex property ``priority``. A play is won by player 1 if the
+    maximum priority occurring infinitely often is even, otherwise it is won by player 2.
+
+    :param game: :class:`Game <iglsynth.game.game.Game>` object.
+
+    .. note:: Subgames are represented as boolean masks over the arena. No sub-graph or graph property is created
+        during the recursion.
+    """
+    def __init__(self, game: Game):
+        super(ParitySolver, self).__init__(game)
+
+        # Initialize internal variables
+        self._arena = None
+        self._win = None
+        self._choice = None
+        self._compute_strategy = True
+
+    @property
+    def win1(self):
+        """ Returns the winning region of player 1. """
+        return set(np.flatnonzero(self._win == 1).tolist())
+
+    @property
+    def win2(self):
+        """ Returns the winning region of player 2. """
+        return set(np.flatnonzero(self._win == 2).tolist())
+
+    def _validate_game(self, game: IGame) -> bool:
+        if game.graph.has_vertex_property(name="priority") and game.graph.has_vertex_property(name="turn"):
+            return True
+
+        return False
+
+    def configure(self, strategy=True):
+        """
+        Set configuration parameters for solver.
+
+        :param strategy: Should winning strategies of both players be computed? Default: True.
+        """
+        self._compute_strategy = strategy
+
+    def _zielonka(self, game: np.ndarray):
+        """
+        Solves the subgame induced by boolean mask ``game``, and records the winner and the strategy of every vertex in
+        ``self._win`` and ``self._choice``.
+
+        The recursion is only on the subgame without the attractor of maximum priority vertices. Hence, the recursion
+        depth is bounded by the number of distinct priorities. The subgame without the attractor of opponent's
+        winning region is solved iteratively.
+        """
+        arena = self._arena
+        while game.any():
+            # Identify the player who wins if maximum priority occurs infinitely often.
+            d = arena.priority[game].max()
+            p = 1 if d % 2 == 0 else 2
+            o = 2 if p == 1 else 1
+
+            # Solve the subgame without the attractor of maximum priority vertices.
+            top = game & (arena.priority == d)
+            attr = attractor(arena, top, player=p, mask=game, strategy=self._choice, stats=self._stats)
+            sub = game & ~attr
+            self._zielonka(sub)
+
+            # If opponent wins nowhere in subgame, player wins complete game.
+            win_o = sub & (self._win == o)
+            if not win_o.any():
+                self._win[game] = p
+                if self._choice is not None:
+                    # From maximum priority vertices, player may move anywhere in the game.
+                    top = np.flatnonzero(top & (arena.turn == p))
+                    self._choice[top] = arena.successor_in(top, game)
+                return
+
+            # Otherwise, opponent wins its attractor to its winning region. Solve the remaining game.
+            attr = attractor(arena, win_o, player=o, mask=game, strategy=self._choice, stats=self._stats)
+            self._win[attr] = o
+            game = game & ~attr
+
+    def run(self):
+        """
+        Runs the solver.
+        """
+        # Check if game graph is available.
+        if self.game.graph is not None:
+            if self._stats is not None:
+                self._stats.reset()
+
+            with self._phase("extraction"):
+                self._arena = Arena.from_graph(self.game.graph)
+
+            with self._phase("attractor"):
+                self._win = np.zeros(self._arena.num_vertices, dtype=np.int8)
+                self._choice = np.full(self._arena.num_vertices, -1, dtype=np.int64) if self._compute_strategy else None
+                self._zielonka(self._arena.region())
+
+            with self._phase("materialization"):
+                if self._compute_strategy:
+                    turn = self._arena.turn
+                    self._strategy1 = np.where((self._win == 1) & (turn == 1), self._choice, -1)
+                    self._strategy2 = np.where((self._win == 2) & (turn == 2), self._choice, -1)
+
+        # If not, then we will need to construct based on configuration of game.
+        else:
+            raise NotImplementedError("Presently only solver for a game defined by graph is implemented.")
@@ -0,0 +1,253 @@
+"""
+iglsynth: quotient.py
+
+License goes here...
+"""
+
+import numpy as np
+from typing import Type
+from iglsynth.solver.attractor import Arena, _expand
+from iglsynth.solver.stats import SolverStats
+from iglsynth.solver.solver import *
+from iglsynth.game import Game, TURN_BASED
+from iglsynth.util.graph import Graph
+
+
+def bisimulation(arena: Arena, stats: SolverStats = None) -> np.ndarray:
+    """
+    Computes the coarsest bisimulation of a turn-based arena by partition refinement. Two vertices are equivalent if
+    they have the same ``turn``, ``is_final`` and ``priority`` (if any), and the same set of successor blocks. As the
+    player who plays at a vertex is part of its label, this is an alternating bisimulation of the game, and the
+    winner of every objective over these labels is the same at equivalent vertices.
+
+    In every round, the signature of a vertex is the sum of 64-bit hashes of its distinct successor blocks, and the
+    blocks are split by their signature using one sort. When no block is split, the partition is checked exactly:
+    every vertex must have as many distinct successor blocks as all vertices of its block together. A hash collision
+    is resolved by refining again with another seed.
+
+    :param arena: An :class:`Arena <iglsynth.solver.attractor.Arena>` object.
+    :param stats: (Optional) A :class:`SolverStats <iglsynth.solver.stats.SolverStats>` object to record every round.
+
+    :return: An integer array of length ``arena.num_vertices`` with the block id of every vertex. Block ids are
+        ``0, ..., k - 1``.
+    """
+    n = arena.num_vertices
+    sources = np.repeat(np.arange(n, dtype=np.int64), arena.out_degree)
+    targets = arena.fwd_indices
+
+    labels = [arena.turn, arena.is_final] + ([] if arena.priority is None else [arena.priority])
+    block, num_blocks = _blocks(*labels)
+
+    seed = 0
+    while n > 0:
+        # Distinct (source, successor block) pairs, sorted by source.
+        pairs = _distinct(sources * num_blocks + block[targets])
+        src, succ = pairs // num_blocks, pairs % num_blocks
+        count = np.bincount(src, minlength=n)
+
+        signature = np.zeros(n, dtype=np.uint64)
+        has_succ = count > 0
+        if pairs.size > 0:
+            signature[has_succ] = np.add.reduceat(_hash(succ, seed), np.cumsum(count)[has_succ] - count[has_succ])
+
+        refined, num_refined = _blocks(signature, block)
+        if stats is not None:
+            stats.iteration(frontier=num_refined - num_blocks, edges=len(targets))
+
+        if num_refined == num_blocks:
+            union = np.bincount(_distinct(block[src] * num_blocks + succ) // num_blocks, minlength=num_blocks)
+            if np.array_equal(count, union[block]):
+                break
+
+            seed += 1
+
+        block, num_blocks = refined, num_refined
+
+    return block
+
+
+class Quotient(object):
+    """
+    Represents the quotient of a turn-based game by :func:`bisimulation`. Every block of equivalent vertices is a
+    vertex of quotient game, and there is an edge from block ``B`` to block ``C`` if some (hence every) vertex in
+    ``B`` has a successor in ``C``.
+
+    The quotient game is stored with the numpy backend. Its vertices have the properties ``turn``, ``is_final`` and,
+    if the arena has priorities, ``priority``. Every edge has a distinct ``act``.
+
+    :param arena: An :class:`Arena <iglsynth.solver.attractor.Arena>` object.
+    :param stats: (Optional) A :class:`SolverStats <iglsynth.solver.stats.SolverStats>` object to record every
+        refinement round.
+    """
+
+    def __init__(self, arena: Arena, stats: SolverStats = None):
+        self._arena = arena
+        self.block = bisimulation(arena, stats=stats)
+        self.num_blocks = int(self.block.max()) + 1 if arena.num_vertices > 0 else 0
+
+        # Every block is labeled by its first vertex.
+        rep = np.empty(self.num_blocks, dtype=np.int64)
+        rep[self.block[::-1]] = np.arange(arena.num_vertices - 1, -1, -1)
+        sources = np.repeat(np.arange(arena.num_vertices, dtype=np.int64), arena.out_degree)
+        pairs = _distinct(self.block[sources] * self.num_blocks + self.block[arena.fwd_indices])
+
+        vprops = [("turn", "int"), ("is_final", "bool")] + ([] if arena.priority is None else [("priority", "int")])
+        graph = Graph(vprops=vprops, eprops=[("act", "int")], backend="numpy")
+        if self.num_blocks > 0:
+            graph.add_vertices(num=self.num_blocks)
+        graph.vprop("turn")[:] = arena.turn[rep]
+        graph.vprop("is_final")[:] = arena.is_final[rep]
+        if arena.priority is not None:
+            graph.vprop("priority")[:] = arena.priority[rep]
+        graph.add_edge_array(np.column_stack((pairs // max(self.num_blocks, 1), pairs % max(self.num_blocks, 1))),
+                             eprops={"act": np.arange(len(pairs))})
+
+        self.game = Game(kind=TURN_BASED)
+        self.game.define(graph=graph)
+
+    def __repr__(self):
+        return f"Quotient(|V|={self._arena.num_vertices}, |B|={self.num_blocks})"
+
+    def lift_region(self, region: np.ndarray) -> np.ndarray:
+        """
+        Maps a region of quotient game to the original game.
+
+        :param region: A boolean array of length ``num_blocks``.
+        :return: A boolean array of length ``arena.num_vertices``, marking the vertices whose block is in region.
+        """
+        return np.asarray(region, dtype=bool)[self.block]
+
+    def lift_strategy(self, strategy: np.ndarray) -> np.ndarray:
+        """
+        Maps a strategy of quotient game to the original game. Every vertex, whose block chooses a successor block
+        ``C``, chooses its first successor in ``C``.
+
+        :param strategy: An integer array of length ``num_blocks`` with the chosen successor block, or -1.
+        :return: An integer array of length ``arena.num_vertices`` with the chosen successor, or -1.
+        """
+        arena = self._arena
+        wanted = np.asarray(strategy, dtype=np.int64)[self.block]
+        vertices = np.flatnonzero(wanted >= 0)
+
+        pos, lengths = _expand(arena.fwd_indptr, vertices)
+        owner = np.repeat(np.arange(len(vertices)), lengths)
+        hit = self.block[arena.fwd_indices[pos]] == wanted[vertices][owner]
+
+        lifted = np.full(arena.num_vertices, -1, dtype=np.int64)
+        idx, first = np.unique(owner[hit], return_index=True)
+        lifted[vertices[idx]] = arena.fwd_indices[pos[hit][first]]
+        return lifted
+
+
+class QuotientSolver(Solver):
+    """
+    Solves a deterministic two-player turn-based game on its :class:`Quotient`. The game is reduced by
+    :func:`bisimulation`, the quotient game is solved by given solver, and the winning regions and strategies are
+    mapped back to the vertices of game.
+
+    :param game: :class:`Game <iglsynth.game.game.Game>` object.
+    :param solver: A solver class for turn-based games, e.g.
+        :class:`BuchiSolver <iglsynth.solver.buchi.BuchiSolver>`.
+
+    .. note:: The options of :meth:`configure` are passed to the solver of quotient game.
+    """
+    def __init__(self, game: Game, solver: Type[Solver]):
+        super(QuotientSolver, self).__init__(game)
+
+        # Initialize internal variables
+        self._solver = solver
+        self._options = dict()
+        self._quotient = None
+        self._win = None
+
+    @property
+    def win1(self):
+        """ Returns the winning region of player 1. """
+        return set(np.flatnonzero(self._win == 1).tolist())
+
+    @property
+    def win2(self):
+        """ Returns the winning region of player 2. """
+        return set(np.flatnonzero(self._win == 2).tolist())
+
+    @property
+    def quotient(self):
+        """ Returns the :class:`Quotient` of last run. """
+        return self._quotient
+
+    def _validate_game(self, game: IGame) -> bool:
+        if game.kind == TURN_BASED and game.graph.has_vertex_property(name="turn") and \
+                game.graph.has_vertex_property(name="is_final"):
+            return True
+
+        return False
+
+    def configure(self, **kwargs):
+        """
+        Set configuration parameters for the solver of quotient game, e.g. ``strategy=False``.
+        """
+        self._options = kwargs
+
+    def run(self):
+        """
+        Runs the solver.
+        """
+        # Check if game graph is available.
+        if self.game.graph is not None:
+            if self._stats is not None:
+                self._stats.reset()
+
+            with self._phase("extraction"):
+                arena = Arena.from_graph(self.game.graph)
+
+            with self._phase("quotient"):
+                self._quotient = quotient = Quotient(arena, stats=self._stats)
+
+            with self._phase("attractor"):
+                solver = self._solver(quotient.game)
+                solver.configure(**self._options)
+                solver.run()
+
+            with self._phase("materialization"):
+                win1 = np.zeros(quotient.num_blocks, dtype=bool)
+                win1[list(solver.win1)] = True
+                self._win = np.where(quotient.lift_region(win1), 1, 2).astype(np.int8)
+                if arena.mask is not None:
+                    self._win[~arena.mask] = 0
+
+                self._strategy1 = None if solver._strategy1 is None else quotient.lift_strategy(solver._strategy1)
+                self._strategy2 = None if solver._strategy2 is None else quotient.lift_strategy(solver._strategy2)
+
+        # If not, then we will need to construct based on configuration of game.
+        else:
+            raise NotImplementedError("Presently only solver for a game defined by graph is implemented.")
+
+
+def _blocks(*columns: np.ndarray):
+    """ Returns (ids, k) such that vertices with equal values in all columns have equal ids in ``0, ..., k - 1``. """
+    columns = [np.asarray(column) for column in columns]
+    order = np.lexsort(columns)
+    is_new = np.zeros(len(order), dtype=bool)
+    is_new[:1] = True
+    for column in columns:
+        is_new[1:] |= column[order][1:] != column[order][:-1]
+
+    ids = np.empty(len(order), dtype=np.int64)
+    ids[order] = np.cumsum(is_new) - 1
+    return ids, int(is_new.sum())
+
+
+def _distinct(keys: np.ndarray) -> np.ndarray:
+    """ Returns the sorted distinct keys. Unlike ``np.unique``, it only sorts, which is faster for large arrays. """
+    keys = np.sort(keys)
+    is_new = np.ones(len(keys), dtype=bool)
+    is_new[1:] = keys[1:] != keys[:-1]
+    return keys[is_new]
+
+
+def _hash(values: np.ndarray, seed: int) -> np.ndarray:
+    """ Returns the splitmix64 hash of every value. """
+    z = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15 * (seed + 1) % 2 ** 64)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
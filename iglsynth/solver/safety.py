@@ -0,0 +1,83 @@
+"""
+iglsynth: safety.py
+
+License goes here...
+"""
+
+import numpy as np
+from iglsynth.solver.attractor import Arena, attractor
+from iglsynth.solver.solver import *
+from iglsynth.game import Game
+
+
+class SafetySolver(Solver):
+    """
+    Solves a deterministic two-player turn-based safety game. A play is won by player 1 if it visits only the vertices
+    marked by vertex property ``is_final``, otherwise it is won by player 2.
+
+    :param game: :class:`Game <iglsynth.game.game.Game>` object.
+    """
+    def __init__(self, game: Game):
+        super(SafetySolver, self).__init__(game)
+
+        # Initialize internal variables
+        self._arena = None
+        self._win = None
+        self._compute_strategy = True
+
+    @property
+    def win1(self):
+        """ Returns the winning region of player 1. """
+        return set(np.flatnonzero(self._win == 1).tolist())
+
+    @property
+    def win2(self):
+        """ Returns the winning region of player 2. """
+        return set(np.flatnonzero(self._win == 2).tolist())
+
+    def _validate_game(self, game: IGame) -> bool:
+        if game.graph.has_vertex_property(name="is_final") and game.graph.has_vertex_property(name="turn"):
+            return True
+
+        return False
+
+    def configure(self, strategy=True):
+        """
+        Set configuration parameters for solver.
+
+        :param strategy: Should winning strategies of both players be computed? Default: True.
+        """
+        self._compute_strategy = strategy
+
+    def run(self):
+        """
+        Runs the solver. Player 2 wins the attractor of unsafe vertices, player 1 wins the rest.
+        """
+        # Check if game graph is available.
+        if self.game.graph is not None:
+            if self._stats is not None:
+                self._stats.reset()
+
+            with self._phase("extraction"):
+                self._arena = arena = Arena.from_graph(self.game.graph)
+
+            with self._phase("attractor"):
+                choice = np.full(arena.num_vertices, -1, dtype=np.int64) if self._compute_strategy else None
+                lose = attractor(arena, ~arena.is_final, player=2, mask=arena.mask, strategy=choice,
+                                 stats=self._stats)
+                self._win = np.where(lose, 2, 1).astype(np.int8)
+                if arena.mask is not None:
+                    self._win[~arena.mask] = 0
+
+            with self._phase("materialization"):
+                if self._compute_strategy:
+                    # Player 1 stays in its winning region.
+                    safe = np.flatnonzero(~lose & (arena.turn == 1))
+                    choice[safe] = arena.successor_in(safe, ~lose)
+
+                    self._strategy1 = np.where((self._win == 1) & (arena.turn == 1), choice, -1)
+                    self._strategy2 = np.where((self._win == 2) & (arena.turn == 2), choice, -1)
+
+        # If not, then we will need to construct based on configuration of game.
+        else:
+            raise NotImplementedError("Presently only solver for a game defined by graph is implemented.")
@@ -0,0 +1,263 @@
+"""
+iglsynth: scc.py
+
+License goes here...
+"""
+
+import ctypes
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.sharedctypes import RawArray
+from iglsynth.solver.attractor import Arena, attractor, _compress, _expand
+from iglsynth.solver.stats import SolverStats
+from iglsynth.util import csr
+from iglsynth.util.graph import *
+from iglsynth.util.lazy import LazyModule
+
+# graph_tool is imported on first use.
+topology = LazyModule("graph_tool.topology")
+
+
+# Levels with fewer vertices are solved in the main process, as they are not worth the inter-process communication.
+MIN_PARALLEL_VERTICES = 10000
+
+# Arrays shared with worker processes. Set by _init_worker in every worker.
+_shared = dict()
+
+
+def components(graph: Graph):
+    """
+    Labels the strongly connected components of graph using graph_tool, or using
+    :func:`iglsynth.util.csr.label_components` if the graph uses NumPy backend, or using
+    :func:`iglsynth.util.csr.tarjan` on its adjacency if the graph is frozen.
+
+    :param graph: A :class:`Graph <iglsynth.util.graph.Graph>` or
+        :class:`FrozenGraph <iglsynth.util.frozen.FrozenGraph>` object.
+    :return: An integer array with component label of every vertex.
+    """
+    if graph.backend == "frozen":
+        return csr.tarjan(graph.fwd_indptr, graph.fwd_indices)
+
+    if graph.backend == "numpy":
+        return csr.label_components(graph._graph)
+
+    labels, _ = topology.label_components(graph._graph, directed=True)
+    return np.asarray(labels.a, dtype=np.int64)
+
+
+def levels(indptr: np.ndarray, indices: np.ndarray, labels: np.ndarray):
+    """
+    Computes the level of every component in the DAG of strongly connected components. Components without edges to
+    other components are at level 0. Every other component is one level above its highest successor component.
+    Hence, no two components at the same level are connected.
+
+    :param indptr: Forward adjacency (CSR) index pointer of graph.
+    :param indices: Forward adjacency (CSR) indices of graph.
+    :param labels: An integer array with component label of every vertex.
+
+    :return: An integer array with level of every component.
+    """
+    num_components = int(labels.max()) + 1 if labels.size > 0 else 0
+    src = labels[np.repeat(np.arange(len(labels)), np.diff(indptr))]
+    tgt = labels[indices]
+    cross = src != tgt
+    src, tgt = src[cross], tgt[cross]
+
+    # Peel the components, whose successor components are all at lower levels.
+    count = np.bincount(src, minlength=num_components)
+    rev_indptr, order = _compress(tgt, num_components)
+    rev_indices = src[order]
+
+    level = np.full(num_components, -1, dtype=np.int64)
+    frontier = np.flatnonzero(count == 0)
+    current = 0
+    while frontier.size > 0:
+        level[frontier] = current
+        pre = rev_indices[_expand(rev_indptr, frontier)[0]]
+        np.subtract.at(count, pre, 1)
+        frontier = np.unique(pre[count[pre] == 0])
+        current += 1
+
+    return level
+
+
+def solve_open(indptr: np.ndarray, indices: np.ndarray, turn: np.ndarray, is_final: np.ndarray,
+               vertices: np.ndarray, win: np.ndarray, strategy: np.ndarray = None):
+    """
+    Solves the reachability game for player 1 on given vertices, whose successors outside ``vertices`` are already
+    solved in ``win``. The result is written into ``win`` (and ``strategy``).
+
+    The vertices are solved as a local arena, in which every won successor outside ``vertices`` is a target vertex,
+    and all other successors outside ``vertices`` are merged into a single sink vertex that nobody wins.
+
+    :param vertices: A sorted integer array of vertex ids.
+    :param win: A boolean array marking the winning region of player 1.
+    :param strategy: (Optional) An integer array recording the chosen successor of player 1 vertices.
+    """
+    k = len(vertices)
+    if k == 0:
+        return
+
+    # Classify the successors of all vertices as inside, won outside or lost outside.
+    pos, lengths = _expand(indptr, vertices)
+    owner = np.repeat(np.arange(k), lengths)
+    succ = indices[pos]
+    loc = np.minimum(np.searchsorted(vertices, succ), k - 1)
+    inside = vertices[loc] == succ
+
+    outside = np.flatnonzero(~inside)
+    won = outside[win[succ[outside]]]
+    boundary, local = np.unique(succ[won], return_inverse=True)
+    sink = k + len(boundary)
+
+    # Construct local arena: [vertices..., boundary..., sink]
+    target = np.full(len(succ), sink, dtype=np.int64)
+    target[inside] = loc[inside]
+    target[won] = k + local.reshape(-1)
+
+    local_turn = np.zeros(sink + 1, dtype=np.int64)
+    local_turn[:k] = turn[vertices]
+    local_final = np.zeros(sink + 1, dtype=bool)
+    local_final[:k] = is_final[vertices]
+    local_final[k:sink] = True
+
+    edges = np.column_stack((owner, target, np.arange(len(succ))))
+    arena = Arena(num_vertices=sink + 1, edges=edges, turn=local_turn, is_final=local_final)
+
+    local_strategy = None if strategy is None else np.full(sink + 1, -1, dtype=np.int64)
+    local_win = attractor(arena, local_final, player=1, strategy=local_strategy)
+    win[vertices] = local_win[:k]
+
+    if strategy is not None:
+        to_global = np.concatenate((vertices, boundary, [-1]))
+        chosen = np.flatnonzero(local_strategy[:k] >= 0)
+        strategy[vertices[chosen]] = to_global[local_strategy[chosen]]
+
+
+def _share(array: np.ndarray, ctype):
+    """ Returns a copy of array in shared memory, and a NumPy view of it. """
+    raw = RawArray(ctype, max(len(array), 1))
+    view = np.frombuffer(raw, dtype=array.dtype)[:len(array)]
+    view[:] = array
+    return raw, view
+
+
+def _init_worker(shared):
+    """ Attaches the shared arrays in a worker process. """
+    for name, (raw, dtype, size) in shared.items():
+        _shared[name] = np.frombuffer(raw, dtype=dtype)[:size]
+
+
+def _solve_chunk(vertices):
+    """ Solves a chunk of independent components in a worker process. """
+    solve_open(_shared["indptr"], _shared["indices"], _shared["turn"], _shared["is_final"], vertices,
+               _shared["win"], _shared.get("strategy"))
+
+
+def _chunks(vertices: np.ndarray, labels: np.ndarray, num_chunks: int):
+    """ Splits vertices into at most num_chunks sorted chunks of similar size, without splitting any component. """
+    vertices = vertices[np.argsort(labels[vertices], kind="stable")]
+    starts = np.flatnonzero(np.diff(labels[vertices], prepend=-1))
+    cuts = np.searchsorted(starts, np.linspace(0, len(vertices), num_chunks + 1)[1:-1])
+    cuts = np.unique(starts[np.minimum(cuts, len(starts) - 1)])
+    return [np.sort(chunk) for chunk in np.split(vertices, cuts) if chunk.size > 0]
+
+
+def num_workers(arena: Arena, workers: int = None) -> int:
+    """
+    Returns the number of worker processes used by :func:`scc_attractor` on given arena, i.e. ``workers``, or 1 if
+    the arena has fewer than :data:`MIN_PARALLEL_VERTICES` vertices.
+
+    :param arena: An :class:`Arena <iglsynth.solver.attractor.Arena>` object.
+    :param workers: Number of worker processes. Default: Number of CPUs.
+    """
+    workers = os.cpu_count() if workers is None else workers
+    return workers if arena.num_vertices >= MIN_PARALLEL_VERTICES else 1
+
+
+def scc_attractor(arena: Arena, labels: np.ndarray = None, workers: int = None, strategy: np.ndarray = None,
+                  mask: np.ndarray = None, stats: SolverStats = None):
+    """
+    Computes the attractor of final vertices for player 1 component-wise. The components are solved in reverse
+    topological order of the DAG of strongly connected components, one level at a time. The components at the same
+    level are independent, and every level with at least :data:`MIN_PARALLEL_VERTICES` vertices is solved in parallel
+    by a pool of worker processes. The smaller levels between them are merged, and solved by one sequential attractor
+    computation, since their vertices only depend on lower levels.
+
+    The arena arrays, winning region and strategy are placed in shared memory once, and every worker writes the
+    result of its components directly into them. Only vertex ids of components are sent to the workers.
+
+    When a single worker is used (see :func:`num_workers`), or no level is large enough, the attractor is computed
+    on the complete arena by :func:`attractor <iglsynth.solver.attractor.attractor>`. Hence, this method pays off only
+    with several CPUs on games, whose DAG of components has levels of many vertices, e.g. many independent components.
+    Otherwise, it takes as long as :func:`attractor <iglsynth.solver.attractor.attractor>`, plus the time to compute
+    the components and their levels.
+
+    :param arena: An :class:`Arena <iglsynth.solver.attractor.Arena>` object.
+    :param labels: (Optional) An integer array with component label of every vertex. It is only used with several
+        workers. Default: Computed by :func:`iglsynth.util.csr.tarjan`.
+    :param workers: Number of worker processes. Default: Number of CPUs.
+    :param strategy: (Optional) An integer array recording the chosen successor of player 1 vertices.
+    :param mask: (Optional) A boolean array marking the vertices in arena. The final vertices outside the mask are
+        not targets.
+    :param stats: (Optional) A :class:`SolverStats <iglsynth.solver.stats.SolverStats>` object to record every
+        sequential attractor round and every parallel level.
+
+    :return: A boolean array marking the winning region of player 1.
+    """
+    target = arena.is_final if mask is None else arena.is_final & mask
+    workers = num_workers(arena, workers)
+    if workers == 1:
+        return attractor(arena, target, player=1, strategy=strategy, stats=stats)
+
+    labels = csr.tarjan(arena.fwd_indptr, arena.fwd_indices) if labels is None else labels
+    level = levels(arena.fwd_indptr, arena.fwd_indices, labels)[labels]
+    level_indptr, order = _compress(level, int(level.max()) + 1 if level.size > 0 else 0)
+    size = np.diff(level_indptr)
+    if not (size >= MIN_PARALLEL_VERTICES).any():
+        return attractor(arena, target, player=1, strategy=strategy, stats=stats)
+
+    arrays = {"indptr": arena.fwd_indptr, "indices": arena.fwd_indices, "turn": arena.turn, "is_final": target,
+              "win": np.zeros(arena.num_vertices, dtype=bool)}
+    if strategy is not None:
+        arrays["strategy"] = strategy
+
+    shared = dict()
+    for name, array in arrays.items():
+        raw, arrays[name] = _share(array, ctypes.c_bool if array.dtype == bool else ctypes.c_int64)
+        shared[name] = (raw, array.dtype, len(array))
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(shared, ))
+
+    try:
+        # Consecutive small levels [start, current) are solved together, before the next large level.
+        start = 0
+        for current in range(len(size) + 1):
+            if current < len(size) and size[current] < MIN_PARALLEL_VERTICES:
+                continue
+
+            if start < current:
+                vertices = order[level_indptr[start]:level_indptr[current]]
+                if stats is not None:
+                    stats.iteration(frontier=len(vertices), edges=arena.out_degree[vertices].sum())
+
+                solve_open(arrays["indptr"], arrays["indices"], arrays["turn"], arrays["is_final"],
+                           np.sort(vertices), arrays["win"], arrays.get("strategy"))
+
+            if current < len(size):
+                vertices = order[level_indptr[current]:level_indptr[current + 1]]
+                if stats is not None:
+                    stats.iteration(frontier=len(vertices), edges=arena.out_degree[vertices].sum())
+
+                list(pool.map(_solve_chunk, _chunks(vertices, labels, 4 * workers)))
+
+            start = current + 1
+
+    finally:
+        pool.shutdown()
+
+    if strategy is not None:
+        strategy[:] = arrays["strategy"]
+
+    return np.array(arrays["win"])
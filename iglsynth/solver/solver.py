@@ -1,4 +1,6 @@
+import contextlib
 from iglsynth.game.bases import *
+from iglsynth.solver.stats import SolverStats
 
 
 class Solver(abc.ABC):
@@ -7,11 +9,81 @@ class Solver(abc.ABC):
             raise ValueError("Game Validation Failed!! This solver cannot be used for the provided game.")
 
         self._game = game
+        self._strategy1 = None
+        self._strategy2 = None
+        self._stats = None
 
     @property
     def game(self):
         return self._game
 
+    @property
+    def stats(self):
+        """
+        Returns the :class:`SolverStats <iglsynth.solver.stats.SolverStats>` of last run, or None if instrumentation is
+        disabled.
+        """
+        return self._stats
+
+    @property
+    def strategy1(self):
+        """
+        Returns the winning strategy of player 1 as an integer array indexed by vertex id. For every vertex of player 1
+        in winning region of player 1, the array contains the chosen successor. All other entries are -1.
+
+        :raises ValueError: If the strategy of player 1 is not computed.
+        """
+        if self._strategy1 is None:
+            raise ValueError("Strategy of player 1 is not computed. Check the solver configuration.")
+
+        return self._strategy1
+
+    @property
+    def strategy2(self):
+        """
+        Returns the winning strategy of player 2 as an integer array indexed by vertex id. For every vertex of player 2
+        in winning region of player 2, the array contains the chosen successor. All other entries are -1.
+
+        :raises ValueError: If the strategy of player 2 is not computed.
+        """
+        if self._strategy2 is None:
+            raise ValueError("Strategy of player 2 is not computed. Check the solver configuration.")
+
+        return self._strategy2
+
+    def choice(self, vid: int):
+        """
+        Returns the successor chosen at given vertex by the winning strategy of player who plays at that vertex.
+
+        :param vid: Vertex ID.
+        :type vid: int
+
+        :return: Vertex ID of chosen successor, or None if no computed strategy defines a choice at given vertex.
+        """
+        for strategy in (self._strategy1, self._strategy2):
+            if strategy is not None and strategy[vid] >= 0:
+                return int(strategy[vid])
+
+        return None
+
+    def instrument(self, enabled: bool = True, callback: Callable = None, interval: int = 1):
+        """
+        Enables (or disables) the collection of statistics during :meth:`run`. When disabled (default), the solver
+        only checks a ``None`` reference at every phase and iteration.
+
+        :param enabled: Should statistics be collected? Default: True.
+        :param callback: (Optional) A function ``callback(stats)``, which is called every ``interval`` iterations.
+        :param interval: Number of iterations between two calls of ``callback``. Default: 1.
+        """
+        self._stats = SolverStats(callback=callback, interval=interval) if enabled else None
+
+    def _phase(self, name: str):
+        """ Returns a context manager timing the given phase, if instrumentation is enabled. """
+        if self._stats is None:
+            return contextlib.nullcontext()
+
+        return self._stats.phase(name)
+
     @abc.abstractmethod
     def _validate_game(self, game: IGame) -> bool:
         raise NotImplementedError
@@ -23,4 +95,3 @@ class Solver(abc.ABC):
     @abc.abstractmethod
     def run(self):
         raise NotImplementedError
-
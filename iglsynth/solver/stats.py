@@ -0,0 +1,103 @@
+"""
+iglsynth: stats.py
+
+License goes here...
+"""
+
+import contextlib
+import json
+import sys
+import time
+from typing import Callable
+
+try:
+    import resource
+except ImportError:     # pragma: no cover (resource is not available on Windows)
+    resource = None
+
+
+class SolverStats(object):
+    """
+    Collects statistics of a solver run: per-iteration frontier sizes and number of edges scanned, wall and CPU time
+    of every phase, and peak memory of the process.
+
+    :param callback: (Optional) A function ``callback(stats)``, which is called every ``interval`` iterations.
+    :type callback: Callable
+
+    :param interval: Number of iterations between two calls of ``callback``.
+    :type interval: int (> 0)
+    """
+
+    def __init__(self, callback: Callable = None, interval: int = 1):
+        assert interval > 0, f"Required, interval > 0. Received, interval = {interval}."
+        self._callback = callback
+        self._interval = interval
+        self.frontier = []
+        self.edges = []
+        self.phases = dict()
+        self.peak_memory = None
+
+    def __repr__(self):
+        return f"SolverStats(iterations={self.num_iterations}, phases={list(self.phases.keys())})"
+
+    @property
+    def num_iterations(self):
+        """ Returns the number of recorded iterations. """
+        return len(self.frontier)
+
+    def reset(self):
+        """ Clears all recorded statistics. """
+        self.frontier = []
+        self.edges = []
+        self.phases = dict()
+        self.peak_memory = None
+
+    def iteration(self, frontier: int, edges: int):
+        """
+        Records an iteration of solver.
+
+        :param frontier: Number of vertices in frontier of iteration.
+        :param edges: Number of edges scanned in iteration.
+        """
+        self.frontier.append(int(frontier))
+        self.edges.append(int(edges))
+        if self._callback is not None and len(self.frontier) % self._interval == 0:
+            self._callback(self)
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Context manager, which adds the wall and CPU time spent in its body to the given phase.
+
+        :param name: Name of phase.
+        """
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            times = self.phases.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+            times["wall"] += time.perf_counter() - wall
+            times["cpu"] += time.process_time() - cpu
+            if resource is not None:
+                # On macOS, ru_maxrss is in bytes. On Linux, it is in kilobytes.
+                maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                self.peak_memory = maxrss if sys.platform == "darwin" else maxrss * 1024
+
+    def to_dict(self):
+        """ Returns the statistics as a dictionary. """
+        return {"iterations": {"frontier": self.frontier, "edges": self.edges},
+                "phases": self.phases,
+                "peak_memory": self.peak_memory}
+
+    def to_json(self, filename: str = None):
+        """
+        Returns the statistics as a JSON string. If filename is given, the string is also written to the file.
+
+        :param filename: (Optional) Name of output file.
+        """
+        data = json.dumps(self.to_dict(), indent=2)
+        if filename is not None:
+            with open(filename, "w") as f:
+                f.write(data)
+
+        return data
@@ -0,0 +1,140 @@
+import random
+from iglsynth.game.game import *
+from iglsynth.solver.buchi import *
+from iglsynth.solver.parity import *
+from iglsynth.solver.safety import *
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+
+def random_game(num_vertices, num_edges, seed, priority=None):
+    rng = random.Random(seed)
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool"), ("priority", "int")], eprops=[("act", "int")])
+    graph.add_vertices(num=num_vertices)
+    edges = [(v, rng.randrange(num_vertices)) for v in range(num_vertices)]
+    edges += [(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(num_edges - num_vertices)]
+    graph.add_edges(edges=edges)
+
+    for vid in range(num_vertices):
+        final = rng.random() < 0.3
+        graph.set_vertex_property(name="turn", vid=vid, value=rng.choice([1, 2]))
+        graph.set_vertex_property(name="is_final", vid=vid, value=final)
+        graph.set_vertex_property(name="priority", vid=vid, value=priority[final])
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    return game
+
+
+def check_strategies(solver, graph, exclude=frozenset()):
+    """ Checks that the chosen successors of both players stay in their own winning regions. """
+    for player, win, strategy in [(1, solver.win1, solver.strategy1), (2, solver.win2, solver.strategy2)]:
+        for v in win - exclude:
+            if graph.get_vertex_property(name="turn", vid=v) == player:
+                assert strategy[v] in win
+
+
+def test_buchi_vs_parity():
+    # Büchi objective is a parity objective with priority 2 for final and 1 for other vertices.
+    for seed in range(10):
+        game = random_game(num_vertices=40, num_edges=80, seed=seed, priority={True: 2, False: 1})
+
+        reference = ParitySolver(game=game)
+        reference.run()
+
+        solver = BuchiSolver(game=game)
+        solver.run()
+
+        assert solver.win1 == reference.win1
+        assert solver.win2 == reference.win2
+        check_strategies(solver, game.graph)
+
+
+def test_cobuchi_vs_parity():
+    # Co-Büchi objective is a parity objective with priority 0 for final and 1 for other vertices.
+    for seed in range(10):
+        game = random_game(num_vertices=40, num_edges=80, seed=seed, priority={True: 0, False: 1})
+
+        reference = ParitySolver(game=game)
+        reference.run()
+
+        solver = CoBuchiSolver(game=game)
+        solver.run()
+
+        assert solver.win1 == reference.win1
+        assert solver.win2 == reference.win2
+        check_strategies(solver, game.graph)
+
+
+def test_safety():
+    for seed in range(10):
+        game = random_game(num_vertices=40, num_edges=80, seed=seed, priority={True: 0, False: 1})
+        graph = game.graph
+
+        solver = SafetySolver(game=game)
+        solver.run()
+
+        # Player 1 must never leave final vertices, player 2 must not be able to force a non-final vertex.
+        win1 = solver.win1
+        assert win1 | solver.win2 == set(graph.vertices)
+        for v in win1:
+            assert graph.get_vertex_property(name="is_final", vid=v)
+            if graph.get_vertex_property(name="turn", vid=v) == 2:
+                assert set(graph.out_neighbors(vid=v)) <= win1
+
+        # Player 2 needs no choice at non-final vertices.
+        unsafe = {v for v in graph.vertices if not graph.get_vertex_property(name="is_final", vid=v)}
+        check_strategies(solver, graph, exclude=unsafe)
+
+
+def test_subgraph():
+    for seed in range(5):
+        # Vertex 0 is filtered out of sub-graph.
+        game = random_game(num_vertices=40, num_edges=80, seed=seed, priority={True: 2, False: 1})
+        vmask = np.ones(40, dtype=bool)
+        vmask[0] = False
+        sub = Game(kind=TURN_BASED)
+        sub.define(graph=SubGraph(graph=game.graph, vmask=vmask))
+
+        # Reference: Vertex 0 is isolated.
+        graph = game.graph
+        for edge in [edge for edge in graph.edges if 0 in (edge.source, edge.target)]:
+            graph.remove_edge(edge)
+
+        for solver_type in (BuchiSolver, CoBuchiSolver, SafetySolver, ParitySolver):
+            reference = solver_type(game=game)
+            reference.run()
+
+            solver = solver_type(game=sub)
+            solver.run()
+            assert solver.win1 == reference.win1 - {0} and solver.win2 == reference.win2 - {0}
+
+
+def test_gadget_chain():
+    # Every iteration of Büchi solver removes one gadget of chain, while the attractor of rest of game is kept.
+    for seed in range(5):
+        game = random_game(num_vertices=40, num_edges=80, seed=seed, priority={True: 2, False: 1})
+        graph = game.graph
+        sink = 40
+        graph.add_vertices(num=1 + 3 * 6)
+        graph.add_edge(uid=sink, vid=sink)
+        for i in range(6):
+            p, q, t = 41 + 3 * i, 42 + 3 * i, 43 + 3 * i
+            prev = sink if i == 0 else t - 3
+            graph.add_edges(edges=[(p, prev), (p, q), (q, p), (t, p), (i, p)])
+            graph.set_vertex_property(name="is_final", vid=t, value=True)
+
+        for vid in range(40, 59):
+            is_final = graph.get_vertex_property(name="is_final", vid=vid)
+            graph.set_vertex_property(name="turn", vid=vid, value=1)
+            graph.set_vertex_property(name="priority", vid=vid, value=2 if is_final else 1)
+
+        reference = ParitySolver(game=game)
+        reference.run()
+
+        solver = BuchiSolver(game=game)
+        solver.run()
+
+        assert solver.win1 == reference.win1
+        assert solver.win2 == reference.win2
+        assert not solver.win1 & set(range(40, 59))
+        check_strategies(solver, graph)
@@ -0,0 +1,96 @@
+import random
+import numpy as np
+import pytest
+from iglsynth.game.concurrent import *
+from iglsynth.game.game import *
+from iglsynth.solver.concurrent import *
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+
+def concurrent_game(num_vertices, edges, a1, a2, final):
+    graph = Graph(vprops=[("is_final", "bool")], eprops=[("act", "int"), ("joint", "int")])
+    graph.add_vertices(num=num_vertices)
+    joint = pack_actions(a1, a2)
+    graph.add_edge_array(np.array(edges), eprops={"act": np.arange(len(edges)), "joint": joint})
+    graph.vprop("is_final")[final] = True
+
+    game = Game(kind=CONCURRENT)
+    game.define(graph=graph)
+    return game
+
+
+def random_concurrent_game(num_vertices, num_actions, seed):
+    rng = random.Random(seed)
+    edges, a1, a2 = [], [], []
+    for v in range(num_vertices):
+        for i in range(rng.randint(1, num_actions)):
+            for j in range(rng.randint(1, num_actions)):
+                edges.append((v, rng.randrange(num_vertices)))
+                a1.append(i)
+                a2.append(j)
+
+    final = [v for v in range(num_vertices) if rng.random() < 0.1]
+    return concurrent_game(num_vertices, edges, a1, a2, final), edges, a1, final
+
+
+def naive_reach(num_vertices, edges, a1, final):
+    """ Computes the sure winning region of player 1 using Python sets. """
+    groups = dict()
+    for (u, v), a in zip(edges, a1):
+        groups.setdefault((u, a), []).append(v)
+
+    win = set(final)
+    while True:
+        new = {u for (u, a), targets in groups.items() if u not in win and all(v in win for v in targets)}
+        if not new:
+            return win
+        win |= new
+
+
+def test_pack_actions():
+    joint = pack_actions([0, 3, 2 ** 31 - 1], [5, 0, 7])
+    a1, a2 = unpack_actions(joint)
+    assert a1.tolist() == [0, 3, 2 ** 31 - 1] and a2.tolist() == [5, 0, 7]
+
+    with pytest.raises(ValueError):
+        pack_actions(-1, 0)
+
+
+def test_concurrent_reachability():
+    # Matching pennies at vertex 0: Player 1 reaches final vertex 1 only if both actions match.
+    #   At vertex 3, action 0 of player 1 reaches vertex 1 whatever player 2 chooses.
+    #   At vertex 4, action 1 of player 1 reaches vertex 3 or vertex 1.
+    edges = [(0, 1), (0, 2), (0, 2), (0, 1), (2, 2), (3, 1), (3, 1), (3, 2), (4, 2), (4, 3), (4, 1)]
+    a1 = [0, 0, 1, 1, 0, 0, 0, 1, 0, 1, 1]
+    a2 = [0, 1, 0, 1, 0, 0, 1, 0, 0, 0, 1]
+    game = concurrent_game(5, edges, a1, a2, final=[1])
+
+    solver = ConcurrentReachabilitySolver(game=game)
+    solver.run()
+    assert solver.win1 == {1, 3, 4} and solver.win2 == {0, 2}
+    assert solver.choice(3) == 0 and solver.choice(4) == 1 and solver.choice(0) is None
+
+    with pytest.raises(ValueError):
+        _ = solver.strategy2
+
+
+def test_concurrent_reachability_random():
+    for seed in range(5):
+        game, edges, a1, final = random_concurrent_game(num_vertices=50, num_actions=3, seed=seed)
+        solver = ConcurrentReachabilitySolver(game=game)
+        solver.instrument()
+        solver.run()
+        assert solver.win1 == naive_reach(50, edges, a1, final)
+
+        # Every chosen action leads to winning region, whatever player 2 chooses.
+        for (u, v), a in zip(edges, a1):
+            if u in solver.win1 and u not in final and solver.choice(u) == a:
+                assert v in solver.win1
+
+
+def test_concurrent_reachability_invalid_game():
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool")], eprops=[("act", "int")])
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    with pytest.raises(ValueError):
+        ConcurrentReachabilitySolver(game=game)
@@ -0,0 +1,103 @@
+import pytest
+import random
+from iglsynth.game.game import *
+from iglsynth.solver.parity import *
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+
+def parity_game(num_vertices, edges, turn, priority):
+    graph = Graph(vprops=[("turn", "int"), ("priority", "int"), ("is_final", "bool")], eprops=[("act", "int")])
+    graph.add_vertices(num=num_vertices)
+    graph.add_edges(edges=edges)
+
+    for vid in range(num_vertices):
+        graph.set_vertex_property(name="turn", vid=vid, value=turn[vid])
+        graph.set_vertex_property(name="priority", vid=vid, value=priority[vid])
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    return game
+
+
+def random_parity_game(num_vertices, num_edges, num_priorities, seed):
+    rng = random.Random(seed)
+    edges = [(v, rng.randrange(num_vertices)) for v in range(num_vertices)]
+    edges += [(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(num_edges - num_vertices)]
+    turn = [rng.choice([1, 2]) for _ in range(num_vertices)]
+    priority = [rng.randrange(num_priorities) for _ in range(num_vertices)]
+    return parity_game(num_vertices, edges, turn, priority), edges, turn, priority
+
+
+def is_winning_strategy(player, region, strategy, edges, turn, priority):
+    """ Checks that no play consistent with strategy that stays in region is won by opponent. """
+    succ = {v: [] for v in region}
+    for u, v in edges:
+        if u in region and (turn[u] != player or strategy[u] == v):
+            succ[u].append(v)
+
+    # Strategy must choose successors in region, and opponent must not be able to leave region.
+    if any(v not in region for u in region for v in succ[u]) or any(len(succ[u]) == 0 for u in region):
+        return False
+
+    # No cycle, whose maximum priority is bad for player, may be closed.
+    for u in region:
+        if priority[u] % 2 == (0 if player == 1 else 1):
+            continue
+
+        stack = list(succ[u])
+        visited = set()
+        while stack:
+            w = stack.pop()
+            if w == u:
+                return False
+            if w in visited or priority[w] > priority[u]:
+                continue
+            visited.add(w)
+            stack.extend(succ[w])
+
+    return True
+
+
+def test_parity_simple():
+    # Player 1 at vertex 0 chooses between an even (1) and an odd (2) self-looping vertex.
+    game = parity_game(num_vertices=3, edges=[(0, 1), (0, 2), (1, 1), (2, 2)], turn=[1, 1, 1], priority=[3, 2, 1])
+    solver = ParitySolver(game=game)
+    solver.run()
+
+    assert solver.win1 == {0, 1}
+    assert solver.win2 == {2}
+    assert solver.strategy1[0] == 1
+    assert list(solver.strategy2) == [-1, -1, -1]
+
+    # If vertex 0 belongs to player 2, player 2 wins it by choosing vertex 2.
+    game = parity_game(num_vertices=3, edges=[(0, 1), (0, 2), (1, 1), (2, 2)], turn=[2, 1, 1], priority=[3, 2, 1])
+    solver = ParitySolver(game=game)
+    solver.run()
+
+    assert solver.win1 == {1}
+    assert solver.win2 == {0, 2}
+    assert solver.strategy2[0] == 2
+
+
+def test_parity_random():
+    for seed in range(10):
+        game, edges, turn, priority = random_parity_game(num_vertices=30, num_edges=60, num_priorities=5, seed=seed)
+        solver = ParitySolver(game=game)
+        solver.run()
+
+        win1, win2 = solver.win1, solver.win2
+        assert win1 | win2 == set(range(30))
+        assert not win1 & win2
+        assert is_winning_strategy(1, win1, solver.strategy1, edges, turn, priority)
+        assert is_winning_strategy(2, win2, solver.strategy2, edges, turn, priority)
+
+
+def test_parity_without_strategy():
+    game, _, _, _ = random_parity_game(num_vertices=10, num_edges=20, num_priorities=3, seed=0)
+    solver = ParitySolver(game=game)
+    solver.configure(strategy=False)
+    solver.run()
+
+    assert len(solver.win1 | solver.win2) == 10
+    with pytest.raises(ValueError):
+        _ = solver.strategy1
@@ -0,0 +1,70 @@
+import random
+import numpy as np
+from iglsynth.game.game import *
+from iglsynth.solver.attractor import Arena
+from iglsynth.solver.buchi import *
+from iglsynth.solver.parity import *
+from iglsynth.solver.quotient import *
+from iglsynth.solver.safety import *
+from iglsynth.solver.tests.test_buchi import check_strategies
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+
+def copied_game(num_vertices, num_edges, copies, seed):
+    """ Returns a random game, which consists of ``copies`` copies of a random game connected to each other. """
+    rng = random.Random(seed)
+    turn = [rng.choice([1, 2]) for _ in range(num_vertices)]
+    final = [rng.random() < 0.3 for _ in range(num_vertices)]
+    edges = [(v, rng.randrange(num_vertices)) for v in range(num_vertices)]
+    edges += [(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(num_edges - num_vertices)]
+
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool"), ("priority", "int")], eprops=[("act", "int")])
+    graph.add_vertices(num=num_vertices * copies)
+    graph.vprop("turn")[:] = turn * copies
+    graph.vprop("is_final")[:] = final * copies
+    graph.vprop("priority")[:] = [2 if f else 1 for f in final] * copies
+
+    # Every edge leads to the same vertex in a random copy.
+    edges = [(u + num_vertices * i, v + num_vertices * rng.randrange(copies)) for i in range(copies) for u, v in edges]
+    graph.add_edge_array(np.array(edges), eprops={"act": np.arange(len(edges))})
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    return game
+
+
+def test_bisimulation():
+    # Vertices 0 and 1 are final self-loops of player 1. Vertex 2 and 3 move to one of them. Vertex 4 is a dead-end.
+    turn = np.array([1, 1, 2, 2, 2])
+    is_final = np.array([True, True, False, False, False])
+    edges = np.array([(0, 0, 0), (1, 1, 1), (2, 0, 2), (3, 1, 3), (3, 0, 4)])
+    block = bisimulation(Arena(num_vertices=5, edges=edges, turn=turn, is_final=is_final))
+    assert block[0] == block[1] and block[2] == block[3]
+    assert len(set(block.tolist())) == 3
+
+    # Vertex 3 moves to the dead-end as well.
+    edges = np.vstack((edges, [(3, 4, 5)]))
+    block = bisimulation(Arena(num_vertices=5, edges=edges, turn=turn, is_final=is_final))
+    assert block[2] != block[3] and len(set(block.tolist())) == 4
+
+
+def test_quotient_solver():
+    for seed in range(5):
+        game = copied_game(num_vertices=30, num_edges=60, copies=4, seed=seed)
+        for solver in (SafetySolver, BuchiSolver, CoBuchiSolver, ParitySolver):
+            direct = solver(game)
+            direct.run()
+
+            reduced = QuotientSolver(game, solver=solver)
+            reduced.run()
+            assert reduced.quotient.num_blocks <= 30
+            assert reduced.win1 == direct.win1 and reduced.win2 == direct.win2
+
+            # Player 2 needs no choice at non-final vertices of safety game.
+            unsafe = set(np.flatnonzero(~game.graph.vprop("is_final")).tolist()) if solver is SafetySolver else set()
+            check_strategies(reduced, game.graph, exclude=unsafe)
+
+            # Options are passed to the solver of quotient.
+            reduced.configure(strategy=False)
+            reduced.run()
+            assert reduced.win1 == direct.win1
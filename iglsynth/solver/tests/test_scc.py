@@ -0,0 +1,41 @@
+import numpy as np
+from iglsynth.solver import scc
+from iglsynth.solver.attractor import Arena, attractor
+from iglsynth.solver.tests.test_zielonka import random_game
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+
+def test_levels():
+    # Components: {0, 1} -> {2} -> {3}, and {0, 1} -> {3}
+    edges = np.array([(0, 1, 0), (1, 0, 1), (1, 2, 2), (2, 3, 3), (0, 3, 4)])
+    arena = Arena(num_vertices=4, edges=edges, turn=np.ones(4), is_final=np.zeros(4))
+    labels = np.array([0, 0, 1, 2])
+
+    assert list(scc.levels(arena.fwd_indptr, arena.fwd_indices, labels)) == [2, 1, 0]
+
+
+def test_scc_attractor_parallel(monkeypatch):
+    # Levels with fewer vertices than threshold are merged and solved sequentially.
+    for threshold, seed in [(0, 0), (0, 1), (3, 2), (6, 3)]:
+        monkeypatch.setattr(scc, "MIN_PARALLEL_VERTICES", threshold)
+        game = random_game(num_vertices=60, num_edges=90, seed=seed)
+        arena = Arena.from_graph(game.graph)
+        labels = scc.components(game.graph)
+
+        strategy = np.full(60, -1, dtype=np.int64)
+        win = scc.scc_attractor(arena, labels, workers=2, strategy=strategy)
+        assert np.array_equal(win, attractor(arena, arena.is_final, player=1))
+        assert np.array_equal(scc.scc_attractor(arena, workers=2), win)
+
+        # Every chosen successor is winning.
+        chosen = strategy >= 0
+        assert win[strategy[chosen]].all()
+        assert (~win | arena.is_final | (arena.turn != 1) | chosen).all()
+
+
+def test_scc_attractor_sequential():
+    # With a single worker, or a small arena, components are not needed.
+    game = random_game(num_vertices=60, num_edges=90, seed=0)
+    arena = Arena.from_graph(game.graph)
+    assert scc.num_workers(arena, workers=4) == 1
+    assert np.array_equal(scc.scc_attractor(arena, workers=4), attractor(arena, arena.is_final, player=1))
@@ -0,0 +1,88 @@
+import json
+import sys
+import pytest
+from iglsynth.game.game import *
+from iglsynth.solver.tests.test_zielonka import epfl_game, random_game
+from iglsynth.solver.zielonka import *
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+
+def test_stats_disabled():
+    solver = ZielonkaSolver(game=epfl_game())
+    solver.run()
+    assert solver.stats is None
+
+
+def test_stats_zielonka(tmp_path):
+    for method in ["worklist", "fixpoint", "array", "scc"]:
+        calls = []
+        solver = ZielonkaSolver(game=random_game(num_vertices=100, num_edges=300, seed=0))
+        solver.configure(method=method, strategy2=True)
+        solver.instrument(callback=lambda stats: calls.append(stats.num_iterations), interval=2)
+        solver.run()
+
+        stats = solver.stats
+        assert "attractor" in stats.phases and "materialization" in stats.phases
+        assert all(times["wall"] >= 0 and times["cpu"] >= 0 for times in stats.phases.values())
+        assert stats.num_iterations > 0
+        assert len(stats.edges) == stats.num_iterations
+        assert calls == list(range(2, stats.num_iterations + 1, 2))
+
+        # Statistics are reset on every run.
+        num_iterations, win1 = stats.num_iterations, solver.win1
+        solver.run()
+        assert solver.stats.num_iterations == num_iterations
+        assert solver.win1 == win1
+
+        data = json.loads(stats.to_json(filename=str(tmp_path / "stats.json")))
+        assert data == json.loads((tmp_path / "stats.json").read_text())
+        assert data["iterations"]["frontier"] == stats.frontier
+
+
+def test_stats_parallel_edges():
+    # Every parallel edge is scanned, and hence, counted. Parallel edges have distinct actions.
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool")], eprops=[("act", "int")])
+    graph.add_vertices(num=3)
+    graph.add_edge_array([(0, 0), (1, 0), (1, 0), (2, 0), (2, 0)], eprops={"act": [0, 0, 1, 0, 1]})
+    graph.set_vertex_property(name="is_final", vid=0, value=True)
+    for vid, turn in enumerate([1, 1, 2]):
+        graph.set_vertex_property(name="turn", vid=vid, value=turn)
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    solver = ZielonkaSolver(game=game)
+    solver.configure(method="fixpoint")
+    solver.instrument()
+    solver.run()
+
+    # Player 1 and player 2 scan 5 in-edges of vertex 0, and player 2 scans 2 out-edges of vertex 2.
+    assert solver.win1 == {0, 1, 2}
+    assert solver.stats.edges[0] == 12
+
+
+def test_stats_update_solve_many():
+    solver = ZielonkaSolver(game=random_game(num_vertices=100, num_edges=300, seed=0))
+    solver.instrument()
+    solver.run()
+    assert solver.stats.num_iterations > 0
+
+    # Every call resets the statistics of previous call.
+    solver.update(add_edges=[(0, 1)])
+    assert "update" in solver.stats.phases and "extraction" not in solver.stats.phases
+
+    solver.solve_many(targets=[{0}, {1, 2}])
+    stats = solver.stats
+    assert "update" not in stats.phases and "attractor" in stats.phases
+    assert stats.num_iterations == len(stats.edges) > 0
+
+
+def test_stats_peak_memory(monkeypatch):
+    resource = pytest.importorskip("resource")
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    for platform, scale in [("darwin", 1), ("linux", 1024)]:
+        monkeypatch.setattr(sys, "platform", platform)
+        stats = SolverStats()
+        with stats.phase("attractor"):
+            pass
+
+        assert maxrss * scale <= stats.peak_memory <= 2 * maxrss * scale
@@ -0,0 +1,213 @@
+import numpy as np
+import pytest
+import random
+from iglsynth.game.game import *
+from iglsynth.solver.zielonka import *
+from iglsynth.util.tests.test_graph import backend    # noqa: F401 (runs every test with every backend)
+
+
+def epfl_game():
+    graph = Graph(vprops=[("turn", "int")], eprops=[("act", "int")])
+    graph.add_vertex_property(name="is_final", of_type="bool", default=False)
+    graph.add_vertices(num=8)
+
+    edge_list = [(0, 1), (0, 3), (1, 0), (1, 2), (1, 4), (2, 4), (2, 2), (3, 0), (3, 4), (3, 5), (4, 3),
+                 (5, 3), (5, 6), (6, 6), (6, 7), (7, 0), (7, 3)]
+    graph.add_edges(edges=edge_list)
+
+    for vid in [3, 4]:
+        graph.set_vertex_property(name="is_final", vid=vid, value=True)
+
+    for vid in [0, 4, 6]:
+        graph.set_vertex_property(name="turn", vid=vid, value=1)
+
+    for vid in [1, 2, 3, 5, 7]:
+        graph.set_vertex_property(name="turn", vid=vid, value=2)
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    return game
+
+
+def is_reach_strategy(graph, win1, strategy1):
+    """ Checks that every play from win1 consistent with strategy1 reaches a final vertex. """
+    turn = graph.get_vertex_property(name="turn")
+    is_final = graph.get_vertex_property(name="is_final")
+    succ = dict()
+    for v in win1:
+        if not is_final[v]:
+            succ[v] = [strategy1[v]] if turn[v] == 1 else list(graph.out_neighbors(vid=v))
+
+    # Remove vertices, all of whose successors surely reach a final vertex, until nothing changes.
+    done = {v for v in win1 if is_final[v]}
+    while True:
+        new = {v for v in succ if v not in done and len(succ[v]) > 0 and all(u in done for u in succ[v])}
+        if not new:
+            break
+        done |= new
+
+    return done == win1
+
+
+def random_game(num_vertices, num_edges, seed):
+    rng = random.Random(seed)
+    graph = Graph(vprops=[("turn", "int")], eprops=[("act", "int")])
+    graph.add_vertex_property(name="is_final", of_type="bool", default=False)
+    graph.add_vertices(num=num_vertices)
+    graph.add_edges(edges=[(rng.randrange(num_vertices), rng.randrange(num_vertices)) for _ in range(num_edges)])
+
+    for vid in range(num_vertices):
+        graph.set_vertex_property(name="turn", vid=vid, value=rng.choice([1, 2]))
+        graph.set_vertex_property(name="is_final", vid=vid, value=rng.random() < 0.1)
+
+    game = Game(kind=TURN_BASED)
+    game.define(graph=graph)
+    return game
+
+
+def test_zielonka_epfl():
+    for method in ["worklist", "fixpoint", "array", "scc"]:
+        solver = ZielonkaSolver(game=epfl_game())
+        solver.configure(method=method)
+        solver.run()
+        assert solver.win1 == {0, 3, 4, 5, 6, 7}
+
+
+def test_zielonka_methods_vs_fixpoint():
+    for seed in range(5):
+        game = random_game(num_vertices=40, num_edges=80, seed=seed)
+
+        reference = ZielonkaSolver(game=game)
+        reference.configure(method="fixpoint")
+        reference.run()
+
+        for method in ["worklist", "array", "scc"]:
+            solver = ZielonkaSolver(game=game)
+            solver.configure(method=method)
+            solver.run()
+
+            assert solver.win1 == reference.win1
+
+
+def test_zielonka_strategy():
+    for seed in range(5):
+        for method in ["worklist", "fixpoint", "array", "scc"]:
+            game = random_game(num_vertices=40, num_edges=80, seed=seed)
+            graph = game.graph
+            solver = ZielonkaSolver(game=game)
+            solver.configure(method=method, strategy1=True, strategy2=True)
+            solver.run()
+
+            win1, win2 = solver.win1, solver.win2
+            assert win1 | win2 == set(graph.vertices)
+            assert is_reach_strategy(graph, win1, solver.strategy1)
+
+            # Player 2 must be able to stay outside win1 forever.
+            for v in win2:
+                if graph.get_vertex_property(name="turn", vid=v) == 2 and len(list(graph.out_neighbors(v))) > 0:
+                    assert solver.choice(v) in win2
+                    assert solver.strategy2[v] in win2
+
+    solver = ZielonkaSolver(game=epfl_game())
+    solver.run()
+    with pytest.raises(ValueError):
+        _ = solver.strategy1
+
+
+def test_zielonka_frozen():
+    for seed in range(3):
+        game = random_game(num_vertices=40, num_edges=80, seed=seed)
+        frozen = Game(kind=TURN_BASED)
+        frozen.define(graph=game.graph.freeze())
+
+        for method in ["worklist", "fixpoint", "array", "scc"]:
+            reference = ZielonkaSolver(game=game)
+            reference.configure(method=method)
+            reference.run()
+
+            solver = ZielonkaSolver(game=frozen)
+            solver.configure(method=method, strategy1=True)
+            solver.run()
+            assert solver.win1 == reference.win1
+            assert is_reach_strategy(frozen.graph, solver.win1, solver.strategy1)
+
+    with pytest.raises(TypeError):
+        solver.update(add_edges=[(0, 1)])
+
+
+def test_zielonka_subgraph():
+    for seed in range(3):
+        # Vertex 0 is filtered out of sub-graph.
+        game = random_game(num_vertices=40, num_edges=80, seed=seed)
+        vmask = np.ones(40, dtype=bool)
+        vmask[0] = False
+        sub = Game(kind=TURN_BASED)
+        sub.define(graph=SubGraph(graph=game.graph, vmask=vmask))
+
+        # Reference: Vertex 0 is isolated and not final.
+        graph = game.graph
+        for edge in [edge for edge in graph.edges if 0 in (edge.source, edge.target)]:
+            graph.remove_edge(edge)
+        graph.set_vertex_property(name="is_final", vid=0, value=False)
+        reference = ZielonkaSolver(game=game)
+        reference.run()
+
+        for method in ["worklist", "fixpoint", "array", "scc"]:
+            solver = ZielonkaSolver(game=sub)
+            solver.configure(method=method, strategy1=True, strategy2=True)
+            solver.run()
+            assert solver.win1 == reference.win1 - {0} and solver.win2 == reference.win2 - {0}
+
+            # Strategies are indexed by vertex id of graph.
+            assert len(solver.strategy1) == len(solver.strategy2) == 40
+            assert is_reach_strategy(sub.graph, solver.win1, solver.strategy1)
+            assert all(solver.strategy2[v] in solver.win2 for v in solver.win2 if solver.strategy2[v] >= 0)
+
+        solver = ZielonkaSolver(game=sub)
+        assert 0 not in solver.solve_many([{0, 1}])[0]
+
+
+def test_zielonka_invalid_method():
+    solver = ZielonkaSolver(game=epfl_game())
+    with pytest.raises(ValueError):
+        solver.configure(method="unknown")
+
+
+def test_zielonka_update():
+    for seed in range(10):
+        rng = random.Random(seed)
+        game = random_game(num_vertices=30, num_edges=60, seed=seed)
+        graph = game.graph
+
+        solver = ZielonkaSolver(game=game)
+        solver.configure(strategy1=True)
+        solver.run()
+
+        for _ in range(5):
+            edges = [(e.source, e.target) for e in graph.edges]
+            remove_edges = rng.sample(edges, 3)
+            add_edges = [(rng.randrange(30), rng.randrange(30)) for _ in range(3)]
+            is_final = {rng.randrange(30): rng.random() < 0.5 for _ in range(2)}
+            turn = {rng.randrange(30): rng.choice([1, 2]) for _ in range(2)}
+            solver.update(add_edges=add_edges, remove_edges=remove_edges, is_final=is_final, turn=turn)
+
+            reference = ZielonkaSolver(game=game)
+            reference.run()
+            assert solver.win1 == reference.win1
+            assert is_reach_strategy(graph, solver.win1, solver.strategy1)
+
+
+def test_zielonka_solve_many():
+    rng = random.Random(0)
+    game = random_game(num_vertices=50, num_edges=100, seed=0)
+    targets = [set(rng.sample(range(50), rng.randrange(1, 6))) for _ in range(70)] + [set()]
+
+    solver = ZielonkaSolver(game=game)
+    wins = solver.solve_many(targets=targets)
+    assert len(wins) == len(targets)
+
+    arena = Arena.from_graph(game.graph)
+    for target, win in zip(targets, wins):
+        mask = np.zeros(50, dtype=bool)
+        mask[list(target)] = True
+        assert win == set(np.flatnonzero(attractor(arena, mask, player=1)).tolist())
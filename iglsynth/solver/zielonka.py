@@ -4,6 +4,11 @@ iglsynth: zielonka.py
 License goes here...
 """
 
+import numpy as np
+from collections import deque
+from typing import Iterable, List, Set, Tuple
+from iglsynth.solver.attractor import Arena, attractor, attractor_many
+from iglsynth.solver.scc import components, num_workers, scc_attractor
 from iglsynth.solver.solver import *
 from iglsynth.util.graph import *
 from iglsynth.game import Game
@@ -20,23 +25,29 @@ class ZielonkaSolver(Solver):
 
         # Initialize internal variables
         self._attr = None
+        self._win1 = None
+        self._turn = None
+        self._is_final = None
+        self._count = None
         self._compute_win1 = True
         self._compute_win2 = True
+        self._method = "worklist"
+        self._compute_strategy_1 = False
+        self._compute_strategy_2 = False
+        self._workers = None
 
     @property
     def win1(self):
         """ Returns the winning region of player 1. """
-        win1 = set()
-        for v in self._attr.vertices:
-            if self._attr.get_vertex_property(name="win1", vid=v):
-                win1.add(v)
+        if isinstance(self._win1, np.ndarray):
+            return set(np.flatnonzero(self._win1).tolist())
 
-        return win1
+        return set(self._win1)
 
     @property
     def win2(self):
         """ Returns the winning region of player 2. """
-        raise NotImplementedError("Feature not implemented.")
+        return set(self.game.graph.vertices) - self.win1
 
     def _validate_game(self, game: IGame) -> bool:
         if game.graph.has_vertex_property(name="is_final") and game.graph.has_vertex_property(name="turn"):
@@ -44,85 +55,469 @@ class ZielonkaSolver(Solver):
 
         return False
 
-    def configure(self, win1=True, win2=True):
+    def configure(self, win1=True, win2=True, method="worklist", strategy1=False, strategy2=False, workers=None):
         """
         Set configuration parameters for solver.
 
         :param win1: Should winning region for player 1 be computed? Default: True.
         :param win2: Should winning region for player 1 be computed? Default: True.
+        :param method: Attractor computation method. One of
+
+            * ``"worklist"``: (Default) Counter-based worklist algorithm. Every edge is visited at most once,
+              i.e. the attractor is computed in :math:`O(|V| + |E|)` time.
+            * ``"array"``: Vectorized worklist algorithm. The game graph is extracted once into CSR/CSC arrays and
+              every round expands complete frontier using NumPy operations. Recommended for large graphs.
+            * ``"scc"``: Decomposes the graph into strongly connected components, and solves them in reverse
+              topological order. Independent components are solved in parallel by a pool of ``workers`` processes.
+              It pays off only with several workers on large games, whose DAG of components has levels of many
+              vertices. Otherwise, it falls back to ``"array"``. See
+              :func:`scc_attractor <iglsynth.solver.scc.scc_attractor>`.
+            * ``"fixpoint"``: Reference implementation, which recomputes the pre-image of complete winning region
+              in every round until a fixed-point is reached.
+
+        :param strategy1: Should winning strategy for player 1 be computed? Default: False.
+            The strategy is recorded by the attractor computation when a vertex is added to winning region.
+            Final vertices need no choice and are marked -1.
+        :param strategy2: Should winning strategy for player 2 be computed? Default: False.
+            For every vertex of player 2 outside the winning region of player 1, a successor outside that region is
+            chosen.
+        :param workers: Number of worker processes used by ``"scc"`` method. Default: Number of CPUs.
+
+        :raises ValueError: If the given method is not supported.
 
         .. todo:: The following params will be added later
 
-            * compute_strategy_1: bool,
-            * compute_strategy_2: bool,
             * loss_strategy_1: Distribution,
             * loss_strategy_2: Distribution,
             * type_strategy_1: Deterministic/Stochastic,
             * type_strategy_2: Deterministic/Stochastic
         """
+        if method not in ("worklist", "fixpoint", "array", "scc"):
+            raise ValueError(f"Given method: {method} is invalid. "
+                             f"Method must be in ('worklist', 'fixpoint', 'array', 'scc').")
+
         self._compute_win1 = win1
         self._compute_win2 = win2
+        self._method = method
+        self._compute_strategy_1 = strategy1
+        self._compute_strategy_2 = strategy2
+        self._workers = workers
 
     def _pre1(self, win):
+        """ Returns the player 1 vertices with a successor in ``win``, and the number of edges scanned. """
         pre1 = set()
+        scanned = 0
 
         for v in win:
-            in_neighbors = set(self.game.graph.in_neighbors(vid=v))
-            new_states = in_neighbors - win
+            in_neighbors = list(self.game.graph.in_neighbors(vid=v))
+            scanned += len(in_neighbors)
+            new_states = set(in_neighbors) - win
             for nv in new_states:
                 if self.game.graph.get_vertex_property(name="turn", vid=nv) == 1:
-                    self._attr.set_vertex_property(name="win1", vid=nv, value=True)
+                    self._attr[nv] = True
                     pre1.add(nv)
+                    if self._strategy1 is not None and self._strategy1[nv] < 0:
+                        self._strategy1[nv] = v
 
-        return pre1
+        return pre1, scanned
 
     def _pre2(self, win):
+        """ Returns the player 2 vertices with all successors in ``win``, and the number of edges scanned. """
         pre2 = set()
+        scanned = 0
 
         for v in win:
-            in_neighbors = set(self.game.graph.in_neighbors(vid=v))
-            new_states = in_neighbors - win
+            in_neighbors = list(self.game.graph.in_neighbors(vid=v))
+            scanned += len(in_neighbors)
+            new_states = set(in_neighbors) - win
             for nv in new_states:
                 if self.game.graph.get_vertex_property(name="turn", vid=nv) == 2:
-                    out_neighbors = set(self.game.graph.out_neighbors(vid=nv))
-                    if out_neighbors.issubset(win):
-                        self._attr.set_vertex_property(name="win1", vid=nv, value=True)
+                    out_neighbors = list(self.game.graph.out_neighbors(vid=nv))
+                    scanned += len(out_neighbors)
+                    if win.issuperset(out_neighbors):
+                        self._attr[nv] = True
                         pre2.add(nv)
 
-        return pre2
+        return pre2, scanned
 
     def _zielonka(self):
         # Extract final states
         final = set()
         for v in self.game.graph.vertices:
             if self.game.graph.get_vertex_property(name="is_final", vid=v):
-                self._attr.set_vertex_property(name="win1", vid=v, value=True)
+                self._attr[v] = True
                 final.add(v)
 
         # Iteratively mark the vertices winning or losing.
         win = final.copy()
         while True:
-            pre1 = self._pre1(win)
-            pre2 = self._pre2(win)
+            pre1, scanned1 = self._pre1(win)
+            pre2, scanned2 = self._pre2(win)
             new_win = set.union(win, pre1, pre2)
 
+            # Every round computes the pre-image of complete winning region.
+            if self._stats is not None:
+                self._stats.iteration(frontier=len(win), edges=scanned1 + scanned2)
+
             if new_win == win:
                 break
 
             win = new_win
 
+        return win
+
+    def _worklist(self):
+        """
+        Computes the attractor of final states for player 1 using a worklist of newly won vertices.
+
+        Every player 2 vertex maintains a counter of its successors that are not yet known to be winning. A player 1
+        vertex is winning as soon as one of its successors is winning, whereas a player 2 vertex is winning when its
+        counter drops to zero. As every vertex enters the worklist at most once, every edge is visited at most once.
+
+        The counters are retained after the computation, so that :meth:`update` can reuse them.
+        """
+        graph = self.game.graph
+        with self._phase("extraction"):
+            self._turn = graph.get_vertex_property(name="turn")
+            self._is_final = graph.get_vertex_property(name="is_final")
+
+        # Counters are initialized lazily, only for player 2 vertices that are reached during the computation.
+        #   An uninitialized counter means that no successor of the vertex is winning.
+        self._count = dict()
+
+        # Extract final states and compute their attractor.
+        with self._phase("final_states"):
+            win = {v for v, final in self._is_final.items() if final}
+
+        with self._phase("attractor"):
+            self._propagate(win, deque(win))
+
+        return win
+
+    def _propagate(self, win, queue):
+        """ Processes newly won vertices in ``queue`` until no new vertex is added to ``win``. """
+        graph = self.game.graph
+        frozen = isinstance(graph, FrozenGraph)
+        turn = self._turn
+        count = self._count
+        stats = self._stats
+        layer = remaining = len(queue)
+        scanned = 0
+
+        while queue:
+            v = queue.popleft()
+            # Predecessors in a frozen graph are a slice of its reverse adjacency.
+            pre = graph.in_neighbors(vid=v).tolist() if frozen else list(graph.in_neighbors(vid=v))
+            for u in pre:
+                if u in win:
+                    continue
+
+                if turn[u] == 1:
+                    win.add(u)
+                    queue.append(u)
+                    if self._strategy1 is not None:
+                        self._strategy1[u] = v
+
+                elif turn[u] == 2:
+                    if u not in count:
+                        count[u] = self._out_degree(u)
+
+                    count[u] -= 1
+                    if count[u] == 0:
+                        win.add(u)
+                        queue.append(u)
+
+            # An iteration ends when all vertices queued in previous iteration are processed.
+            if stats is not None:
+                scanned += len(pre)
+                remaining -= 1
+                if remaining == 0:
+                    stats.iteration(frontier=layer, edges=scanned)
+                    layer = remaining = len(queue)
+                    scanned = 0
+
+    def _out_degree(self, vid, exclude=None):
+        """ Returns the number of successors of vertex that are not in ``exclude``, counting parallel edges. """
+        if exclude is None:
+            if isinstance(self.game.graph, FrozenGraph):
+                return int(self.game.graph.out_degree[vid])
+
+            return sum(1 for _ in self.game.graph.out_neighbors(vid=vid))
+
+        return sum(1 for u in self.game.graph.out_neighbors(vid=vid) if u not in exclude)
+
+    def _trap_strategy(self, win1):
+        """
+        Chooses, for every vertex of player 2 outside the winning region of player 1, a successor outside that region.
+        """
+        graph = self.game.graph
+        turn = graph.get_vertex_property(name="turn")
+        for v in graph.vertices:
+            if turn[v] == 2 and v not in win1:
+                for u in graph.out_neighbors(vid=v):
+                    if u not in win1:
+                        self._strategy2[v] = u
+                        break
+
     def run(self):
         """
         Runs the solver.
-
-        .. note:: We are not implementing strategy computation, which requires edge filters and
-            attractor graph computation.
         """
         # Check if game graph is available.
         if self.game.graph is not None:
-            self._attr = SubGraph(graph=self.game.graph, vfilt_name="win1")
-            self._zielonka()
+            if self._stats is not None:
+                self._stats.reset()
+
+            n = self.game.graph.vertex_index_range
+            self._strategy1 = np.full(n, -1, dtype=np.int64) if self._compute_strategy_1 else None
+            self._strategy2 = np.full(n, -1, dtype=np.int64) if self._compute_strategy_2 else None
+
+            if self._method in ("array", "scc"):
+                with self._phase("extraction"):
+                    arena = Arena.from_graph(self.game.graph)
+                    # Components are only needed to solve their levels in parallel.
+                    parallel = self._method == "scc" and num_workers(arena, self._workers) > 1
+                    labels = components(self.game.graph) if parallel else None
+
+                with self._phase("final_states"):
+                    target = arena.is_final
+
+                with self._phase("attractor"):
+                    if self._method == "array":
+                        self._win1 = attractor(arena=arena, target=target, player=1, mask=arena.mask,
+                                               strategy=self._strategy1, stats=self._stats)
+                    else:
+                        self._win1 = scc_attractor(arena=arena, labels=labels, workers=self._workers,
+                                                   strategy=self._strategy1, mask=arena.mask, stats=self._stats)
+
+                with self._phase("materialization"):
+                    if self._strategy2 is not None:
+                        lose = np.flatnonzero(~self._win1 & (arena.turn == 2) & arena.region())
+                        self._strategy2[lose] = arena.successor_in(lose, ~self._win1)
+
+            elif self._method == "fixpoint":
+                with self._phase("extraction"):
+                    self._attr = np.zeros(self.game.graph.vertex_index_range, dtype=bool)
+
+                with self._phase("attractor"):
+                    self._win1 = self._zielonka()
+
+            else:
+                self._win1 = self._worklist()
+
+            if self._strategy2 is not None and self._method in ("worklist", "fixpoint"):
+                with self._phase("materialization"):
+                    self._trap_strategy(self._win1)
 
         # If not, then we will need to construct based on configuration of game.
         else:
             raise NotImplementedError("Presently only solver for a game defined by graph is implemented.")
+
+    def update(self, add_edges: Iterable[Tuple[int, int]] = tuple(), remove_edges: Iterable[Tuple[int, int]] = tuple(),
+               is_final: dict = None, turn: dict = None):
+        """
+        Applies a changeset to the game graph and updates the winning region of player 1 incrementally.
+
+        When the solver was run with ``method="worklist"``, the attractor and its counters are reused. Vertices that
+        may become winning are propagated forward from the changed vertices. Vertices that may lose, e.g. because of
+        a removed edge of player 1, an added edge of player 2 or a vertex that is no longer final, are handled by
+        recomputing only the winning vertices that can reach them within the winning region. For all other methods,
+        the changeset is applied and the solver is run again.
+
+        :param add_edges: An iterable of 2-tuple of (uid, vid) of edges to be added.
+        :type add_edges: Iterable[Tuple[int, int]]
+
+        :param remove_edges: An iterable of 2-tuple of (uid, vid). For every pair, one edge from uid to vid is removed.
+        :type remove_edges: Iterable[Tuple[int, int]]
+
+        :param is_final: A dictionary {vid: value} of new ``is_final`` values.
+        :type is_final: dict
+
+        :param turn: A dictionary {vid: value} of new ``turn`` values.
+        :type turn: dict
+
+        :raises ValueError: When an edge to be removed is not in the graph.
+        :raises TypeError: When the game is defined by a :class:`FrozenGraph <iglsynth.util.frozen.FrozenGraph>`.
+
+        .. note:: The strategy of player 1, if configured, is updated incrementally. The strategy of player 2, if
+            configured, is recomputed over the complete graph.
+        """
+        graph = self.game.graph
+        if isinstance(graph, FrozenGraph):
+            raise TypeError("A game defined by a frozen graph cannot be updated.")
+
+        if self._stats is not None:
+            self._stats.reset()
+
+        is_final = dict() if is_final is None else is_final
+        turn = dict() if turn is None else turn
+
+        # If the counters of a previous worklist run are not available, apply changes and solve from scratch.
+        if self._method != "worklist" or self._count is None:
+            for vid, value in turn.items():
+                graph.set_vertex_property(name="turn", vid=vid, value=value)
+            for vid, value in is_final.items():
+                graph.set_vertex_property(name="is_final", vid=vid, value=value)
+            graph.add_edges(edges=add_edges)
+            for uid, vid in remove_edges:
+                graph.remove_edge(self._find_edge(uid, vid))
+
+            self.run()
+            return
+
+        with self._phase("update"):
+            win = self._win1
+            count = self._count
+
+            # Winning vertices that may lose, and losing vertices that may win because of the changeset.
+            suspects = set()
+            candidates = set()
+
+            for vid, value in turn.items():
+                graph.set_vertex_property(name="turn", vid=vid, value=value)
+                self._turn[vid] = value
+                if value == 2:
+                    count[vid] = self._out_degree(vid, exclude=win)
+                else:
+                    count.pop(vid, None)
+
+                (suspects if vid in win else candidates).add(vid)
+
+            for uid, vid in add_edges:
+                if self._turn[uid] == 2 and uid not in count:
+                    count[uid] = self._out_degree(uid)
+
+                graph.add_edge(uid, vid)
+
+                if self._turn[uid] == 2:
+                    if vid not in win:
+                        count[uid] += 1
+
+                    # Even a winning target may depend on the source, e.g. a self-loop, hence a winning source may lose.
+                    #   A losing source without successors may be won by its first (winning) successor.
+                    if uid in win:
+                        suspects.add(uid)
+                    else:
+                        candidates.add(uid)
+
+                elif self._turn[uid] == 1 and vid in win and uid not in win:
+                    candidates.add(uid)
+
+            for uid, vid in remove_edges:
+                if self._turn[uid] == 2 and uid not in count:
+                    count[uid] = self._out_degree(uid)
+
+                graph.remove_edge(self._find_edge(uid, vid))
+
+                if self._turn[uid] == 2:
+                    if vid not in win:
+                        count[uid] -= 1
+
+                    # A player 2 vertex without successors is not winning.
+                    if uid not in win:
+                        candidates.add(uid)
+                    elif self._out_degree(uid) == 0:
+                        suspects.add(uid)
+
+                elif self._turn[uid] == 1 and uid in win and vid in win:
+                    suspects.add(uid)
+
+            for vid, value in is_final.items():
+                graph.set_vertex_property(name="is_final", vid=vid, value=value)
+                self._is_final[vid] = value
+                (candidates if value else suspects).add(vid)
+
+            # Bounded recompute: Remove all winning vertices that can reach a suspect within the winning region.
+            removed = set()
+            stack = [v for v in suspects if v in win]
+            while stack:
+                v = stack.pop()
+                if v in removed:
+                    continue
+
+                removed.add(v)
+                stack.extend(u for u in graph.in_neighbors(vid=v) if u in win and u not in removed)
+
+            win -= removed
+            if self._strategy1 is not None:
+                self._strategy1[list(removed)] = -1
+
+            # Recount successors of player 2 vertices, which had a removed vertex as successor or were removed.
+            recount = {v for v in removed if self._turn[v] == 2}
+            recount.update(u for v in removed for u in graph.in_neighbors(vid=v) if u not in win and self._turn[u] == 2)
+            for v in recount:
+                count[v] = self._out_degree(v, exclude=win)
+
+            # Seed the worklist with candidates that are winning with respect to current winning region.
+            queue = deque()
+            for v in candidates | removed:
+                if v in win:
+                    continue
+
+                if self._is_final[v]:
+                    win.add(v)
+                    queue.append(v)
+
+                elif self._turn[v] == 1:
+                    succ = next((u for u in graph.out_neighbors(vid=v) if u in win), None)
+                    if succ is not None:
+                        win.add(v)
+                        queue.append(v)
+                        if self._strategy1 is not None:
+                            self._strategy1[v] = succ
+
+                elif self._turn[v] == 2 and count.get(v) == 0 and self._out_degree(v) > 0:
+                    win.add(v)
+                    queue.append(v)
+
+        with self._phase("attractor"):
+            self._propagate(win, queue)
+
+        if self._strategy2 is not None:
+            with self._phase("materialization"):
+                self._strategy2[:] = -1
+                self._trap_strategy(win)
+
+    def solve_many(self, targets: List[Set[int]]) -> List[Set[int]]:
+        """
+        Computes the winning regions of player 1 for many reachability objectives on the game graph at once. The
+        ``is_final`` property of game graph is ignored.
+
+        The targets are packed 64 per ``uint64`` word and all attractors are computed in a single bit-parallel
+        fixed-point computation over the arena.
+
+        :param targets: A list of sets of vertex ids. Every set is a target for player 1.
+        :type targets: List[Set[int]]
+
+        :return: A list of winning regions of player 1, one for every target.
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+        with self._phase("extraction"):
+            arena = Arena.from_graph(self.game.graph)
+
+        with self._phase("final_states"):
+            # Pack targets as bits: target j is bit (j % 64) of word (j // 64).
+            bits = np.zeros((arena.num_vertices, (len(targets) + 63) // 64), dtype=np.uint64)
+            for j, target in enumerate(targets):
+                bits[list(target), j // 64] |= np.uint64(1) << np.uint64(j % 64)
+
+            # Vertices filtered out of a sub-graph are not won.
+            if arena.mask is not None:
+                bits[~arena.mask] = 0
+
+        with self._phase("attractor"):
+            bits = attractor_many(arena=arena, targets=bits, player=1, stats=self._stats)
+
+        with self._phase("materialization"):
+            # Unpack winning regions
+            return [set(np.flatnonzero((bits[:, j // 64] >> np.uint64(j % 64)) & np.uint64(1)).tolist())
+                    for j in range(len(targets))]
+
+    def _find_edge(self, uid, vid):
+        edge = self.game.graph.find_edge(uid, vid)
+        if edge is None:
+            raise ValueError(f"Edge ({uid}, {vid}) is not in graph.")
+
+        return edge
@@ -0,0 +1,743 @@
+"""
+iglsynth: csr.py
+
+License goes here...
+
+Pure NumPy graph backend. It implements the subset of graph_tool API used by :class:`Graph <iglsynth.util.Graph>`,
+so that a graph can be used without installing graph_tool.
+
+Edges are stored in growable arrays of sources and targets, indexed by edge index. Removed edges are only marked
+dead. The forward (CSR) and reverse (CSC) adjacency are compacted from the edge arrays on demand, and are patched
+when edges are added or removed: new edges are kept in per-vertex overflow lists and dead edges are skipped, until
+the changes exceed a fraction of the adjacency and it is compacted again. Hence, editing an edge takes amortized
+constant time. Vertex and edge properties are typed NumPy arrays.
+"""
+
+import numpy as np
+
+# {type: (dtype of storage, python type, default value)}. Similar to graph_tool, boolean values are stored as uint8,
+#   and values of types "string" and "object" are not exposed as arrays.
+_TYPES = {"bool": (np.uint8, bool, 0), "int": (np.int64, int, 0), "float": (np.float64, float, 0.0),
+          "string": (object, str, ""), "object": (object, object, None)}
+
+
+def _grow(array: np.ndarray, size: int, fill) -> np.ndarray:
+    """ Returns array with capacity at least ``size``. The capacity is doubled to amortize the cost of growing. """
+    if len(array) >= size:
+        return array
+
+    grown = np.empty(max(size, 2 * len(array)), dtype=array.dtype)
+    grown[:len(array)] = array
+    grown[len(array):] = fill
+    return grown
+
+
+class Mask(np.ndarray):
+    """
+    A boolean array used as a filter of :class:`GraphView`. Every change to its items, by assignment, in-place ufunc
+    (e.g. ``mask &= other``) or through a slice of mask, increments :attr:`version`, so that views can cache the
+    vertices, which are not filtered out. A mask and the masks viewing it share the version.
+
+    .. note:: Changes made through arrays sharing the memory of mask, which are not :class:`Mask` arrays (e.g. the
+        array from which mask was created), are not tracked.
+    """
+
+    # Functions, which modify their first argument in-place.
+    _INPLACE = (np.copyto, np.put, np.putmask, np.place)
+
+    def __array_finalize__(self, obj):
+        # Views and copies of a mask share its version counter.
+        self._version = obj._version if isinstance(obj, Mask) else [0]
+
+    def __array_ufunc__(self, ufunc, method, *inputs, out=None, **kwargs):
+        inputs = tuple(x.view(np.ndarray) if isinstance(x, Mask) else x for x in inputs)
+        if out is None:
+            return getattr(ufunc, method)(*inputs, **kwargs)
+
+        getattr(ufunc, method)(*inputs, out=tuple(x.view(np.ndarray) if isinstance(x, Mask) else x for x in out),
+                               **kwargs)
+        for x in out:
+            if isinstance(x, Mask):
+                x._version[0] += 1
+
+        return out[0] if len(out) == 1 else out
+
+    def __array_function__(self, func, types, args, kwargs):
+        result = super(Mask, self).__array_function__(func, types, args, kwargs)
+        if func in self._INPLACE and isinstance(args[0], Mask):
+            args[0]._version[0] += 1
+
+        return result
+
+    @property
+    def version(self) -> int:
+        """ Returns the number of changes made to mask. """
+        return self._version[0]
+
+    def __setitem__(self, key, value):
+        super(Mask, self).__setitem__(key, value)
+        self._version[0] += 1
+
+    def fill(self, value):
+        super(Mask, self).fill(value)
+        self._version[0] += 1
+
+    def put(self, *args, **kwargs):
+        super(Mask, self).put(*args, **kwargs)
+        self._version[0] += 1
+
+
+class _Adjacency(object):
+    """
+    Adjacency of one direction: the edge indices grouped by source (CSR) or target (CSC) vertex. Edges added after
+    compaction are appended to per-vertex overflow lists, and dead edges are filtered out on access. ``pending``
+    counts both, and the adjacency is compacted again when it becomes too stale.
+    """
+    __slots__ = ("indptr", "eids", "overflow", "pending")
+
+    def __init__(self, keys: np.ndarray, eids: np.ndarray, num_vertices: int):
+        self.indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=num_vertices), out=self.indptr[1:])
+        self.eids = eids[np.argsort(keys, kind="stable")]
+        self.overflow = dict()
+        self.pending = 0
+
+    @classmethod
+    def sorted(cls, indptr: np.ndarray) -> '_Adjacency':
+        """ Returns the adjacency of edges, whose indices are already grouped by ``indptr``. """
+        adj = cls.__new__(cls)
+        adj.indptr = indptr
+        adj.eids = None
+        adj.overflow = dict()
+        adj.pending = 0
+        return adj
+
+    def is_stale(self, changes: int = 0) -> bool:
+        """ Returns True if the changes since compaction, and given changes, exceed a quarter of the adjacency. """
+        return self.pending + changes > 1024 + int(self.indptr[-1]) // 4
+
+    def add(self, keys: np.ndarray, start: int):
+        """ Adds the edges with indices ``start, start + 1, ...``, whose sources (or targets) are ``keys``. """
+        self.pending += len(keys)
+        for eid, key in enumerate(keys.tolist(), start):
+            self.overflow.setdefault(key, []).append(eid)
+
+    def get(self, v: int, alive: np.ndarray) -> np.ndarray:
+        """ Returns the live edges of vertex ``v``, sorted by edge index. """
+        start, stop = (int(self.indptr[v]), int(self.indptr[v + 1])) if v < len(self.indptr) - 1 else (0, 0)
+        eids = np.arange(start, stop) if self.eids is None else self.eids[start:stop]
+        if v in self.overflow:
+            eids = np.concatenate((eids, self.overflow[v]))
+
+        return eids[alive[eids]] if self.pending > 0 else eids
+
+
+class PropertyMap(object):
+    """
+    Represents a vertex, edge or graph property.
+
+    :param graph: The :class:`Graph` object, which owns the property.
+    :param key_type: One of "v" (vertex), "e" (edge) or "g" (graph).
+    :param value_type: One of the keys of ``_TYPES``.
+    :param val: (Optional) Default value of property.
+    :param array: (Optional) Storage of values, e.g. a memory-mapped array, which is used without copying. Its dtype
+        must be the dtype of storage of ``value_type``, and its length the capacity of graph.
+    """
+
+    def __init__(self, graph: 'Graph', key_type: str, value_type: str, val=None, array: np.ndarray = None):
+        if value_type not in _TYPES:
+            raise TypeError(f"Property type: {value_type} is invalid. Types must be in {list(_TYPES.keys())}.")
+
+        self._graph = graph
+        self._key_type = key_type
+        self._value_type = value_type
+        dtype, self._python_type, default = _TYPES[value_type]
+        self._default = default if val is None else val
+
+        if key_type == "g":
+            self._value = self._default
+        elif array is not None:
+            self._array = array
+        else:
+            self._array = np.full(self._capacity(), self._default, dtype=dtype)
+
+    def _capacity(self):
+        """ Returns the capacity of graph for vertices or edges. """
+        return len(self._graph._src) if self._key_type == "e" else self._graph._vcap
+
+    def _size(self):
+        return self._graph._erange if self._key_type == "e" else self._graph._nv
+
+    def _reserve(self):
+        self._array = _grow(self._array, self._capacity(), self._default)
+
+    def key_type(self):
+        return self._key_type
+
+    def value_type(self):
+        return self._value_type
+
+    def python_value_type(self):
+        return self._python_type
+
+    def get_array(self):
+        """ Returns a view of values, or None for properties of types "string" and "object". """
+        if self._array.dtype == object:
+            return None
+
+        self._reserve()
+        return self._array[:self._size()]
+
+    @property
+    def a(self):
+        return self.get_array()
+
+    @a.setter
+    def a(self, values):
+        self.get_array()[:] = values
+
+    def __getitem__(self, key):
+        self._reserve()
+        value = self._array[_index(key)]
+        return value if self._array.dtype == object else self._python_type(value)
+
+    def __setitem__(self, key, value):
+        self._reserve()
+        self._array[_index(key)] = value
+
+
+def _index(key) -> int:
+    """ Returns the index of a vertex or edge descriptor, or of an integer. """
+    return key._index if isinstance(key, (Vertex, Edge)) else int(key)
+
+
+class Vertex(object):
+    """ Represents a vertex descriptor. """
+    __slots__ = ("_graph", "_index")
+
+    def __init__(self, graph: 'Graph', index: int):
+        self._graph = graph
+        self._index = index
+
+    def __int__(self):
+        return self._index
+
+    def __index__(self):
+        return self._index
+
+    def __eq__(self, other):
+        return int(self) == int(other)
+
+    def __hash__(self):
+        return self._index
+
+    def __repr__(self):
+        return str(self._index)
+
+    def out_edges(self):
+        return [Edge(self._graph, eid) for eid in self._graph._out_eids(self._index).tolist()]
+
+    def in_edges(self):
+        return [Edge(self._graph, eid) for eid in self._graph._in_eids(self._index).tolist()]
+
+    def out_degree(self):
+        return len(self._graph._out_eids(self._index))
+
+    def in_degree(self):
+        return len(self._graph._in_eids(self._index))
+
+
+class Edge(object):
+    """ Represents an edge descriptor. """
+    __slots__ = ("_graph", "_index")
+
+    def __init__(self, graph: 'Graph', index: int):
+        self._graph = graph
+        self._index = index
+
+    def __eq__(self, other):
+        return isinstance(other, Edge) and self._index == other._index and self._graph._b is other._graph._b
+
+    def __hash__(self):
+        return self._index
+
+    def __repr__(self):
+        return f"<Edge ({int(self.source())}, {int(self.target())})>"
+
+    def source(self):
+        return Vertex(self._graph, int(self._graph._b._src[self._index]))
+
+    def target(self):
+        return Vertex(self._graph, int(self._graph._b._tgt[self._index]))
+
+
+class _EdgeIndex(object):
+    """ Maps an edge descriptor to its edge index. Similar to ``graph_tool.Graph.edge_index``. """
+
+    def __getitem__(self, edge: Edge):
+        return edge._index
+
+
+class _PropertyDict(object):
+    """ Dictionary of properties of one key type, e.g. ``graph.vertex_properties``. """
+
+    def __init__(self, graph: 'Graph', key_type: str):
+        self._graph = graph
+        self._key_type = key_type
+
+    def __contains__(self, name):
+        return (self._key_type, name) in self._graph._props
+
+    def __getitem__(self, name):
+        prop = self._graph._props[(self._key_type, name)]
+        return prop._value if self._key_type == "g" else prop
+
+    def __setitem__(self, name, value):
+        if isinstance(value, PropertyMap):
+            self._graph._props[(self._key_type, name)] = value
+        elif self._key_type == "g":
+            self._graph._props[(self._key_type, name)]._value = value
+        else:
+            raise TypeError(f"Property {name} must be a PropertyMap.")
+
+    def __delitem__(self, name):
+        del self._graph._props[(self._key_type, name)]
+
+    def keys(self):
+        return [name for key_type, name in self._graph._props if key_type == self._key_type]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+
+class Graph(object):
+    """
+    A directed multi-graph with vertex, edge and graph properties, stored as NumPy arrays.
+    """
+
+    def __init__(self):
+        self._b = self
+        self._nv = 0
+        self._vcap = 0
+
+        self._src = np.empty(0, dtype=np.int64)
+        self._tgt = np.empty(0, dtype=np.int64)
+        self._alive = np.empty(0, dtype=bool)
+        self._erange = 0
+        self._ne = 0
+
+        # Cached adjacency: [forward (CSR), reverse (CSC)] :class:`_Adjacency` objects, or None if not built.
+        self._adj = [None, None]
+
+        # Incremented when vertices are added or removed.
+        self._version = 0
+
+        self._props = dict()
+        self.vertex_properties = self.vp = _PropertyDict(self, "v")
+        self.edge_properties = self.ep = _PropertyDict(self, "e")
+        self.graph_properties = self.gp = _PropertyDict(self, "g")
+        self.edge_index = _EdgeIndex()
+
+    def __repr__(self):
+        return f"<csr.Graph |V|={self.num_vertices()}, |E|={self.num_edges()}>"
+
+    @classmethod
+    def from_csr(cls, num_vertices: int, indptr: np.ndarray, indices: np.ndarray, sources: np.ndarray = None):
+        """
+        Returns a graph, whose edges are given by forward (CSR) adjacency. The edge index of every edge is its position
+        in ``indices``. The arrays, e.g. memory-mapped arrays, are used without copying.
+
+        :param num_vertices: Number of vertices.
+        :param indptr: Forward adjacency (CSR) index pointer.
+        :param indices: Forward adjacency (CSR) indices, i.e. the targets of edges.
+        :param sources: (Optional) Sources of edges. Default: Computed from ``indptr``.
+        """
+        g = cls()
+        g._nv = g._vcap = num_vertices
+        g._src = np.repeat(np.arange(num_vertices, dtype=np.int64), np.diff(indptr)) if sources is None else sources
+        g._tgt = indices
+        g._alive = np.ones(len(indices), dtype=bool)
+        g._erange = g._ne = len(indices)
+        g._adj[0] = _Adjacency.sorted(indptr)
+        return g
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # STORAGE
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def properties(self):
+        return self._b._props
+
+    @property
+    def edge_index_range(self):
+        return self._b._erange
+
+    def _modified(self):
+        """ Drops the cached adjacency, e.g. when vertices are renumbered. """
+        self._b._adj = [None, None]
+        self._b._version += 1
+
+    def _cached(self, reverse: bool = False) -> _Adjacency:
+        """ Returns the forward (CSR) or reverse (CSC) adjacency, which is built on first use. """
+        b = self._b
+        adj = b._adj[reverse]
+        if adj is None:
+            eids = np.flatnonzero(b._alive[:b._erange])
+            adj = b._adj[reverse] = _Adjacency((b._tgt if reverse else b._src)[eids], eids, b._nv)
+
+        return adj
+
+    def _adjacency(self, reverse: bool = False):
+        """ Returns (indptr, eids) of forward (CSR) or reverse (CSC) adjacency of all live edges. """
+        adj = self._cached(reverse)
+        if adj.pending > 0:
+            self._b._adj[reverse] = None
+            adj = self._cached(reverse)
+
+        if adj.eids is None:
+            adj.eids = np.arange(int(adj.indptr[-1]), dtype=np.int64)
+
+        return adj.indptr, adj.eids
+
+    def _filter(self, eids: np.ndarray) -> np.ndarray:
+        """ Returns the given (live) edges, which are not filtered out. Overridden by :class:`GraphView`. """
+        return eids
+
+    def _out_eids(self, v: int) -> np.ndarray:
+        return self._filter(self._cached().get(v, self._b._alive))
+
+    def _in_eids(self, v: int) -> np.ndarray:
+        return self._filter(self._cached(reverse=True).get(v, self._b._alive))
+
+    def _all_eids(self) -> np.ndarray:
+        return self._filter(self._adjacency()[1])
+
+    def _vertex_ids(self) -> np.ndarray:
+        return np.arange(self._b._nv)
+
+    def _key(self):
+        """ Returns a key, which changes whenever the vertices of graph may change. See :meth:`GraphView._key`. """
+        return self._b._version,
+
+    def _columns(self, eids: np.ndarray, eprops) -> np.ndarray:
+        """ Returns an array with rows (source, target, eprops...) of given edges. """
+        b = self._b
+        columns = [b._src[eids], b._tgt[eids]]
+        for prop in eprops:
+            columns.append(eids if isinstance(prop, _EdgeIndex) else prop.get_array()[eids])
+
+        return np.column_stack(columns) if len(eids) > 0 else np.empty((0, 2 + len(eprops)), dtype=np.int64)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # GRAPH_TOOL API
+    # ------------------------------------------------------------------------------------------------------------------
+    def num_vertices(self, ignore_filter=False):
+        return self._b._nv
+
+    def num_edges(self, ignore_filter=False):
+        return self._b._ne
+
+    def vertex(self, i):
+        if not 0 <= int(i) < self._b._nv:
+            raise ValueError(f"Invalid vertex index: {int(i)}")
+
+        return Vertex(self, int(i))
+
+    def vertices(self):
+        return (Vertex(self, v) for v in self._vertex_ids().tolist())
+
+    def edges(self):
+        return (Edge(self, eid) for eid in self._all_eids().tolist())
+
+    def edge(self, s, t, all_edges=False):
+        eids = self._out_eids(int(s))
+        edges = [Edge(self, eid) for eid in eids[self._b._tgt[eids] == int(t)].tolist()]
+        if all_edges:
+            return edges
+
+        return edges[0] if edges else None
+
+    def get_vertices(self):
+        return self._vertex_ids()
+
+    def get_edges(self, eprops=()):
+        return self._columns(self._all_eids(), eprops)
+
+    def get_out_edges(self, v, eprops=()):
+        return self._columns(self._out_eids(int(v)), eprops)
+
+    def get_in_edges(self, v, eprops=()):
+        return self._columns(self._in_eids(int(v)), eprops)
+
+    def get_out_neighbors(self, v):
+        return self._b._tgt[self._out_eids(int(v))]
+
+    def get_in_neighbors(self, v):
+        return self._b._src[self._in_eids(int(v))]
+
+    def add_vertex(self, n=1):
+        b = self._b
+        start = b._nv
+        b._nv += n
+        b._vcap = b._nv if b._vcap >= b._nv else max(b._nv, 2 * b._vcap)
+        b._version += 1
+        if n == 1:
+            return Vertex(self, start)
+
+        return (Vertex(self, v) for v in range(start, b._nv))
+
+    def add_edge(self, source, target, add_missing=True):
+        self.add_edge_list(np.array([[int(source), int(target)]]))
+        return Edge(self, self._b._erange - 1)
+
+    def add_edge_list(self, edge_list, hashed=False, eprops=None):
+        b = self._b
+        edges = np.asarray(edge_list, dtype=np.int64).reshape(-1, 2)
+        if len(edges) > 0 and (edges.min() < 0 or edges.max() >= b._nv):
+            raise ValueError("Invalid vertex index in edge list.")
+
+        start, b._erange = b._erange, b._erange + len(edges)
+        b._src = _grow(b._src, b._erange, -1)
+        b._tgt = _grow(b._tgt, b._erange, -1)
+        b._alive = _grow(b._alive, b._erange, False)
+        b._src[start:b._erange] = edges[:, 0]
+        b._tgt[start:b._erange] = edges[:, 1]
+        b._alive[start:b._erange] = True
+        b._ne += len(edges)
+
+        # Patch the cached adjacency, unless it becomes too stale.
+        for reverse, keys in ((False, edges[:, 0]), (True, edges[:, 1])):
+            adj = b._adj[reverse]
+            if adj is not None and adj.is_stale(changes=len(keys)):
+                b._adj[reverse] = None
+            elif adj is not None:
+                adj.add(keys, start)
+
+    def remove_edge(self, edge):
+        b = self._b
+        if not b._alive[edge._index]:
+            raise ValueError(f"Invalid edge: {edge}")
+
+        b._alive[edge._index] = False
+        b._ne -= 1
+
+        # Dead edges are skipped by the cached adjacency, until it becomes too stale.
+        for reverse, adj in enumerate(b._adj):
+            if adj is not None and adj.is_stale(changes=1):
+                b._adj[reverse] = None
+            elif adj is not None:
+                adj.pending += 1
+
+    def remove_vertex(self, vertex, fast=False):
+        b = self._b
+        n = b._nv
+        removed = np.unique(np.asarray([int(vertex)] if np.isscalar(vertex) or isinstance(vertex, Vertex)
+                                       else [int(v) for v in vertex], dtype=np.int64))
+        if len(removed) > 0 and (removed[0] < 0 or removed[-1] >= n):
+            raise ValueError("Invalid vertex index.")
+
+        # order[new id] = old id
+        if fast:
+            order = np.arange(n)
+            last = n
+            for v in removed[::-1].tolist():
+                last -= 1
+                order[v] = order[last]
+            order = order[:last]
+        else:
+            keep = np.ones(n, dtype=bool)
+            keep[removed] = False
+            order = np.flatnonzero(keep)
+
+        mapping = np.full(n, -1, dtype=np.int64)
+        mapping[order] = np.arange(len(order))
+
+        # Remove incident edges and renumber endpoints of remaining edges.
+        live = b._alive[:b._erange]
+        dead = live & ((mapping[b._src[:b._erange]] < 0) | (mapping[b._tgt[:b._erange]] < 0))
+        live &= ~dead
+        b._ne -= int(dead.sum())
+        b._src[:b._erange] = np.where(live, mapping[b._src[:b._erange]], -1)
+        b._tgt[:b._erange] = np.where(live, mapping[b._tgt[:b._erange]], -1)
+
+        for (key_type, _), prop in b._props.items():
+            if key_type == "v":
+                prop._reserve()
+                prop._array[:len(order)] = prop._array[order]
+                prop._array[len(order):] = prop._default
+
+        b._nv = len(order)
+        self._modified()
+
+    def new_vertex_property(self, value_type, vals=None, val=None, array=None):
+        prop = PropertyMap(self._b, "v", value_type, val, array=array)
+        if vals is not None:
+            prop.a = vals
+        return prop
+
+    def new_edge_property(self, value_type, vals=None, val=None, array=None):
+        prop = PropertyMap(self._b, "e", value_type, val, array=array)
+        if vals is not None:
+            prop.a = vals
+        return prop
+
+    def new_graph_property(self, value_type, val=None):
+        return PropertyMap(self._b, "g", value_type, val)
+
+    new_vp = new_vertex_property
+    new_ep = new_edge_property
+    new_gp = new_graph_property
+
+
+class GraphView(Graph):
+    """
+    A view of graph filtered by boolean vertex and/or edge properties or arrays. The filters are applied whenever the
+    view is accessed, hence changes to filters or to the graph are reflected immediately. A view of a view applies the
+    filters of both.
+
+    When the vertex filters of view and its parents are :class:`Mask` arrays (or absent), the vertices of view are
+    cached until a mask or the vertices of graph change. Hence, :meth:`num_vertices` takes constant time.
+    """
+
+    def __init__(self, g: Graph, vfilt=None, efilt=None):
+        self._b = g._b
+        self._g = g
+        self._vfilt = vfilt
+        self._efilt = efilt
+        self.vertex_properties = self.vp = g._b.vertex_properties
+        self.edge_properties = self.ep = g._b.edge_properties
+        self.graph_properties = self.gp = g._b.graph_properties
+        self.edge_index = g._b.edge_index
+
+        # Cached vertices of view: (key, vertex ids), see :meth:`_key`.
+        self._vids = None
+
+    @staticmethod
+    def _mask(filt):
+        if filt is None:
+            return filt
+        if isinstance(filt, np.ndarray):
+            return filt.view(np.ndarray)
+        return filt.get_array().view(bool)
+
+    def _filter(self, eids):
+        eids = self._g._filter(eids)
+        vmask = self._mask(self._vfilt)
+        if vmask is not None:
+            eids = eids[vmask[self._b._src[eids]] & vmask[self._b._tgt[eids]]]
+        efilt = self._mask(self._efilt)
+        if efilt is not None:
+            eids = eids[efilt[eids]]
+        return eids
+
+    def _key(self):
+        """ Returns a key, which changes whenever the vertices of view may change, or None if they are not tracked. """
+        key = self._g._key()
+        if key is None or self._vfilt is None:
+            return key
+
+        return key + (id(self._vfilt), self._vfilt.version) if isinstance(self._vfilt, Mask) else None
+
+    def _vertex_ids(self):
+        key = self._key()
+        if key is not None and self._vids is not None and self._vids[0] == key:
+            return self._vids[1]
+
+        vids = self._g._vertex_ids()
+        vmask = self._mask(self._vfilt)
+        vids = vids if vmask is None else vids[vmask[vids]]
+        if key is not None:
+            vids.setflags(write=False)
+            self._vids = (key, vids)
+
+        return vids
+
+    def num_vertices(self, ignore_filter=False):
+        return self._b._nv if ignore_filter else len(self._vertex_ids())
+
+    def num_edges(self, ignore_filter=False):
+        return self._b._ne if ignore_filter else len(self._all_eids())
+
+
+def label_components(g: Graph):
+    """
+    Labels the strongly connected components of graph using iterative Tarjan's algorithm.
+
+    :param g: A :class:`Graph` object.
+    :return: An integer array with component label of every vertex.
+    """
+    n = g.num_vertices(ignore_filter=True)
+    indptr, eids = g._adjacency()
+    eids = g._filter(eids)
+    sources = g._b._src[eids]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    return tarjan(indptr, g._b._tgt[eids], roots=g._vertex_ids())
+
+
+def tarjan(indptr: np.ndarray, indices: np.ndarray, roots: np.ndarray = None):
+    """
+    Labels the strongly connected components of graph given by its forward adjacency (CSR) using iterative Tarjan's
+    algorithm.
+
+    :param indptr: Forward adjacency (CSR) index pointer of graph.
+    :param indices: Forward adjacency (CSR) indices of graph.
+    :param roots: (Optional) Vertices from which the search is started. Default: All vertices.
+
+    :return: An integer array with component label of every vertex. Vertices not reachable from roots are labeled -1.
+    """
+    n = len(indptr) - 1
+    roots = range(n) if roots is None else roots.tolist()
+    indptr, succ = np.asarray(indptr).tolist(), np.asarray(indices).tolist()
+
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    labels = [-1] * n
+    stack = []
+    counter = num_components = 0
+
+    for root in roots:
+        if index[root] >= 0:
+            continue
+
+        # Call stack of (vertex, position of next successor to visit).
+        calls = [(root, indptr[root])]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+
+        while calls:
+            v, pos = calls[-1]
+            if pos < indptr[v + 1]:
+                calls[-1] = (v, pos + 1)
+                w = succ[pos]
+                if index[w] < 0:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    calls.append((w, indptr[w]))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+
+            calls.pop()
+            if calls:
+                u = calls[-1][0]
+                low[u] = min(low[u], low[v])
+
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    labels[w] = num_components
+                    if w == v:
+                        break
+                num_components += 1
+
+    return np.array(labels, dtype=np.int64)
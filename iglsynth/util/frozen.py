@@ -0,0 +1,308 @@
+"""
+iglsynth: frozen.py
+
+License goes here...
+"""
+
+import numpy as np
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class FrozenGraph(object):
+    """
+    Represents an immutable snapshot of a :class:`Graph <iglsynth.util.graph.Graph>`. Use
+    :meth:`Graph.freeze() <iglsynth.util.graph.Graph.freeze>` to create a snapshot.
+
+    The forward adjacency is stored in CSR form, i.e. the successors of vertex ``v`` are
+    ``fwd_indices[fwd_indptr[v]:fwd_indptr[v + 1]]``, and the reverse adjacency is stored in CSC form, i.e. the
+    predecessors of ``v`` are ``rev_indices[rev_indptr[v]:rev_indptr[v + 1]]``. Neighbors are returned as slices of
+    these arrays without copying. Edge indices are the same as in the graph.
+
+    All arrays are copied from the graph and are read-only. Hence, the snapshot is not affected by later changes to
+    the graph, and may be shared between threads. It can be pickled to send it to other processes.
+
+    :param num_vertices: Number of vertices.
+    :type num_vertices: int
+
+    :param edges: An ``(m, 3)`` integer array, whose rows are (source, target, edge index).
+    :type edges: numpy.ndarray
+
+    :param vprops: (Optional) A dictionary {name: (type, values)} of vertex properties, where values are indexed by
+        vertex id.
+    :type vprops: Dict[str, Tuple[str, numpy.ndarray]]
+
+    :param eprops: (Optional) A dictionary {name: (type, values)} of edge properties, where values are indexed by
+        edge index.
+    :type eprops: Dict[str, Tuple[str, numpy.ndarray]]
+
+    :param gprops: (Optional) A dictionary {name: (type, value)} of graph properties.
+    :type gprops: Dict[str, Tuple[str, Any]]
+
+    .. note:: Values of "object" properties are not copied. Changes to objects themselves are visible in snapshot.
+    """
+
+    def __init__(self, num_vertices: int, edges: np.ndarray, vprops: Dict[str, Tuple[str, np.ndarray]] = None,
+                 eprops: Dict[str, Tuple[str, np.ndarray]] = None, gprops: Dict[str, Tuple[str, Any]] = None):
+        edges = np.array(edges, dtype=np.int64).reshape(-1, 3)
+        self._num_vertices = num_vertices
+        self._edges = _freeze(edges)
+
+        sources, targets, eids = edges[:, 0], edges[:, 1], edges[:, 2]
+
+        # Forward adjacency (CSR): edges sorted by source
+        self.fwd_indptr, order = _compress(sources, num_vertices)
+        self.fwd_indices = _freeze(targets[order])
+        self.fwd_eids = _freeze(eids[order])
+
+        # Reverse adjacency (CSC): edges sorted by target
+        self.rev_indptr, order = _compress(targets, num_vertices)
+        self.rev_indices = _freeze(sources[order])
+        self.rev_eids = _freeze(eids[order])
+
+        self.out_degree = _freeze(np.diff(self.fwd_indptr))
+        self.in_degree = _freeze(np.diff(self.rev_indptr))
+
+        self._vprops = {name: (of_type, _freeze(np.array(values))) for name, (of_type, values) in
+                        (vprops or dict()).items()}
+        self._eprops = {name: (of_type, _freeze(np.array(values))) for name, (of_type, values) in
+                        (eprops or dict()).items()}
+        self._gprops = dict(gprops or dict())
+
+    def __repr__(self):
+        return f"FrozenGraph(|V|={self.num_vertices}, |E|={self.num_edges}, vprops={self.vertex_properties}, " \
+               f"eprops={self.edge_properties}, gprops={self.graph_properties})"
+
+    def __setstate__(self, state):
+        # Arrays are writeable after unpickling.
+        self.__dict__.update(state)
+        for value in self.__dict__.values():
+            if isinstance(value, np.ndarray):
+                _freeze(value)
+
+        for _, values in list(self._vprops.values()) + list(self._eprops.values()):
+            _freeze(values)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # PROPERTIES
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def backend(self) -> str:
+        """ Returns "frozen". """
+        return "frozen"
+
+    @property
+    def vertices(self) -> Iterator[int]:
+        """ Returns an iterator over vertices in graph. """
+        return iter(range(self._num_vertices))
+
+    @property
+    def num_vertices(self) -> int:
+        """ Returns the number of vertices in graph. """
+        return self._num_vertices
+
+    @property
+    def vertex_index_range(self) -> int:
+        """ Returns the number of vertex ids in graph, which equals the number of vertices. """
+        return self._num_vertices
+
+    @property
+    def num_edges(self) -> int:
+        """ Returns the number of edges in graph. """
+        return len(self._edges)
+
+    @property
+    def vertex_properties(self) -> List[str]:
+        """ Returns the a list of vertex property names in graph. """
+        return list(self._vprops.keys())
+
+    @property
+    def edge_properties(self) -> List[str]:
+        """ Returns the a list of edge property names in graph. """
+        return list(self._eprops.keys())
+
+    @property
+    def graph_properties(self) -> List[str]:
+        """ Returns the a list of graph property names in graph. """
+        return list(self._gprops.keys())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------------------------
+    def freeze(self) -> 'FrozenGraph':
+        """ Returns the snapshot itself, as it is immutable. """
+        return self
+
+    def has_vertex_property(self, name: str, of_type: str = None) -> bool:
+        """
+        Checks if graph has a vertex property with give name. If type is provided, it checks whether the vertex property
+        with given name and type exists.
+
+        :param name: Name of vertex property.
+        :param of_type: Expected type of the property.
+        """
+        return name in self._vprops and (of_type is None or self._vprops[name][0] == of_type)
+
+    def has_edge_property(self, name: str, of_type: str = None) -> bool:
+        """
+        Checks if graph has an edge property with give name. If type is provided, it checks whether the edge property
+        with given name and type exists.
+
+        :param name: Name of edge property.
+        :param of_type: Expected type of the property.
+        """
+        return name in self._eprops and (of_type is None or self._eprops[name][0] == of_type)
+
+    def has_graph_property(self, name: str, of_type: str = None) -> bool:
+        """
+        Checks if graph has a graph property with give name. If type is provided, it checks whether the graph property
+        with given name and type exists.
+
+        :param name: Name of graph property.
+        :param of_type: Expected type of the property.
+        """
+        return name in self._gprops and (of_type is None or self._gprops[name][0] == of_type)
+
+    def typeof_vertex_property(self, name: str) -> str:
+        """
+        Returns the type of vertex property.
+
+        :raises NameError: If graph has no vertex property with given name.
+        """
+        if name not in self._vprops:
+            raise NameError(f"'{name}' is not a vertex property of graph '{self}'")
+
+        return self._vprops[name][0]
+
+    def typeof_edge_property(self, name: str) -> str:
+        """
+        Returns the type of edge property.
+
+        :raises NameError: If graph has no edge property with given name.
+        """
+        if name not in self._eprops:
+            raise NameError(f"'{name}' is not a edge property of graph '{self}'")
+
+        return self._eprops[name][0]
+
+    def typeof_graph_property(self, name: str) -> str:
+        """
+        Returns the type of graph property.
+
+        :raises NameError: If graph has no graph property with given name.
+        """
+        if name not in self._gprops:
+            raise NameError(f"'{name}' is not a graph property of graph '{self}'")
+
+        return self._gprops[name][0]
+
+    def get_vertex_property(self, name: str, vid: int = None):
+        """
+        Get the value of vertex property for a given vertex.
+
+        :param name: Name of vertex property.
+        :param vid: Vertex ID. If vertex ID is not given then complete dictionary of property {vid: prop_value} is
+            returned.
+
+        :return: Value of the property, or None if there is no such property or vertex.
+        """
+        if name not in self._vprops:
+            return None
+
+        values = self._vprops[name][1]
+        if vid is None:
+            return dict(enumerate(values.tolist()))
+
+        if self.has_vertex(vid):
+            return values[vid].item() if values.dtype != object else values[vid]
+
+    def get_graph_property(self, name: str):
+        """
+        Get the value of graph property.
+
+        :param name: Name of graph property.
+        :return: Value of the property, or None if there is no such property.
+        """
+        if name in self._gprops:
+            return self._gprops[name][1]
+
+    def vprop(self, name: str) -> np.ndarray:
+        """
+        Returns the values of vertex property as a read-only NumPy array indexed by vertex id.
+
+        :param name: Name of vertex property.
+
+        :raises NameError: If graph has no vertex property with given name.
+        :raises TypeError: If the property is of type "string" or "object".
+        """
+        return _column(self._vprops, name, "vertex")
+
+    def eprop(self, name: str) -> np.ndarray:
+        """
+        Returns the values of edge property as a read-only NumPy array indexed by edge index.
+
+        :param name: Name of edge property.
+
+        :raises NameError: If graph has no edge property with given name.
+        :raises TypeError: If the property is of type "string" or "object".
+        """
+        return _column(self._eprops, name, "edge")
+
+    def vertex_mask(self) -> np.ndarray:
+        """ Returns a boolean array, which marks all vertices in graph. """
+        return np.ones(self._num_vertices, dtype=bool)
+
+    def has_vertex(self, vid: int) -> bool:
+        """ Checks if graph has a vertex with given id in constant time. """
+        return 0 <= vid < self._num_vertices
+
+    def has_edge(self, uid: int, vid: int) -> bool:
+        """ Checks if graph has an edge from ``uid`` to ``vid`` in time linear in out-degree of ``uid``. """
+        return self.has_vertex(uid) and bool((self.out_neighbors(uid) == vid).any())
+
+    def edges_array(self) -> np.ndarray:
+        """ Returns all edges in graph as an ``(m, 3)`` integer array, whose rows are (source, target, edge index). """
+        return self._edges
+
+    def in_edges_array(self, vid: int) -> np.ndarray:
+        """ Returns the incoming edges of a vertex as a ``(k, 3)`` integer array. """
+        start, stop = self.rev_indptr[vid], self.rev_indptr[vid + 1]
+        return np.column_stack((self.rev_indices[start:stop], np.full(stop - start, vid, dtype=np.int64),
+                                self.rev_eids[start:stop]))
+
+    def out_edges_array(self, vid: int) -> np.ndarray:
+        """ Returns the outgoing edges of a vertex as a ``(k, 3)`` integer array. """
+        start, stop = self.fwd_indptr[vid], self.fwd_indptr[vid + 1]
+        return np.column_stack((np.full(stop - start, vid, dtype=np.int64), self.fwd_indices[start:stop],
+                                self.fwd_eids[start:stop]))
+
+    def in_neighbors(self, vid: int) -> np.ndarray:
+        """ Returns the predecessors of a vertex, one per incoming edge, as a read-only array. """
+        return self.rev_indices[self.rev_indptr[vid]:self.rev_indptr[vid + 1]]
+
+    def out_neighbors(self, vid: int) -> np.ndarray:
+        """ Returns the successors of a vertex, one per outgoing edge, as a read-only array. """
+        return self.fwd_indices[self.fwd_indptr[vid]:self.fwd_indptr[vid + 1]]
+
+
+def _freeze(array: np.ndarray) -> np.ndarray:
+    """ Marks the array as read-only, and returns it. """
+    array.setflags(write=False)
+    return array
+
+
+def _compress(keys: np.ndarray, num_vertices: int):
+    """ Returns (indptr, order) such that ``keys[order]`` is sorted and grouped by ``indptr``. """
+    indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=num_vertices), out=indptr[1:])
+    return _freeze(indptr), np.argsort(keys, kind="stable")
+
+
+def _column(props: Dict[str, Tuple[str, np.ndarray]], name: str, kind: str) -> np.ndarray:
+    if name not in props:
+        raise NameError(f"{name} is not a valid {kind} property.")
+
+    of_type, values = props[name]
+    if of_type in ("string", "object"):
+        raise TypeError(f"Property {name} of type {of_type} is not stored as an array.")
+
+    return values
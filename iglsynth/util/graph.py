@@ -4,8 +4,15 @@ iglsynth: graph.py
 License goes here...
 """
 
-import graph_tool as gt
-from typing import Iterable, Iterator, List, Tuple
+import numpy as np
+import pickle
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from iglsynth.util import csr, storage
+from iglsynth.util.frozen import FrozenGraph
+from iglsynth.util.lazy import LazyModule
+
+# graph_tool is imported on first use.
+gt = LazyModule("graph_tool")
 
 
 class Graph(object):
@@ -23,6 +30,12 @@ class Graph(object):
     :param gprops: An iterable of 2-tuple of (vertex-property-name, vertex-property-type). The type must be a string
         from values of dictionary :data:`VALID_PROPERTY_TYPES <iglsynth.util.VALID_PROPERTY_TYPES>`
     :type gprops: Iterable[Tuple[str, str]]
+
+    :param backend: (Optional) Graph library used to store the graph, one of :data:`BACKENDS`.
+        Default: :data:`DEFAULT_BACKEND`.
+    :type backend: str
+
+    :raises ValueError: If the backend is invalid.
     """
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -30,6 +43,11 @@ class Graph(object):
     # ------------------------------------------------------------------------------------------------------------------
     VALID_PROPERTY_TYPES = {bool: "bool", int: "int", float: "float", str: "string", object: "object"}
 
+    # "graph_tool" stores the graph using graph_tool library.
+    # "numpy" stores the graph as NumPy arrays (see :mod:`iglsynth.util.csr`), and does not require graph_tool.
+    BACKENDS = ("graph_tool", "numpy")
+    DEFAULT_BACKEND = "graph_tool"
+
     # ------------------------------------------------------------------------------------------------------------------
     # INTERNAL PRIVATE CLASSES
     # ------------------------------------------------------------------------------------------------------------------
@@ -42,8 +60,13 @@ class Graph(object):
         :param gt_edge: A ``graph_tool.Edge`` object.
 
         .. warning:: DO NOT INSTANTIATE. This class must not be instantiated by users.
+
+        .. note:: Edge objects are created on demand, when iterating over :attr:`Graph.edges`, :meth:`Graph.in_edges`
+            or :meth:`Graph.out_edges`. For large graphs, use :meth:`Graph.edges_array`, which represents edges by
+            their integer edge index without creating any object.
         """
 
+        __slots__ = ("_graph", "_edge")
         __hash__ = object.__hash__
 
         def __init__(self, graph, gt_edge):
@@ -54,7 +77,10 @@ class Graph(object):
             return f"Edge(source={self.source}, target={self.target})"
 
         def __eq__(self, other: 'Edge'):
-            """ Two edges are equivalent, if their source, target and all properties are equivalent. """
+            """
+            Two edges are equivalent, if their edge descriptors are equivalent, i.e. they are the same edge of the same
+            graph. Parallel edges with same source and target are not equivalent. Edge properties are not compared.
+            """
             return self.edge == other.edge
 
         @property
@@ -71,17 +97,29 @@ class Graph(object):
         def edge(self):
             return self._edge
 
+        @property
+        def index(self):
+            """ Returns the edge index of edge. """
+            return int(self._graph._graph.edge_index[self._edge])
+
     # ------------------------------------------------------------------------------------------------------------------
     # INTERNAL METHODS
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self, vprops: Iterable[Tuple[str, str]] = tuple(), eprops: Iterable[Tuple[str, str]] = tuple(),
-                 gprops: Iterable[Tuple[str, str]] = tuple()):
-
-        # Define a graph object
-        self._graph = gt.Graph()
+                 gprops: Iterable[Tuple[str, str]] = tuple(), backend: str = None):
+
+        # Define a graph object using selected backend
+        backend = self.DEFAULT_BACKEND if backend is None else backend
+        if backend == "graph_tool":
+            self._graph = gt.Graph()
+        elif backend == "numpy":
+            self._graph = csr.Graph()
+        else:
+            raise ValueError(f"Given backend: {backend} is invalid. Backends must be in {self.BACKENDS}.")
 
-        # Create an edge dictionary to maintain a map of edge id's and edge objects {eid: gt.edge_obj}
-        self._edge_map = dict()
+        # Create an edge index to maintain a map of (source, target) and edge indices {(uid, vid): [eid, ...]}.
+        #   The index is built on first use and is updated when edges are added or removed.
+        self._edge_index = None
 
         # Add vertex properties
         for name, of_type in vprops:
@@ -115,6 +153,13 @@ class Graph(object):
     # ------------------------------------------------------------------------------------------------------------------
     # PROPERTIES
     # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def backend(self) -> str:
+        """
+        Returns the name of graph library used to store the graph.
+        """
+        return "numpy" if isinstance(self._graph, csr.Graph) else "graph_tool"
+
     @property
     def vertices(self) -> Iterator:
         """
@@ -136,6 +181,14 @@ class Graph(object):
         """
         return self._graph.num_vertices()
 
+    @property
+    def vertex_index_range(self) -> int:
+        """
+        Returns the number of vertex ids in graph, i.e. the length of arrays indexed by vertex id, such as
+        :meth:`vprop`. Unlike :attr:`num_vertices`, it includes the vertices filtered out of a :class:`SubGraph`.
+        """
+        return self._graph.num_vertices(ignore_filter=True)
+
     @property
     def num_edges(self) -> int:
         """
@@ -209,11 +262,12 @@ class Graph(object):
         """
         try:
             edge = self._graph.add_edge(uid, vid, add_missing=False)
+            self._index_edge(int(uid), int(vid), int(self._graph.edge_index[edge]))
             return Graph.Edge(graph=self, gt_edge=edge)
 
         except ValueError:
-            uid_in_graph = "IN-GRAPH" if uid in self.vertices else "NOT-IN-GRAPH"
-            vid_in_graph = "IN-GRAPH" if vid in self.vertices else "NOT-IN-GRAPH"
+            uid_in_graph = "IN-GRAPH" if self.has_vertex(uid) else "NOT-IN-GRAPH"
+            vid_in_graph = "IN-GRAPH" if self.has_vertex(vid) else "NOT-IN-GRAPH"
             raise AssertionError(f"At least one vertex is not in graph. "
                              f"Vertex {uid}: {uid_in_graph}, Vertex {vid}: {vid_in_graph}.")
 
@@ -225,10 +279,66 @@ class Graph(object):
         :type edges: Iterable[Tuple[int, int]]
 
         :raises ValueError: When at least one of the vertex is not in the graph.
+
+        .. note:: A :class:`Graph.Edge` object is created for every edge. For adding large number of edges, use
+            :meth:`add_edge_array`.
         """
 
         return iter([self.add_edge(u, v) for u, v in edges])
 
+    def add_edge_array(self, edges, eprops: Dict[str, Sequence] = None) -> Sequence[int]:
+        """
+        Adds multiple edges to the graph in a single call to internal graph library. All the vertices must be present
+        in the graph.
+
+        :param edges: An ``(m, 2)`` integer array (or an object supporting buffer protocol) of (uid, vid) rows.
+        :type edges: numpy.ndarray
+
+        :param eprops: (Optional) A dictionary {eprop-name: values}, where values is an array of length ``m`` with
+            value of edge property for every edge.
+        :type eprops: Dict[str, Sequence]
+
+        :return: Edge indices of added edges, in order of ``edges``. Usually, it is a ``range``. If edge indices of
+            previously removed edges are reused by internal graph library, it is an integer array.
+
+        :raises AssertionError: When at least one of the vertex is not in the graph.
+        :raises NameError: When at least one of the names in ``eprops`` is not an edge property.
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        eprops = dict() if eprops is None else eprops
+
+        # Validate inputs before modifying the graph
+        if len(edges) > 0 and (edges.min() < 0 or edges.max() >= self.num_vertices):
+            raise AssertionError(f"At least one vertex is not in graph. "
+                                 f"Vertex ids must be in [0, {self.num_vertices}).")
+
+        for name in eprops:
+            if name not in self.edge_properties:
+                raise NameError(f"{name} is not a valid edge property.")
+
+        # Edges are indexed contiguously, unless indices of removed edges are free to be reused.
+        #   Properties of python object types are not stored as arrays, and are set edge by edge.
+        start = self._graph.edge_index_range
+        props = {name: self._graph.edge_properties[name] for name in eprops}
+        if self._graph.num_edges() == start and all(prop.a is not None for prop in props.values()):
+            self._graph.add_edge_list(edges)
+            eids = range(start, start + len(edges))
+            for name, prop in props.items():
+                prop.a[start:start + len(edges)] = eprops[name]
+
+        else:
+            gt_edges = [self._graph.add_edge(int(u), int(v)) for u, v in edges]
+            eids = np.array([self._graph.edge_index[edge] for edge in gt_edges], dtype=np.int64)
+            for name, prop in props.items():
+                for edge, value in zip(gt_edges, eprops[name]):
+                    prop[edge] = value
+
+        if self._edge_index is not None:
+            for (uid, vid), eid in zip(edges.tolist(), eids):
+                self._index_edge(uid, vid, int(eid))
+
+        return eids
+
     def remove_vertex(self, vid):
         """
         Removes a single vertex from the graph, if exists.
@@ -236,18 +346,55 @@ class Graph(object):
         :param vid: Vertex id.
         :type vid: int
         """
-        if vid in self.vertices:
+        if self.has_vertex(vid):
             self._graph.remove_vertex(vid)
 
-    def remove_vertices(self, vid: Iterable[int]):
+            # Vertex ids after removed vertex are shifted. Hence, the edge index is rebuilt on its next use.
+            self._invalidate_edge_index()
+
+    def remove_vertices(self, vid: Iterable[int], fast: bool = False) -> np.ndarray:
         """
-        Removes a multiple vertices from the graph, if existing.
+        Removes a multiple vertices from the graph, if existing, in a single call to internal graph library.
+
+        The remaining vertices are renumbered to be contiguous. By default, their order is preserved, i.e. every
+        vertex id is decreased by the number of removed vertices with smaller id. When ``fast = True``, every removed
+        vertex is replaced by the vertex with largest id (in decreasing order of removed ids), which only renumbers
+        as many vertices as there are removed.
 
         :param vid: A list of vertex id's.
         :type vid: Iterable[int]
+
+        :param fast: Should the order of remaining vertices be ignored? Default: False.
+        :type fast: bool
+
+        :return: An integer array of length equal to number of vertices before removal, which maps every old vertex
+            id to its new vertex id, or to -1 if the vertex is removed.
         """
-        for v in reversed(sorted(vid)):
-            self.remove_vertex(v)
+        n = self._graph.num_vertices()
+        vid = np.fromiter(vid, dtype=np.int64)
+        vid = np.unique(vid[(vid >= 0) & (vid < n)])
+
+        if fast:
+            # Simulate the swap of every removed vertex with the current last vertex.
+            order = np.arange(n)
+            last = n
+            for v in vid[::-1].tolist():
+                last -= 1
+                order[v] = order[last]
+
+            mapping = np.full(n, -1, dtype=np.int64)
+            mapping[order[:last]] = np.arange(last)
+
+        else:
+            keep = np.ones(n, dtype=bool)
+            keep[vid] = False
+            mapping = np.where(keep, np.cumsum(keep) - 1, -1)
+
+        if len(vid) > 0:
+            self._graph.remove_vertex(vid[::-1], fast=fast)
+            self._invalidate_edge_index()
+
+        return mapping
 
     def remove_edge(self, edge: 'Graph.Edge'):
         """
@@ -255,7 +402,8 @@ class Graph(object):
 
         :param edge: :class:`Graph.Edge` object to be removed.
         """
-        if edge.edge in self._graph.edges():
+        if self._is_valid_edge(edge):
+            self._unindex_edge(edge.source, edge.target, int(self._graph.edge_index[edge.edge]))
             self._graph.remove_edge(edge.edge)
 
     def remove_edges(self, edges: Iterable['Graph.Edge']):
@@ -288,10 +436,11 @@ class Graph(object):
             raise TypeError(f"Given vertex property type: {of_type} is invalid. "
                             f"Types must be in {self.VALID_PROPERTY_TYPES.values()}")
 
+        value_type = self._value_type(of_type)
         if default is not None:
-            self._graph.vertex_properties[name] = self._graph.new_vertex_property(value_type=of_type, val=default)
+            self._graph.vertex_properties[name] = self._graph.new_vertex_property(value_type=value_type, val=default)
         else:
-            self._graph.vertex_properties[name] = self._graph.new_vertex_property(value_type=of_type)
+            self._graph.vertex_properties[name] = self._graph.new_vertex_property(value_type=value_type)
 
     def add_edge_property(self, name: str, of_type: str = "object", default=None):
         """
@@ -314,10 +463,11 @@ class Graph(object):
             raise TypeError(f"Given edge property type: {of_type} is invalid. "
                             f"Types must be in {self.VALID_PROPERTY_TYPES.values()}")
 
+        value_type = self._value_type(of_type)
         if default is not None:
-            self._graph.edge_properties[name] = self._graph.new_edge_property(value_type=of_type, default=None)
+            self._graph.edge_properties[name] = self._graph.new_edge_property(value_type=value_type, val=default)
         else:
-            self._graph.edge_properties[name] = self._graph.new_edge_property(value_type=of_type)
+            self._graph.edge_properties[name] = self._graph.new_edge_property(value_type=value_type)
 
     def add_graph_property(self, name: str, of_type: str = "object", default=None):
         """
@@ -415,13 +565,21 @@ class Graph(object):
         :type vid: int
 
         :return: Value of the property.
+
+        .. note:: The dictionary of property is a convenience wrapper, which copies all values. Use :meth:`vprop` to
+            access the values as an array without copying.
         """
         if vid is None:
             if name in self.vertex_properties:
-                return dict(zip(range(self.num_vertices), self._graph.vertex_properties[name].ma))
+                vertices = self._graph.get_vertices()
+                prop = self._graph.vertex_properties[name]
+                if prop.a is None:
+                    return {int(v): prop[v] for v in vertices}
+
+                return dict(zip(vertices.tolist(), self.vprop(name)[vertices].tolist()))
 
         else:
-            if name in self.vertex_properties and vid in self.vertices:
+            if name in self.vertex_properties and self.has_vertex(vid):
                 return self._graph.vertex_properties[name].python_value_type()(self._graph.vertex_properties[name][vid])
 
     def get_edge_property(self, name: str, edge: 'Graph.Edge' = None):
@@ -432,20 +590,26 @@ class Graph(object):
         :type name: str
 
         :param edge: Edge for which the property value is to be extracted.
+            If edge is not given then complete dictionary of property {edge: prop_value} is returned.
         :type edge: :class:`Graph.Edge`
 
         :return: Value of the property.
 
-        .. todo: Make ``edge`` to be an optional parameter. When ``edge = None`` return the properties for all edges
-            as a dictionary.
+        .. note:: The dictionary of property is a convenience wrapper, which copies all values. Use :meth:`eprop` to
+            access the values as an array without copying.
         """
         if edge is None:
             if name in self.edge_properties:
-                return dict(zip((Graph.Edge(graph=self, gt_edge=edge) for edge in self._graph.edges()),
-                                self._graph.edge_properties[name].ma))
+                edges = [Graph.Edge(graph=self, gt_edge=edge) for edge in self._graph.edges()]
+                prop = self._graph.edge_properties[name]
+                if prop.a is None:
+                    return {edge: prop[edge.edge] for edge in edges}
+
+                column = self.eprop(name).tolist()
+                return {edge: column[edge.index] for edge in edges}
 
         else:
-            if name in self.edge_properties and edge.edge in self._graph.edges():
+            if name in self.edge_properties and self._is_valid_edge(edge):
                 return self._graph.edge_properties[name].python_value_type()(self._graph.
                                                                              edge_properties[name][edge.edge])
 
@@ -461,6 +625,66 @@ class Graph(object):
         if name in self.graph_properties:
             return self._graph.graph_properties[name]
 
+    def vprop(self, name: str) -> np.ndarray:
+        """
+        Returns the values of vertex property as a NumPy array indexed by vertex id. The array is a view of the
+        internal storage of property, i.e. no values are copied, and assignments to the array (including fancy-indexed
+        and masked assignments) update the property. For example,
+
+        .. code-block:: python
+
+            turn = graph.vprop("turn")
+            turn[:] = 2
+            turn[[0, 4, 6]] = 1
+
+        :param name: Name of vertex property.
+        :type name: str
+
+        :raises NameError: If given name is not a vertex property.
+        :raises TypeError: If the property is of type "string" or "object", whose values are not stored in an array.
+
+        .. note:: The array is indexed by vertex id of graph, including the vertices filtered out of a
+            :class:`SubGraph`.
+
+        .. warning:: The array may be invalidated when vertices are added to the graph. Call :meth:`vprop` again
+            after adding vertices.
+        """
+        if name not in self.vertex_properties:
+            raise NameError(f"{name} is not a valid vertex property.")
+
+        return self._column(name=name, prop=self._graph.vertex_properties[name])
+
+    def eprop(self, name: str) -> np.ndarray:
+        """
+        Returns the values of edge property as a NumPy array indexed by edge index. The array is a view of the
+        internal storage of property. See :meth:`vprop`.
+
+        The edge indices of edges added by :meth:`add_edge_array` are returned by it.
+
+        :param name: Name of edge property.
+        :type name: str
+
+        :raises NameError: If given name is not an edge property.
+        :raises TypeError: If the property is of type "string" or "object", whose values are not stored in an array.
+
+        .. warning:: The array may be invalidated when edges are added to the graph. Call :meth:`eprop` again
+            after adding edges.
+        """
+        if name not in self.edge_properties:
+            raise NameError(f"{name} is not a valid edge property.")
+
+        return self._column(name=name, prop=self._graph.edge_properties[name])
+
+    @staticmethod
+    def _column(name: str, prop) -> np.ndarray:
+        """ Returns the array of values of a graph_tool property map. Boolean values are viewed as bool. """
+        array = prop.a
+        if array is None:
+            raise TypeError(f"Property {name} of type {prop.value_type()} is not stored as an array.")
+
+        # graph_tool stores boolean properties as uint8.
+        return array.view(bool) if prop.value_type() == "bool" else array
+
     def set_vertex_property(self, name: str, vid: int, value):
         if name in self.vertex_properties:
             self._graph.vertex_properties[name][vid] = value
@@ -468,7 +692,7 @@ class Graph(object):
             raise NameError(f"{name} is not a valid vertex property.")
 
     def set_edge_property(self, name: str, edge: 'Graph.Edge', value):
-        if name in self.edge_properties and edge.edge in self._graph.edges():
+        if name in self.edge_properties and self._is_valid_edge(edge):
             self._graph.edge_properties[name][edge.edge] = value
 
         else:
@@ -530,11 +754,119 @@ class Graph(object):
             return self.VALID_PROPERTY_TYPES[type(prop)]
         return "object"
 
+    def vertex_mask(self) -> np.ndarray:
+        """
+        Returns a boolean array of length :attr:`vertex_index_range`, which marks the vertices in graph. The vertices
+        filtered out of a :class:`SubGraph` are marked False.
+        """
+        mask = np.zeros(self.vertex_index_range, dtype=bool)
+        mask[self._graph.get_vertices()] = True
+        return mask
+
+    def has_vertex(self, vid: int) -> bool:
+        """
+        Checks if graph has a vertex with given id in constant time.
+
+        :param vid: Vertex id.
+        :type vid: int
+        """
+        return 0 <= vid < self._graph.num_vertices()
+
+    def has_edge(self, uid: int, vid: int) -> bool:
+        """
+        Checks if graph has an edge from ``uid`` to ``vid`` in constant time.
+
+        :param uid: Vertex ID of source vertex.
+        :type uid: int
+
+        :param vid: Vertex ID of target vertex.
+        :type vid: int
+        """
+        return len(self._edge_ids(uid, vid)) > 0
+
+    def find_edge(self, uid: int, vid: int) -> 'Graph.Edge':
+        """
+        Returns an edge from ``uid`` to ``vid``.
+
+        :param uid: Vertex ID of source vertex.
+        :type uid: int
+
+        :param vid: Vertex ID of target vertex.
+        :type vid: int
+
+        :return: :class:`Graph.Edge` object representing the edge, or None if there is no such edge.
+        """
+        if not self.has_edge(uid, vid):
+            return None
+
+        return Graph.Edge(graph=self, gt_edge=self._graph.edge(uid, vid))
+
+    def _value_type(self, of_type: str) -> str:
+        """ Returns the value type of a vertex/edge property map. Integers are stored in 64 bits with every backend. """
+        return "int64_t" if of_type == "int" and self.backend == "graph_tool" else of_type
+
+    def _edge_ids(self, uid: int, vid: int) -> List[int]:
+        """ Returns the edge indices of all edges from ``uid`` to ``vid``. Builds the edge index, if necessary. """
+        if self._edge_index is None:
+            self._edge_index = dict()
+            for u, v, eid in self.edges_array().tolist():
+                self._edge_index.setdefault((u, v), []).append(eid)
+
+        return self._edge_index.get((uid, vid), [])
+
+    def _index_edge(self, uid: int, vid: int, eid: int):
+        """ Adds an edge to the edge index, if it is built. """
+        if self._edge_index is not None:
+            self._edge_index.setdefault((uid, vid), []).append(eid)
+
+    def _unindex_edge(self, uid: int, vid: int, eid: int):
+        """ Removes an edge from the edge index, if it is built. """
+        if self._edge_index is not None:
+            eids = self._edge_index[(uid, vid)]
+            eids.remove(eid)
+            if len(eids) == 0:
+                del self._edge_index[(uid, vid)]
+
+    def _invalidate_edge_index(self):
+        """ Discards the edge index. It is rebuilt on its next use. """
+        self._edge_index = None
+
+    def _is_valid_edge(self, edge: 'Graph.Edge') -> bool:
+        """ Checks if the given edge is in graph in constant time. """
+        return int(self._graph.edge_index[edge.edge]) in self._edge_ids(edge.source, edge.target)
+
+    def edges_array(self) -> np.ndarray:
+        """
+        Returns all edges in graph as an ``(m, 3)`` integer array, whose rows are (source, target, edge index).
+        Unlike :attr:`edges`, no :class:`Graph.Edge` object is created.
+        """
+        return self._graph.get_edges([self._graph.edge_index]).astype(np.int64).reshape(-1, 3)
+
+    def in_edges_array(self, vid: int) -> np.ndarray:
+        """
+        Returns the incoming edges of a vertex as a ``(k, 3)`` integer array, whose rows are
+        (source, target, edge index).
+
+        :param vid: Vertex id.
+        :type vid: int
+        """
+        return self._graph.get_in_edges(vid, [self._graph.edge_index]).astype(np.int64).reshape(-1, 3)
+
+    def out_edges_array(self, vid: int) -> np.ndarray:
+        """
+        Returns the outgoing edges of a vertex as a ``(k, 3)`` integer array, whose rows are
+        (source, target, edge index).
+
+        :param vid: Vertex id.
+        :type vid: int
+        """
+        return self._graph.get_out_edges(vid, [self._graph.edge_index]).astype(np.int64).reshape(-1, 3)
+
     def in_edges(self, vid: int):
-        return iter(Graph.Edge(graph=self, gt_edge=edge) for edge in self._graph.get_in_edges(vid))
+        return iter(Graph.Edge(graph=self, gt_edge=edge) for edge in self._graph.vertex(vid).in_edges())
 
     def out_edges(self, vid: int):
-        return iter(Graph.Edge(graph=self, gt_edge=edge) for edge in self._graph.get_out_edges(vid))
+        return iter(Graph.Edge(graph=self, gt_edge=edge) for edge in self._graph.vertex(vid).out_edges())
 
     def in_neighbors(self, vid: int):
         return iter(int(v) for v in self._graph.get_in_neighbors(vid))
@@ -542,39 +874,300 @@ class Graph(object):
     def out_neighbors(self, vid: int):
         return iter(int(v) for v in self._graph.get_out_neighbors(vid))
 
+    def freeze(self) -> FrozenGraph:
+        """
+        Returns an immutable snapshot of graph, which stores the forward (CSR) and reverse (CSC) adjacency, the degrees
+        and all properties as read-only NumPy arrays. Vertex ids and edge indices are the same as in graph. See
+        :class:`FrozenGraph <iglsynth.util.frozen.FrozenGraph>`.
+
+        The snapshot is not affected by later changes to graph. All solvers accept a game defined by a snapshot.
+
+        .. note:: The snapshot of a :class:`SubGraph` contains all vertex ids of its graph, but only the edges of
+            sub-graph.
+
+        :return: A :class:`FrozenGraph <iglsynth.util.frozen.FrozenGraph>` object.
+        """
+        edges = self.edges_array()
+        vprops, eprops = dict(), dict()
+
+        for name in self.vertex_properties:
+            of_type = self.typeof_vertex_property(name)
+            if of_type in ("string", "object"):
+                values = self.get_vertex_property(name)
+                column = np.empty(self._graph.num_vertices(ignore_filter=True), dtype=object)
+                column[list(values.keys())] = list(values.values())
+            else:
+                column = self.vprop(name)[:self._graph.num_vertices(ignore_filter=True)]
+            vprops[name] = (of_type, column)
+
+        for name in self.edge_properties:
+            of_type = self.typeof_edge_property(name)
+            if of_type in ("string", "object"):
+                column = np.empty(self._graph.edge_index_range, dtype=object)
+                for edge, value in self.get_edge_property(name).items():
+                    column[edge.index] = value
+            else:
+                column = self.eprop(name)
+            eprops[name] = (of_type, column)
+
+        gprops = {name: (self.typeof_graph_property(name), self.get_graph_property(name))
+                  for name in self.graph_properties}
+
+        return FrozenGraph(num_vertices=self._graph.num_vertices(ignore_filter=True), edges=edges, vprops=vprops,
+                           eprops=eprops, gprops=gprops)
+
+    def save(self, filename: str):
+        """
+        Saves the graph to a binary file. The edges are stored as CSR adjacency, i.e. sorted by source vertex, and
+        vertex and edge properties are stored as typed columns. See :mod:`iglsynth.util.storage`.
+
+        :param filename: Name of file.
+
+        .. note:: Vertex ids are preserved, and edges are renumbered in order of their source vertex.
+        """
+        header, arrays = self._to_arrays()
+        storage.write(filename, header={"graph": header}, arrays=arrays)
+
+    @classmethod
+    def load(cls, filename: str, mmap: bool = True, backend: str = None) -> 'Graph':
+        """
+        Loads a graph saved by :meth:`save`.
+
+        :param filename: Name of file.
+        :param mmap: Should the file be memory-mapped instead of read into memory? Default: True.
+        :param backend: (Optional) Backend of loaded graph. Default: :data:`DEFAULT_BACKEND`.
+
+        :return: A :class:`Graph` object.
+        """
+        header, arrays = storage.read(filename, mmap=mmap)
+        return cls._from_arrays(header["graph"], arrays, backend=backend)
+
+    def _to_arrays(self) -> Tuple[dict, Dict[str, np.ndarray]]:
+        """
+        Returns the metadata of graph and a dictionary of arrays representing the graph. Properties of types
+        "string" and "object" are pickled.
+        """
+        edges = self.edges_array()
+        order = np.argsort(edges[:, 0], kind="stable")
+        indptr = np.zeros(self.num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(edges[:, 0], minlength=self.num_vertices), out=indptr[1:])
+
+        header = {"num_vertices": self.num_vertices, "num_edges": self.num_edges,
+                  "vprops": dict(), "eprops": dict(), "gprops": dict()}
+        arrays = {"indptr": indptr, "indices": edges[order, 1], "sources": edges[order, 0]}
+
+        for name in self.vertex_properties:
+            of_type = header["vprops"][name] = self.typeof_vertex_property(name)
+            if of_type in ("string", "object"):
+                values = self.get_vertex_property(name)
+                arrays[f"vprop/{name}"] = _pickle([values[v] for v in range(self.num_vertices)])
+            else:
+                arrays[f"vprop/{name}"] = self.vprop(name)[:self.num_vertices]
+
+        eids = edges[order, 2]
+        for name in self.edge_properties:
+            of_type = header["eprops"][name] = self.typeof_edge_property(name)
+            if of_type in ("string", "object"):
+                values = {edge.index: value for edge, value in self.get_edge_property(name).items()}
+                arrays[f"eprop/{name}"] = _pickle([values[eid] for eid in eids.tolist()])
+            else:
+                arrays[f"eprop/{name}"] = self.eprop(name)[eids]
+
+        for name in self.graph_properties:
+            header["gprops"][name] = self.typeof_graph_property(name)
+            arrays[f"gprop/{name}"] = _pickle(self.get_graph_property(name))
+
+        return header, arrays
+
+    @classmethod
+    def _from_arrays(cls, header: dict, arrays: Dict[str, np.ndarray], backend: str = None) -> 'Graph':
+        """
+        Constructs a graph from the metadata and arrays returned by :meth:`_to_arrays`.
+
+        With NumPy backend, the adjacency and the columns of properties of types "bool", "int" and "float" wrap the
+        given arrays without copying, e.g. memory-mapped arrays are read from disk only when accessed. With graph_tool
+        backend, the arrays are copied into the graph.
+        """
+        backend = cls.DEFAULT_BACKEND if backend is None else backend
+        if backend == "numpy":
+            return cls._wrap_arrays(header, arrays)
+
+        graph = cls(vprops=header["vprops"].items(), eprops=header["eprops"].items(),
+                    gprops=header["gprops"].items(), backend=backend)
+
+        n = header["num_vertices"]
+        if n > 0:
+            graph.add_vertices(num=n)
+
+        for name, of_type in header["vprops"].items():
+            if of_type in ("string", "object"):
+                for vid, value in enumerate(_unpickle(arrays[f"vprop/{name}"])):
+                    graph.set_vertex_property(name=name, vid=vid, value=value)
+            else:
+                graph.vprop(name)[:n] = arrays[f"vprop/{name}"]
+
+        indptr = arrays["indptr"]
+        sources = np.repeat(np.arange(n), np.diff(indptr))
+        eprops = {name: _unpickle(arrays[f"eprop/{name}"]) if of_type in ("string", "object")
+                  else arrays[f"eprop/{name}"] for name, of_type in header["eprops"].items()}
+        graph.add_edge_array(np.column_stack((sources, arrays["indices"])), eprops=eprops)
+
+        for name in header["gprops"]:
+            graph.set_graph_property(name=name, value=_unpickle(arrays[f"gprop/{name}"]))
+
+        return graph
+
+    @classmethod
+    def _wrap_arrays(cls, header: dict, arrays: Dict[str, np.ndarray]) -> 'Graph':
+        """ Constructs a graph of NumPy backend, which uses the arrays returned by :meth:`_to_arrays` as storage. """
+        graph = cls(backend="numpy")
+        graph._graph = csr.Graph.from_csr(num_vertices=header["num_vertices"], indptr=arrays["indptr"],
+                                          indices=arrays["indices"], sources=arrays.get("sources"))
+
+        for kind, new_property in (("vprop", graph._graph.new_vertex_property),
+                                   ("eprop", graph._graph.new_edge_property)):
+            properties = graph._graph.vertex_properties if kind == "vprop" else graph._graph.edge_properties
+            for name, of_type in header[f"{kind}s"].items():
+                values = arrays[f"{kind}/{name}"]
+                if of_type in ("string", "object"):
+                    properties[name] = prop = new_property(value_type=of_type)
+                    for idx, value in enumerate(_unpickle(values)):
+                        prop[idx] = value
+                else:
+                    # Boolean values are stored as uint8. Columns of other dtypes, e.g. int32, are converted.
+                    dtype = csr._TYPES[of_type][0]
+                    same = values.dtype == dtype or (of_type == "bool" and values.dtype == bool)
+                    properties[name] = new_property(value_type=of_type,
+                                                    array=values.view(dtype) if same else values.astype(dtype))
+
+        for name, of_type in header["gprops"].items():
+            graph.add_graph_property(name=name, of_type=of_type)
+            graph.set_graph_property(name=name, value=_unpickle(arrays[f"gprop/{name}"]))
+
+        return graph
+
+
+def _pickle(value) -> np.ndarray:
+    """ Returns the pickled value as an array of bytes. """
+    return np.frombuffer(pickle.dumps(value), dtype=np.uint8)
+
+
+def _unpickle(array: np.ndarray):
+    """ Returns the value pickled by :func:`_pickle`. """
+    return pickle.loads(array.tobytes())
+
 
 class SubGraph(Graph):
     """
-        Represents a sub-graph of :class:`Graph` defined using properties ``vfilt`` and/or ``efilt``.
+    Represents a sub-graph of :class:`Graph` defined by boolean masks over its vertices and/or edges. A vertex
+    (resp. edge) is in sub-graph if its mask is True. An edge is in sub-graph only if both its end vertices are in
+    sub-graph. Vertex ids and edge indices are the same as in the graph.
 
-        :param graph: A graph object.
-        :type graph: :class:`Graph`
+    The masks are owned by sub-graph, i.e. no property is added to the graph. Changes to masks (see :attr:`vmask` and
+    :attr:`emask`) are reflected in sub-graph. A sub-graph of a sub-graph contains the vertices and edges that are
+    in both.
 
-        :param vfilt_name: Name of the boolean vertex property used to define whether a vertex is in sub-graph or not.
-        :type vfilt_name: str
+    :param graph: A graph object.
+    :type graph: :class:`Graph`
 
-        :param efilt_name: Name of the boolean edge property used to define whether an edge is in sub-graph or not.
-        :type efilt_name: str
-        """
+    :param vmask: (Optional) A boolean array indexed by vertex id. Default: All vertices are in sub-graph.
+    :type vmask: numpy.ndarray
+
+    :param emask: (Optional) A boolean array indexed by edge index. Default: All edges are in sub-graph.
+    :type emask: numpy.ndarray
+
+    :param vfilt_name: (Optional) Name of an existing boolean vertex property of graph, which is used as vertex mask.
+    :type vfilt_name: str
+
+    :param efilt_name: (Optional) Name of an existing boolean edge property of graph, which is used as edge mask.
+    :type efilt_name: str
+
+    :raises NameError: If ``vfilt_name`` or ``efilt_name`` is not a property of graph.
+
+    .. note:: For NumPy backend, the given masks are used without copying, and a sub-graph is created in constant
+        time. Its vertices are cached until the masks change, hence changes to masks must be made through
+        :attr:`vmask` and :attr:`emask`, rather than through the given arrays.
 
-    def __init__(self, graph: Graph, vfilt_name: str = None, efilt_name: str = None):
-        super(SubGraph, self).__init__()
+    .. warning:: For graph_tool backend, creating a sub-graph takes :math:`O(|V|)` (resp. :math:`O(|E|)`) time and
+        memory for every given mask. The masks are copied into property maps, which are not added to the graph,
+        because ``graph_tool.GraphView`` only accepts property maps as filters. A sub-graph of a sub-graph combines
+        the masks when it is created. Use ``vfilt_name``/``efilt_name`` to filter by an existing property without
+        copying it.
+    """
 
-        # Add vertex and/or edge filter that define the sub-graph. By default, they are treated bool.
-        assert vfilt_name is not None or efilt_name is not None, "At least one of vfilt/efilt must be given."
+    def __init__(self, graph: Graph, vmask: np.ndarray = None, emask: np.ndarray = None, vfilt_name: str = None,
+                 efilt_name: str = None):
+        super(SubGraph, self).__init__(backend=graph.backend)
+        self._parent = graph
         self._vfilt_name = vfilt_name
         self._efilt_name = efilt_name
-        gt_vfilt = gt_efilt = None
 
-        # Add (internalize) vertex and edge filters to graph
+        # Filters of internal graph: vertex/edge property maps (graph_tool) or arrays (numpy)
+        gt_graph = graph._graph
+        vfilt = self._filter(graph, vmask, vfilt_name, gt_graph.vertex_properties, gt_graph.new_vertex_property)
+        efilt = self._filter(graph, emask, efilt_name, gt_graph.edge_properties, gt_graph.new_edge_property)
+
+        if graph.backend == "numpy":
+            self._graph = csr.GraphView(g=graph._graph, vfilt=vfilt, efilt=efilt)
+        else:
+            self._graph = gt.GraphView(g=graph._graph, vfilt=vfilt, efilt=efilt)
+
+        # Masks are viewed as arrays, so that assignments to them update the filters.
+        self._vmask = vfilt if vfilt is None or isinstance(vfilt, np.ndarray) else self._column("vmask", vfilt)
+        self._emask = efilt if efilt is None or isinstance(efilt, np.ndarray) else self._column("emask", efilt)
+
+    @staticmethod
+    def _filter(graph: Graph, mask: np.ndarray, name: str, properties, new_property):
+        """ Returns the filter for given mask or property name. """
+        if name is not None:
+            if name not in properties:
+                raise NameError(f"{name} is not a property of graph.")
+
+            return properties[name]
+
+        if mask is None:
+            return None
+
+        if graph.backend == "numpy":
+            return np.asarray(mask, dtype=bool).view(csr.Mask)
+
+        prop = new_property(value_type="bool")
+        prop.a[:] = mask
+        return prop
+
+    @property
+    def vmask(self) -> np.ndarray:
+        """
+        Returns the vertex mask of sub-graph, or None if sub-graph has no vertex mask. Assignments to the mask update
+        the sub-graph.
+        """
+        return self._vmask
+
+    @property
+    def emask(self) -> np.ndarray:
+        """
+        Returns the edge mask of sub-graph, or None if sub-graph has no edge mask. Assignments to the mask update
+        the sub-graph.
+        """
+        return self._emask
+
+    def has_vertex(self, vid: int) -> bool:
+        return self._parent.has_vertex(vid) and (self._vmask is None or bool(self._vmask[vid]))
+
+    def _edge_ids(self, uid: int, vid: int) -> List[int]:
+        """ Returns the edge indices of edges from ``uid`` to ``vid`` in parent graph, which are not filtered out. """
+        if not (self.has_vertex(uid) and self.has_vertex(vid)):
+            return []
+
+        eids = self._parent._edge_ids(uid, vid)
+        return eids if self._emask is None else [eid for eid in eids if self._emask[eid]]
 
-        if vfilt_name is not None:
-            graph.add_vertex_property(name=vfilt_name, of_type="bool", default=False)
-            gt_vfilt = graph._graph.vertex_properties[vfilt_name]
+    # Sub-graph shares its edges with parent graph. Hence, the edge index of parent graph is maintained.
+    def _index_edge(self, uid: int, vid: int, eid: int):
+        self._parent._index_edge(uid, vid, eid)
 
-        if efilt_name is not None:
-            graph.add_edge_property(name=efilt_name, of_type="bool", default=True)
-            gt_efilt = graph._graph.edge_properties[efilt_name]
+    def _unindex_edge(self, uid: int, vid: int, eid: int):
+        self._parent._unindex_edge(uid, vid, eid)
 
-        # Update internal graph representation
-        self._graph = gt.GraphView(g=graph._graph, vfilt=gt_vfilt, efilt=gt_efilt)
+    def _invalidate_edge_index(self):
+        self._parent._invalidate_edge_index()
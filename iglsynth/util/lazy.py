@@ -0,0 +1,30 @@
+"""
+iglsynth: lazy.py
+
+License goes here...
+"""
+
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    Represents a module, which is imported on first access to any of its attributes. It is used for heavy
+    dependencies (such as graph_tool and spot), so that importing iglsynth does not import them.
+
+    :param name: Full name of module, e.g. ``"graph_tool.topology"``.
+    :type name: str
+
+    .. note:: If the module is not installed, ``ModuleNotFoundError`` is raised on first access, not on import.
+    """
+
+    def __init__(self, name: str):
+        super(LazyModule, self).__init__(name)
+
+    def __repr__(self):
+        return f"LazyModule({self.__name__})"
+
+    def __getattr__(self, item):
+        # After the first call, import_module only looks up sys.modules.
+        return getattr(importlib.import_module(self.__name__), item)
@@ -0,0 +1,106 @@
+"""
+iglsynth: storage.py
+
+License goes here...
+
+Binary file format used to save graphs and games. A file consists of,
+
+1. A magic string ``IGLSYNTH``.
+2. Length of header as a little-endian 64-bit unsigned integer.
+3. Header: A JSON encoded dictionary with metadata and the layout of arrays (dtype, shape and offset).
+4. Arrays: Raw contents of arrays in C order, every array aligned at 64 bytes.
+
+Since the arrays are stored raw, they can be memory-mapped, in which case they are read from disk only when accessed.
+"""
+
+import json
+import struct
+import numpy as np
+from typing import Dict, Tuple
+
+MAGIC = b"IGLSYNTH"
+FORMAT_VERSION = 1
+_ALIGN = 64
+
+
+def _aligned(nbytes: int) -> int:
+    return -(-nbytes // _ALIGN) * _ALIGN
+
+
+def write(filename: str, header: dict, arrays: Dict[str, np.ndarray] = None):
+    """
+    Writes the header and arrays to a file.
+
+    :param filename: Name of file.
+    :param header: A JSON serializable dictionary.
+    :param arrays: (Optional) A dictionary {name: array} of NumPy arrays.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in (arrays or dict()).items()}
+
+    layout = dict()
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset += _aligned(array.nbytes)
+
+    raw = json.dumps(dict(header, format=FORMAT_VERSION, arrays=layout)).encode()
+    start = _aligned(len(MAGIC) + 8 + len(raw))
+
+    with open(filename, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(raw)))
+        f.write(raw)
+        for name, array in arrays.items():
+            f.seek(start + layout[name]["offset"])
+            array.tofile(f)
+
+        f.truncate(start + offset)
+
+
+def read_header(filename: str) -> Tuple[dict, int]:
+    """
+    Reads the header of a file, without reading any array.
+
+    :param filename: Name of file.
+    :return: A 2-tuple of (header, offset of first array in file).
+
+    :raises ValueError: If the file is not in iglsynth format.
+    """
+    with open(filename, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"File {filename} is not an iglsynth file.")
+
+        size, = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(size).decode())
+
+    if header["format"] > FORMAT_VERSION:
+        raise ValueError(f"File {filename} has format version {header['format']}, which is newer than supported "
+                         f"version {FORMAT_VERSION}.")
+
+    return header, _aligned(len(MAGIC) + 8 + size)
+
+
+def read(filename: str, mmap: bool = True) -> Tuple[dict, Dict[str, np.ndarray]]:
+    """
+    Reads the header and arrays of a file.
+
+    :param filename: Name of file.
+    :param mmap: Should the arrays be memory-mapped instead of read into memory? The arrays are mapped copy-on-write,
+        i.e. assignments to them are kept in memory and are never written to file. Default: True.
+
+    :return: A 2-tuple of (header, dictionary {name: array}).
+    """
+    header, start = read_header(filename)
+
+    arrays = dict()
+    for name, info in header["arrays"].items():
+        dtype, shape = np.dtype(info["dtype"]), tuple(info["shape"])
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+        elif mmap:
+            arrays[name] = np.memmap(filename, dtype=dtype, mode="c", offset=start + info["offset"], shape=shape)
+        else:
+            arrays[name] = np.fromfile(filename, dtype=dtype, count=int(np.prod(shape)),
+                                       offset=start + info["offset"]).reshape(shape)
+
+    return header, arrays
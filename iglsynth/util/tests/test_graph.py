@@ -1,7 +1,19 @@
+import pickle
+import numpy as np
 import pytest
 from iglsynth.util.graph import *
 
 
+@pytest.fixture(autouse=True, params=Graph.BACKENDS)
+def backend(request, monkeypatch):
+    """ Runs every test with every backend of graph. """
+    if request.param == "graph_tool":
+        pytest.importorskip("graph_tool")
+
+    monkeypatch.setattr(Graph, "DEFAULT_BACKEND", request.param)
+    return request.param
+
+
 def test_graph_instantiation():
     # 1. Default constructor
     graph = Graph()
@@ -78,6 +90,32 @@ def test_add_edges():
     assert graph.num_edges == 3
 
 
+def test_add_edge_array():
+    graph = Graph(eprops=[("act", "int"), ("label", "string")])
+    graph.add_vertices(num=3)
+
+    # Edges are added in bulk with property columns.
+    eids = graph.add_edge_array(np.array([[0, 1], [1, 2], [2, 0]]), eprops={"act": [4, 5, 6]})
+    assert list(eids) == [0, 1, 2]
+    assert graph.num_edges == 3
+    assert [(e.source, e.target, graph.get_edge_property("act", e)) for e in graph.edges] == \
+        [(0, 1, 4), (1, 2, 5), (2, 0, 6)]
+
+    # Properties of python object types are also accepted.
+    eids = graph.add_edge_array([[2, 2]], eprops={"act": [7], "label": ["loop"]})
+    assert list(eids) == [3]
+    assert graph.num_edges == 4
+
+    # Invalid vertices or properties do not modify the graph.
+    with pytest.raises(AssertionError):
+        graph.add_edge_array(np.array([[0, 3]]))
+
+    with pytest.raises(NameError):
+        graph.add_edge_array(np.array([[0, 1]]), eprops={"prob": [0.5]})
+
+    assert graph.num_edges == 4
+
+
 def test_remove_vertex():
     graph = Graph()
     graph.add_vertex()
@@ -103,6 +141,30 @@ def test_remove_vertices():
     graph.remove_vertices([0, 1])
 
 
+def test_remove_vertices_mapping():
+    for fast in [False, True]:
+        graph = Graph(vprops=[("label", "int")])
+        graph.add_vertices(num=6)
+        graph.vprop("label")[:] = np.arange(6)
+        graph.add_edge_array(np.array([[0, 5], [5, 3], [3, 1], [2, 4]]))
+
+        mapping = graph.remove_vertices([4, 1, 1, 9], fast=fast)
+        assert graph.num_vertices == 4
+        assert mapping[1] == mapping[4] == -1
+        assert sorted(mapping[mapping >= 0].tolist()) == [0, 1, 2, 3]
+        if not fast:
+            assert mapping.tolist() == [0, -1, 1, 2, -1, 3]
+
+        # Properties and edges follow the renumbered vertices.
+        label = graph.vprop("label")
+        for old in [0, 2, 3, 5]:
+            assert label[mapping[old]] == old
+
+        assert sorted(map(tuple, graph.edges_array()[:, :2].tolist())) == \
+            sorted([(mapping[0], mapping[5]), (mapping[5], mapping[3])])
+        assert graph.has_edge(mapping[0], mapping[5])
+
+
 def test_add_v_e_g_property():
     # Construct with specified vertex, edge and graph properties. Internally, it calls add_<v/e/g/>_property.
     graph = Graph(vprops=[("turn", "bool")], eprops=(("act", "int"), ("prob", "float")), gprops=[("name", "string")])
@@ -161,6 +223,298 @@ def test_get_set_v_e_g_property():
     print(graph.get_graph_property(name="name"))
 
 
+def test_vprop_eprop():
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool"), ("name", "string")], eprops=[("act", "int")])
+    graph.add_vertices(num=4)
+    graph.add_edge_array(np.array([[0, 1], [1, 2], [2, 3]]))
+
+    # Assignments to columns update the properties.
+    turn = graph.vprop("turn")
+    turn[:] = 2
+    turn[[0, 2]] = 1
+    assert [graph.get_vertex_property("turn", vid=v) for v in range(4)] == [1, 2, 1, 2]
+    assert graph.get_vertex_property("turn") == {0: 1, 1: 2, 2: 1, 3: 2}
+
+    is_final = graph.vprop("is_final")
+    assert is_final.dtype == bool
+    is_final[turn == 1] = True
+    assert graph.get_vertex_property("is_final", vid=2) is True
+    assert graph.get_vertex_property("is_final", vid=3) is False
+
+    # Columns are views, not copies.
+    assert np.shares_memory(graph.vprop("turn"), turn)
+
+    act = graph.eprop("act")
+    act[:] = [7, 8, 9]
+    assert sorted(graph.get_edge_property("act").values()) == [7, 8, 9]
+    assert [graph.get_edge_property("act", e) for e in graph.edges] == [7, 8, 9]
+
+    # Dictionary of property is keyed by edge index, whatever the order of iteration over edges.
+    graph.add_edge_array(np.array([[3, 0], [0, 2]]), eprops={"act": [10, 11]})
+    graph.remove_edge(next(e for e in graph.edges if e.source == 1))
+    assert {(e.source, e.target): value for e, value in graph.get_edge_property("act").items()} == \
+           {(0, 1): 7, (2, 3): 9, (3, 0): 10, (0, 2): 11}
+
+    with pytest.raises(NameError):
+        graph.vprop("act")
+
+    with pytest.raises(TypeError):
+        graph.vprop("name")
+
+
+def test_has_find_edge():
+    graph = Graph(eprops=[("act", "int")])
+    graph.add_vertices(num=3)
+    assert graph.has_vertex(2) and not graph.has_vertex(3) and not graph.has_vertex(-1)
+
+    e01 = graph.add_edge(0, 1)
+    graph.add_edge_array(np.array([[1, 2], [1, 2]]))
+    assert graph.has_edge(0, 1) and graph.has_edge(1, 2)
+    assert not graph.has_edge(1, 0)
+    assert graph.find_edge(0, 1) == e01
+    assert graph.find_edge(2, 0) is None
+
+    # The index is maintained when edges are added and removed.
+    e20 = graph.add_edge(2, 0)
+    assert graph.has_edge(2, 0)
+    graph.remove_edge(graph.find_edge(1, 2))
+    assert graph.has_edge(1, 2)
+    graph.remove_edge(graph.find_edge(1, 2))
+    assert not graph.has_edge(1, 2)
+
+    # Removed edges are not valid anymore.
+    graph.remove_edge(e20)
+    assert graph.get_edge_property("act", e20) is None
+    with pytest.raises(NameError):
+        graph.set_edge_property("act", e20, 1)
+
+    # Removing a vertex shifts the ids of later vertices.
+    graph.add_edge(2, 1)
+    graph.remove_vertex(0)
+    assert graph.has_edge(1, 0) and not graph.has_edge(0, 1)
+    assert graph.num_edges == 1
+
+
+def test_subgraph_has_edge():
+    graph = Graph()
+    graph.add_vertices(num=3)
+    graph.add_edge_array(np.array([[0, 1], [1, 2]]))
+    graph.add_vertex_property(name="vfilt", of_type="bool", default=False)
+    subgraph = SubGraph(graph=graph, vfilt_name="vfilt")
+    graph.vprop("vfilt")[[0, 1]] = True
+
+    assert subgraph.has_vertex(1) and not subgraph.has_vertex(2)
+    assert subgraph.has_edge(0, 1) and not subgraph.has_edge(1, 2)
+    assert graph.has_edge(1, 2)
+
+    with pytest.raises(NameError):
+        SubGraph(graph=graph, vfilt_name="undefined")
+
+
+def test_subgraph_mask():
+    graph = Graph()
+    graph.add_vertices(num=4)
+    graph.add_edge_array(np.array([[0, 1], [1, 2], [2, 3], [3, 0]]))
+    vprops, eprops = set(graph.vertex_properties), set(graph.edge_properties)
+
+    # Masks are owned by sub-graph, and no property is added to graph.
+    vmask = np.array([True, True, True, False])
+    subgraph = SubGraph(graph=graph, vmask=vmask)
+    assert set(graph.vertex_properties) == vprops and set(graph.edge_properties) == eprops
+    assert subgraph.num_vertices == 3 and subgraph.num_edges == 2
+    assert subgraph.emask is None
+
+    # Changes to mask are reflected in sub-graph.
+    subgraph.vmask[2] = False
+    assert not subgraph.has_vertex(2) and subgraph.num_edges == 1
+    subgraph.vmask[2] = True
+
+    # In-place operations and writes through slices of mask are reflected as well.
+    mask = subgraph.vmask
+    mask &= np.array([False, True, True, True])
+    assert subgraph.num_vertices == 2 and list(subgraph.vertices) == [1, 2] and not subgraph.has_vertex(0)
+    np.logical_or(subgraph.vmask, [True, False, False, False], out=subgraph.vmask)
+    assert subgraph.num_vertices == 3 and subgraph.num_edges == 2
+    subgraph.vmask[:][:2] = False
+    assert subgraph.num_vertices == 1 and list(subgraph.vertices) == [2]
+    subgraph.vmask[:2] = True
+
+    # Sub-graph of a sub-graph contains the vertices and edges in both.
+    emask = np.ones(graph.num_edges, dtype=bool)
+    emask[graph.find_edge(0, 1).index] = False
+    nested = SubGraph(graph=subgraph, emask=emask)
+    assert nested.num_vertices == 3 and nested.num_edges == 1
+    assert nested.has_edge(1, 2) and not nested.has_edge(0, 1) and not nested.has_edge(3, 0)
+    assert set(graph.edge_properties) == eprops
+
+    # Many sub-graphs can be created from same mask.
+    views = [SubGraph(graph=graph, vmask=vmask) for _ in range(1000)]
+    assert all(view.num_vertices == 3 for view in views[:10])
+    assert set(graph.vertex_properties) == vprops
+
+
+def test_edit_adjacency():
+    rng = np.random.default_rng(0)
+    graph = Graph()
+    graph.add_vertices(num=50)
+    graph.add_edge_array(rng.integers(0, 50, size=(200, 2)))
+    edges = [(e.source, e.target) for e in graph.edges]
+    assert sorted(graph.out_neighbors(0)) == sorted(v for u, v in edges if u == 0)
+    assert sorted(graph.in_neighbors(0)) == sorted(u for u, v in edges if v == 0)
+    adjacency = list(graph._graph._adj) if graph.backend == "numpy" else None
+
+    # Every edit is reflected in adjacency of both end vertices.
+    for step in range(300):
+        if step % 3 == 0:
+            uid, vid = edges.pop(int(rng.integers(len(edges))))
+            graph.remove_edge(graph.find_edge(uid, vid))
+        else:
+            uid, vid = rng.integers(0, 50, size=2).tolist()
+            graph.add_edge(uid, vid)
+            edges.append((uid, vid))
+
+        assert sorted(graph.out_neighbors(uid)) == sorted(v for u, v in edges if u == uid)
+        assert sorted(graph.in_neighbors(vid)) == sorted(u for u, v in edges if v == vid)
+
+    # With NumPy backend, the adjacency is patched rather than rebuilt.
+    if adjacency is not None:
+        assert graph._graph._adj == adjacency
+
+    assert sorted(map(tuple, graph.edges_array()[:, :2].tolist())) == sorted(edges)
+
+    # Vertices of a sub-graph follow the changes to its mask.
+    subgraph = SubGraph(graph=graph, vmask=np.ones(50, dtype=bool))
+    nested = SubGraph(graph=subgraph, vmask=np.ones(50, dtype=bool))
+    assert subgraph.num_vertices == nested.num_vertices == 50
+    subgraph.vmask[:10] = False
+    nested.vmask[45:] = False
+    assert subgraph.num_vertices == 40 and nested.num_vertices == 35
+    subgraph.vmask[:10] = True
+    assert nested.num_vertices == 45
+
+
+def test_edges_array():
+    graph = Graph()
+    graph.add_vertices(num=3)
+    graph.add_edge_array(np.array([[0, 1], [1, 2], [2, 0], [0, 2]]))
+
+    edges = graph.edges_array()
+    assert edges.shape == (4, 3)
+    assert sorted(map(tuple, edges.tolist())) == [(0, 1, 0), (0, 2, 3), (1, 2, 1), (2, 0, 2)]
+    assert sorted(map(tuple, graph.out_edges_array(0).tolist())) == [(0, 1, 0), (0, 2, 3)]
+    assert sorted(map(tuple, graph.in_edges_array(2).tolist())) == [(0, 2, 3), (1, 2, 1)]
+    assert graph.in_edges_array(0).shape == (1, 3)
+
+    # Edge objects correspond to rows of edge array.
+    assert sorted((e.source, e.target, e.index) for e in graph.edges) == sorted(map(tuple, edges.tolist()))
+    assert not hasattr(next(graph.edges), "__dict__")
+
+
+def is_memmap(array):
+    """ Checks if the array is a view of a memory-mapped array. """
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+
+    return False
+
+
+def test_save_load(tmp_path, backend):
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool"), ("name", "string")],
+                  eprops=[("act", "int"), ("prob", "float")], gprops=[("title", "string")])
+    graph.add_vertices(num=4)
+    graph.add_edge_array(np.array([[2, 0], [0, 1], [3, 3], [0, 2]]), eprops={"act": [1, 2, 3, 4]})
+    graph.eprop("prob")[:] = [0.1, 0.2, 0.3, 0.4]
+    graph.vprop("turn")[:] = [1, 2, 1, 2]
+    graph.vprop("is_final")[[1, 3]] = True
+    graph.set_vertex_property("name", vid=2, value="v2")
+    graph.set_graph_property("title", "test")
+
+    filename = str(tmp_path / "graph.igl")
+    graph.save(filename)
+
+    for mmap in [True, False]:
+        loaded = Graph.load(filename, mmap=mmap)
+        assert loaded.num_vertices == 4 and loaded.num_edges == 4
+        assert loaded.typeof_vertex_property("is_final") == "bool"
+        assert loaded.typeof_edge_property("prob") == "float"
+        assert loaded.vprop("turn").tolist() == [1, 2, 1, 2]
+        assert loaded.vprop("is_final").tolist() == [False, True, False, True]
+        assert loaded.get_vertex_property("name", vid=2) == "v2"
+        assert loaded.get_graph_property("title") == "test"
+
+        # Edges keep their endpoints and properties.
+        edges = {(e.source, e.target): (loaded.get_edge_property("act", e), loaded.get_edge_property("prob", e))
+                 for e in loaded.edges}
+        assert edges == {(2, 0): (1, 0.1), (0, 1): (2, 0.2), (3, 3): (3, 0.3), (0, 2): (4, 0.4)}
+
+    # With NumPy backend, the adjacency and columns of loaded graph are memory-mapped, not copied.
+    loaded = Graph.load(filename)
+    if backend == "numpy":
+        columns = [loaded.vprop("turn"), loaded.vprop("is_final"), loaded.eprop("act"), loaded.eprop("prob"),
+                   loaded._graph._src, loaded._graph._tgt]
+        assert all(is_memmap(column) for column in columns)
+        assert sorted(loaded.out_neighbors(0)) == [1, 2] and list(loaded.in_neighbors(0)) == [2]
+
+    # Changes to loaded graph are not written to file.
+    loaded.vprop("turn")[:] = 0
+    loaded.add_edge(1, 3)
+    assert loaded.num_edges == 5 and loaded.has_edge(1, 3) and loaded.vprop("turn").tolist() == [0, 0, 0, 0]
+    assert Graph.load(filename).vprop("turn").tolist() == [1, 2, 1, 2]
+    assert Graph.load(filename).num_edges == 4
+
+    with open(filename, "wb") as f:
+        f.write(b"not a graph")
+
+    with pytest.raises(ValueError):
+        Graph.load(filename)
+
+
+def test_freeze():
+    graph = Graph(vprops=[("turn", "int"), ("is_final", "bool"), ("name", "string")], eprops=[("act", "int")],
+                  gprops=[("title", "string")])
+    graph.add_vertices(num=4)
+    graph.add_edge_array(np.array([[0, 1], [0, 2], [1, 2], [2, 0], [3, 2]]), eprops={"act": [1, 2, 3, 4, 5]})
+    graph.vprop("turn")[:] = [1, 2, 1, 2]
+    graph.vprop("is_final")[2] = True
+    graph.set_vertex_property("name", 3, "v3")
+    graph.set_graph_property("title", "test")
+
+    frozen = graph.freeze()
+    assert frozen.num_vertices == 4 and frozen.num_edges == 5
+    assert sorted(frozen.out_neighbors(0).tolist()) == [1, 2] and sorted(frozen.in_neighbors(2).tolist()) == [0, 1, 3]
+    assert frozen.out_degree.tolist() == [2, 1, 1, 1] and frozen.in_degree.tolist() == [1, 1, 3, 0]
+    assert frozen.has_edge(3, 2) and not frozen.has_edge(2, 3)
+    assert sorted(map(tuple, frozen.edges_array().tolist())) == sorted(map(tuple, graph.edges_array().tolist()))
+    assert frozen.has_vertex_property("is_final", of_type="bool") and frozen.has_edge_property("act", of_type="int")
+    assert frozen.get_vertex_property("turn", vid=1) == 2 and frozen.get_vertex_property("name", vid=3) == "v3"
+    assert frozen.get_graph_property("title") == "test"
+    assert frozen.freeze() is frozen
+
+    # Snapshot is read-only.
+    with pytest.raises(ValueError):
+        frozen.vprop("turn")[0] = 2
+    with pytest.raises(ValueError):
+        frozen.fwd_indices[0] = 3
+    with pytest.raises(TypeError):
+        frozen.vprop("name")
+
+    # Snapshot is not affected by changes to graph.
+    eid = graph.find_edge(2, 0).index
+    graph.vprop("turn")[0] = 2
+    graph.add_edge(3, 0)
+    graph.remove_vertex(1)
+    assert frozen.vprop("turn").tolist() == [1, 2, 1, 2]
+    assert frozen.eprop("act")[eid] == 4
+    assert frozen.num_vertices == 4 and frozen.in_neighbors(0).tolist() == [2]
+
+    # Snapshot can be sent to other processes.
+    loaded = pickle.loads(pickle.dumps(frozen))
+    assert loaded.fwd_indices.tolist() == frozen.fwd_indices.tolist()
+    assert not loaded.vprop("turn").flags.writeable
+
+
 if __name__ == '__main__':
     # test_graph_instantiation()
     # test_graph_properties()
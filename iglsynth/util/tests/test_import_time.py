@@ -0,0 +1,34 @@
+import pytest
+import subprocess
+import sys
+
+# Generous bound on time to import iglsynth, which must not import graph_tool or spot.
+MAX_IMPORT_TIME = 2.0
+
+SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+import iglsynth.game, iglsynth.logic, iglsynth.solver, iglsynth.util
+elapsed = time.perf_counter() - start
+print(elapsed, "graph_tool" in sys.modules, "spot" in sys.modules)
+"""
+
+
+def test_import_time():
+    output = subprocess.check_output([sys.executable, "-c", SCRIPT]).decode().split()
+    elapsed, has_graph_tool, has_spot = float(output[0]), output[1] == "True", output[2] == "True"
+
+    assert not has_graph_tool
+    assert not has_spot
+    assert elapsed < MAX_IMPORT_TIME, f"Importing iglsynth took {elapsed:.2f}s."
+
+
+def test_lazy_module():
+    from iglsynth.util.lazy import LazyModule
+    json = LazyModule("json")
+    assert json.loads("[1]") == [1]
+
+    missing = LazyModule("iglsynth_missing_module")
+    with pytest.raises(ModuleNotFoundError):
+        missing.anything
@@ -9,7 +9,7 @@ setup(
     author='Abhishek N. Kulkarni',
     author_email='ankulkarni@wpi.edu',
     url='https://github.com/abhibp1993/iglsynth',
-    install_requires=['pytest'],
+    install_requires=['pytest', 'numpy'],
     classifiers=[
         "Intended Audience :: Developers",
         "Intended Audience :: Science/Research",